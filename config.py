@@ -19,3 +19,65 @@ POIZON_REFERER = os.getenv(
 
 # Musinsa 설정
 MUSINSA_USER_AGENT = "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36"
+
+# Poizon HTTP 커넥션 풀 / 타임아웃 (connect, read 분리)
+POIZON_POOL_SIZE = int(os.getenv("POIZON_POOL_SIZE", "4"))
+POIZON_CONNECT_TIMEOUT = float(os.getenv("POIZON_CONNECT_TIMEOUT", "10"))
+POIZON_READ_TIMEOUT = float(os.getenv("POIZON_READ_TIMEOUT", "60"))
+
+# 호스트별 요청 속도(req/s): 시작값 / 백오프 하한 / 가속 상한
+RATE_POIZON_RPS = float(os.getenv("RATE_POIZON_RPS", "0.5"))
+RATE_POIZON_MIN_RPS = float(os.getenv("RATE_POIZON_MIN_RPS", "0.1"))
+RATE_POIZON_MAX_RPS = float(os.getenv("RATE_POIZON_MAX_RPS", "2"))
+RATE_MUSINSA_RPS = float(os.getenv("RATE_MUSINSA_RPS", "1"))
+RATE_MUSINSA_MIN_RPS = float(os.getenv("RATE_MUSINSA_MIN_RPS", "0.2"))
+RATE_MUSINSA_MAX_RPS = float(os.getenv("RATE_MUSINSA_MAX_RPS", "4"))
+
+# 무신사 상품 상세(HTML/옵션/재고) 동시 조회 수. 호스트별 요청 속도는 RateGovernor가 계속 제한
+MUSINSA_DETAIL_WORKERS = int(os.getenv("MUSINSA_DETAIL_WORKERS", "4"))
+# ranking 모드에서 조회할 무신사 카테고리 코드 (000: 전체, 001: 상의, 002: 아우터, 003: 바지, 103: 신발)
+# 섹션(NEW/RISING/ALL) × 카테고리 조합을 동시에 조회하고 상품 ID로 중복 제거
+MUSINSA_RANKING_CATEGORIES = [
+    c.strip() for c in os.getenv("MUSINSA_RANKING_CATEGORIES", "000,001,002,003,103").split(",") if c.strip()
+]
+# ranking 모드: 상품명에서 추출한 모델 번호(utils.model_numbers) 신뢰도가 이 값 이상이면 상세 조회 생략 (1.1이면 항상 조회)
+MODEL_NO_MIN_CONFIDENCE = float(os.getenv("MODEL_NO_MIN_CONFIDENCE", "0.85"))
+# 무신사 상품 기본 정보(제목/스타일 번호/이미지/가격) 조회 경로: "html"(상품 페이지) 또는 "api"(goods-detail JSON, 실패 시 HTML)
+# api 응답 형식은 실제 응답으로 확인되지 않았으므로 기본은 html
+MUSINSA_BASE_INFO_SOURCE = os.getenv("MUSINSA_BASE_INFO_SOURCE", "html")
+# brand_search 모드에서 비교를 기다리며 미리 조회해 둘 무신사 상품 수 (생산/소비 단계 사이 버퍼)
+BRAND_STREAM_BUFFER = int(os.getenv("BRAND_STREAM_BUFFER", "16"))
+
+# Poizon 상품 상세 3단계(analytics/sale-now/bidding)를 동시에 조회할지 여부
+POIZON_CONCURRENT_STAGES = os.getenv("POIZON_CONCURRENT_STAGES", "1").strip().lower() in {"1", "true", "yes", "y"}
+# sale-now를 먼저 조회해 모든 가격이 무신사 최저가 이하이면 analytics 생략 (해당 상품은 판매 지표 없음)
+POIZON_EARLY_EXIT = os.getenv("POIZON_EARLY_EXIT", "0").strip().lower() in {"1", "true", "yes", "y"}
+
+# batchQueryNewBidding 1회 호출당 globalSpuId 개수
+POIZON_BIDDING_BATCH_SIZE = int(os.getenv("POIZON_BIDDING_BATCH_SIZE", "20"))
+
+# 로컬 캐시(SQLite) 위치 및 Poizon 모델 번호 → SPU/SKU 매핑 캐시 유효 시간
+CACHE_DIR = Path(os.getenv("CACHE_DIR", str(Path(__file__).parent / "data" / "cache")))
+POIZON_SPU_CACHE_TTL_HOURS = float(os.getenv("POIZON_SPU_CACHE_TTL_HOURS", str(24 * 7)))
+# 검색 결과 "매칭 없음"(무신사/Poizon) 캐시 유효 시간. 신규 등록을 놓치지 않도록 매핑 캐시보다 짧게
+NOT_FOUND_CACHE_TTL_HOURS = float(os.getenv("NOT_FOUND_CACHE_TTL_HOURS", "24"))
+# 무신사 옵션 구조(옵션 그룹·조합·추가금) 캐시 유효 시간. 재고는 매번 조회
+MUSINSA_OPTION_CACHE_TTL_HOURS = float(os.getenv("MUSINSA_OPTION_CACHE_TTL_HOURS", str(24 * 7)))
+# 캐시된 옵션 중 재고 응답에 없는 variant(판매 종료 가능성)가 있을 때 옵션 구조를 다시 확인하는 주기.
+# 재고 API가 일부 variant를 원래 빼고 주는 상품도 있어 매번 다시 받지 않고 이 주기로만 확인
+MUSINSA_OPTION_UNLISTED_TTL_HOURS = float(os.getenv("MUSINSA_OPTION_UNLISTED_TTL_HOURS", "6"))
+# Poizon 엔드포인트별 응답 재사용 시간(분). 0이면 매번 새로 조회
+# sale-now(현재 가격)는 기본 항상 새로, analytics(거래 내역 → 판매 속도)는 느리게 변하므로 길게.
+# bidding/SKU 정보는 SPU 매핑 캐시(POIZON_SPU_CACHE_TTL_HOURS)를 따름
+POIZON_SALE_NOW_TTL_MINUTES = float(os.getenv("POIZON_SALE_NOW_TTL_MINUTES", "0"))
+POIZON_ANALYTICS_TTL_MINUTES = float(os.getenv("POIZON_ANALYTICS_TTL_MINUTES", str(12 * 60)))
+# Poizon 판매 원장(SPU별 누적 거래 내역)으로 판매 속도·기간별 판매 수를 계산할 기간(일)
+POIZON_LEDGER_WINDOW_DAYS = float(os.getenv("POIZON_LEDGER_WINDOW_DAYS", "30"))
+
+# Poizon 카탈로그(브랜드별 검색 크롤링 결과) 페이지 크기, 그리고 카탈로그에 없는 모델을 검색 없이 미등록 처리할지 여부
+POIZON_CATALOG_PAGE_SIZE = int(os.getenv("POIZON_CATALOG_PAGE_SIZE", "50"))
+POIZON_CATALOG_AUTHORITATIVE = os.getenv("POIZON_CATALOG_AUTHORITATIVE", "0").strip().lower() in {"1", "true", "yes", "y"}
+
+# Poizon 서킷 브레이커: 연속 연결 실패 임계값, 열린 뒤 probe까지 대기(초). 인증 실패(401 passport)는 즉시 열림
+POIZON_BREAKER_FAILURE_THRESHOLD = int(os.getenv("POIZON_BREAKER_FAILURE_THRESHOLD", "5"))
+POIZON_BREAKER_COOLDOWN = float(os.getenv("POIZON_BREAKER_COOLDOWN", "300"))
@@ -1,5 +1,4 @@
 import csv
-import time
 import os
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
@@ -7,8 +6,14 @@ from datetime import datetime, timedelta, timezone
 import config
 from sellers.musinsa import MusinsaSeller, MusinsaRankingType
 from sellers.poizon import PoizonSeller
+from sellers.poizon_catalog import PoizonCatalog
+from sellers.poizon_credentials import load_credentials_from_env
+from utils.cache import SqliteCache
 from utils.comparator import ProductComparator
 from utils.constants import BrandEnum, TARGET_BRANDS as DEFAULT_TARGET_BRANDS
+from utils.rate_limiter import get_governor
+from utils.sales_ledger import SalesLedger
+from utils.streaming import prefetch
 
 
 def get_kst_now():
@@ -43,7 +48,7 @@ def cleanup_old_files(directory: Path, keep_count: int = 25):
 
 def run_ranking_collection(musinsa_seller, comparator, output_dir, kst_now):
     """랭킹 데이터 수집 및 비교"""
-    print(f"Fetching rankings for {DEFAULT_TARGET_BRANDS}...")
+    print(f"Fetching rankings for {DEFAULT_TARGET_BRANDS} (categories={config.MUSINSA_RANKING_CATEGORIES})...")
     
     ranking_types = [
         MusinsaRankingType.NEW,
@@ -51,28 +56,20 @@ def run_ranking_collection(musinsa_seller, comparator, output_dir, kst_now):
         MusinsaRankingType.ALL
     ]
     
-    unique_products = {}
-    
-    for r_type in ranking_types:
-        print(f"  - Fetching {r_type.name} ranking...")
-        rankings = musinsa_seller.fetch_ranking(r_type, brand_names=DEFAULT_TARGET_BRANDS)
-        if rankings:
-            for item in rankings:
-                if item.product_id not in unique_products:
-                    unique_products[item.product_id] = item
-        time.sleep(1)
-
-    if not unique_products:
-        print("No items found.")
-        return
-
-    print(f"Found {len(unique_products)} unique items. Starting comparison...")
-    
     # 결과 저장 경로
     timestamp = kst_now.strftime("%Y-%m-%d_%H-%M-%S")
     output_file = output_dir / f"{timestamp}.csv"
-    
-    process_and_save(list(unique_products.values()), musinsa_seller, comparator, output_file, kst_now)
+
+    # 랭킹 조회는 별도 셀러에서 동시에 진행하고, 중복 제거된 상품을 받는 대로 비교 (요청 페이싱·캐시는 공유)
+    crawler = MusinsaSeller(governor=musinsa_seller.governor, cache=musinsa_seller.cache)
+    try:
+        rankings = prefetch(
+            crawler.iter_rankings(ranking_types, brand_names=DEFAULT_TARGET_BRANDS),
+            config.BRAND_STREAM_BUFFER,
+        )
+        process_and_save(rankings, musinsa_seller, comparator, output_file, kst_now)
+    finally:
+        close_crawler(crawler, musinsa_seller)
     cleanup_old_files(output_dir, keep_count=25)
 
 
@@ -97,6 +94,30 @@ def run_brand_search_collection(musinsa_seller, comparator, output_dir, kst_now)
     else:
         target_pages = [int(p) for p in pages_str.split(",") if p.strip().isdigit()]
 
+    # 목록 수집용 셀러는 따로 둠: 백그라운드 조회의 오류가 비교 중인 상품의 last_api_error로 섞이지 않도록
+    # (요청 페이싱·캐시는 공유)
+    crawler = MusinsaSeller(governor=musinsa_seller.governor, cache=musinsa_seller.cache)
+    try:
+        _run_brand_search(
+            crawler, musinsa_seller, comparator, output_dir, kst_now, target_brands, target_pages, fail_fast
+        )
+    finally:
+        close_crawler(crawler, musinsa_seller)
+
+
+def close_crawler(crawler, musinsa_seller):
+    """목록 수집용 셀러를 닫고 페이지·캐시 통계를 비교용 셀러에 합칩니다 (실행 통계에 함께 출력)."""
+    crawler.close()
+    for key, value in crawler.page_stats.items():
+        musinsa_seller.page_stats[key] += value
+    for key, value in crawler.cache_stats.items():
+        musinsa_seller.cache_stats[key] += value
+
+
+def _run_brand_search(
+    crawler, musinsa_seller, comparator, output_dir, kst_now, target_brands, target_pages, fail_fast
+):
+    """브랜드별로 crawler가 조회하는 상품을 스트리밍으로 받아 비교·저장합니다."""
     print(f"Starting brand search for {target_brands} on pages {target_pages}...")
     print(f"[Config] fail_fast_on_api_error={fail_fast}")
     total_brands = len(target_brands)
@@ -114,38 +135,18 @@ def run_brand_search_collection(musinsa_seller, comparator, output_dir, kst_now)
             print(f"  [Warning] Unknown brand: {brand_name}. Skipping.")
             continue
             
-        all_products = []
-        for page_idx, page in enumerate(target_pages, start=1):
-            print(
-                f"  [Page {page_idx}/{total_pages}] Searching {brand_name} (page={page})..."
-            )
-            products = musinsa_seller.search_by_brand(brand_enum, page=page)
-            all_products.extend(products)
-            print(
-                f"    -> page result: {len(products)} items "
-                f"(accumulated: {len(all_products)})"
-            )
-            time.sleep(1)
-            
-        if not all_products:
-            print(f"  -> No products found for {brand_name}.")
-            continue
-            
-        print(
-            f"  -> Found {len(all_products)} products for {brand_name}. "
-            f"Starting comparison..."
-        )
-        
         # 브랜드별로 파일 저장
         timestamp = kst_now.strftime("%Y-%m-%d_%H-%M-%S")
         output_file = output_dir / f"{timestamp}_{brand_enum.name}.csv"
-        
-        # ProductInfo 리스트를 바로 처리 (랭킹 아이템과 구조가 다름에 주의)
-        # process_and_save는 RankingItem 리스트를 받도록 되어 있으므로, 
-        # ProductInfo 리스트를 처리하는 별도 로직이나 어댑터 필요.
-        # 여기서는 process_and_save를 수정하여 두 타입을 모두 지원하도록 함.
+
+        # 무신사 상세 조회(생산)와 Poizon 비교(소비)를 겹쳐 실행: 페이지를 모두 모으지 않고
+        # 조회되는 대로 최대 BRAND_STREAM_BUFFER개까지 미리 받아 두며 비교
+        products = prefetch(
+            crawler.iter_brand_products(brand_enum, target_pages),
+            buffer_size=config.BRAND_STREAM_BUFFER,
+        )
         process_and_save(
-            all_products,
+            products,
             musinsa_seller,
             comparator,
             output_file,
@@ -165,10 +166,12 @@ def process_and_save(
     fail_fast=False,
     brand_name=None,
 ):
-    """상품 리스트를 비교하고 CSV로 저장"""
+    """상품 리스트(또는 스트리밍 이터레이터)를 비교하고 CSV로 저장"""
     results = []
     api_error_count = 0
-    total_items = len(items)
+    skipped_details = 0  # 상품명 모델 번호로 상세 조회를 생략한 수
+    # 이터레이터로 들어오면 전체 개수를 미리 알 수 없음
+    total_items = len(items) if hasattr(items, "__len__") else "?"
     brand_label = brand_name or "UNKNOWN_BRAND"
     
     for i, item in enumerate(items):
@@ -177,7 +180,11 @@ def process_and_save(
             brand_name = item.brand_name
             product_name = item.product_name
             product_id = item.product_id
-            model_no = None # 상세 조회 필요
+            # 상품명에서 추출한 모델 번호의 신뢰도가 충분하면 상세 조회 생략, 아니면 상세 조회 필요
+            model_no = item.model_no if item.model_no_confidence >= config.MODEL_NO_MIN_CONFIDENCE else None
+            if model_no:
+                skipped_details += 1
+            product_info = None
         else: # ProductInfo
             brand_name = item.platform # 또는 별도 브랜드 필드 (현재 ProductInfo엔 브랜드 필드가 명확치 않음)
             # ProductInfo에는 brand_name 필드가 없으므로, title이나 다른 곳에서 유추하거나
@@ -188,8 +195,8 @@ def process_and_save(
             product_id = "" # ProductInfo에는 ID가 없을 수도 있음 (검색 결과인 경우)
             model_no = item.model_no
             
-            # ProductInfo인 경우 이미 상세 정보가 있으므로 get_product_info 호출 불필요할 수 있음
-            # 하지만 model_no가 확실하다면 바로 비교
+            # ProductInfo인 경우 이미 상세 정보(옵션·재고)가 있으므로 그대로 비교에 사용
+            product_info = item
         
         print(
             f"[{brand_label}] item {i+1}/{total_items} "
@@ -209,8 +216,14 @@ def process_and_save(
                      # 상세 정보에서 브랜드를 가져올 수 있다면 좋음 (현재는 없음)
                      pass
 
-            # 비교 수행
-            comparison_result = comparator.compare_product(model_no, fail_on_api_error=fail_fast)
+            # 비교 수행 (이미 조회한 무신사 상품이 있으면 다시 검색하지 않음)
+            # 상세 조회를 생략한 랭킹 항목은 검색 결과 중 해당 상품만 비교 (다른 컬러웨이 제외)
+            comparison_result = comparator.compare_product(
+                model_no,
+                fail_on_api_error=fail_fast,
+                musinsa_infos=[product_info] if product_info else None,
+                musinsa_product_id=product_id or None,
+            )
             if not comparison_result:
                 print("  -> Skip: Comparison failed")
                 continue
@@ -244,8 +257,6 @@ def process_and_save(
                     "Updated At": kst_now.strftime("%Y-%m-%d %H:%M:%S")
                 })
             
-            time.sleep(1.5)
-            
         except Exception as e:
             api_error_count += 1
             print(f"\n[API_ERROR] {product_name} ({model_no}) 처리 중 오류: {e}")
@@ -270,25 +281,96 @@ def process_and_save(
     else:
         print("No results to save.")
 
+    if skipped_details:
+        print(f"[Info] 상품명 모델 번호로 상세 조회 {skipped_details}건 생략")
     if api_error_count > 0:
         print(f"[API_ERROR] API 관련 오류 {api_error_count}건 감지됨")
 
 
+def print_run_stats(governor, musinsa_seller, poizon_seller, memo=None):
+    """실행 종료 시 커넥션 재사용 / 호스트별 요청 속도 / 캐시 적중 통계를 출력합니다."""
+    stats = poizon_seller.connection_stats()
+    print(
+        f"\n[Stats] Poizon connections: requests={stats['requests']} "
+        f"new={stats['new_connections']} reused={stats['reused_connections']}"
+    )
+    for host, host_stats in governor.stats().items():
+        print(
+            f"[Stats] Rate {host}: requests={host_stats['requests']} "
+            f"rate={host_stats['rate']}/s throttled={host_stats['throttled']} "
+            f"slowdowns={host_stats['slowdowns']} waited={host_stats['total_wait']}s"
+        )
+    print(
+        f"[Stats] Cache: poizon_spu_hits={poizon_seller.cache_stats['spu_hits']} "
+        f"poizon_not_found_hits={poizon_seller.cache_stats['not_found_hits']} "
+        f"poizon_response_hits={poizon_seller.cache_stats['response_hits']} "
+        f"poizon_catalog_hits={poizon_seller.cache_stats['catalog_hits']} "
+        f"poizon_catalog_rejects={poizon_seller.cache_stats['catalog_rejects']} "
+        f"musinsa_not_found_hits={musinsa_seller.cache_stats['not_found_hits']} "
+        f"musinsa_option_hits={musinsa_seller.cache_stats['option_hits']} "
+        f"musinsa_option_refreshes={musinsa_seller.cache_stats['option_refreshes']} "
+        f"musinsa_base_info_hits={musinsa_seller.cache_stats['base_info_hits']}"
+    )
+    page_stats = musinsa_seller.page_stats
+    print(
+        f"[Stats] Musinsa product pages: pages={page_stats['pages']} "
+        f"bytes_read={page_stats['bytes_read']} full_parses={page_stats['full_parses']} "
+        f"json_infos={page_stats['json_infos']} json_bytes={page_stats['json_bytes']} "
+        f"json_fallbacks={page_stats['json_fallbacks']}"
+    )
+    print(
+        f"[Stats] Poizon plan: early_exits={poizon_seller.plan_stats['early_exits']} "
+        f"skipped_calls={poizon_seller.plan_stats['skipped_calls']}"
+    )
+    if memo is not None:
+        for namespace, counts in memo.stats.items():
+            print(
+                f"[Stats] Run memo {namespace}: misses={counts['misses']} "
+                f"hits={counts['hits']} coalesced={counts['coalesced']} saved={memo.saved_calls(namespace)}"
+            )
+    breaker = poizon_seller.breaker
+    print(
+        f"[Stats] Poizon circuit: state={breaker.state} trips={breaker.trips} "
+        f"rejected={breaker.rejected}"
+    )
+    for account, account_stats in poizon_seller.credentials.stats().items():
+        print(
+            f"[Stats] Poizon account {account}: state={account_stats['state']} "
+            f"requests={account_stats['requests']} rate={account_stats['rate']}/s"
+        )
+
+
 def main():
     kst_now = get_kst_now()
     print(f"[{kst_now}] Starting data collection (KST)...")
 
-    # 초기화
-    musinsa_seller = MusinsaSeller()
+    # 초기화 (두 셀러가 호스트별 요청 페이싱을 공유)
+    governor = get_governor()
+    # 실행 간 재사용하는 로컬 캐시 (data/cache/)
+    musinsa_cache = SqliteCache(config.CACHE_DIR / "musinsa.sqlite3")
+    poizon_cache = SqliteCache(config.CACHE_DIR / "poizon.sqlite3")
+    poizon_catalog = PoizonCatalog(
+        config.CACHE_DIR / "poizon_catalog.sqlite3", authoritative=config.POIZON_CATALOG_AUTHORITATIVE
+    )
+    sales_ledger = SalesLedger(
+        config.CACHE_DIR / "poizon_ledger.sqlite3", window_days=config.POIZON_LEDGER_WINDOW_DAYS
+    )
+    musinsa_seller = MusinsaSeller(governor=governor, cache=musinsa_cache)
     
-    dutoken = config.POIZON_DUTOKEN
-    cookie = config.POIZON_COOKIE
+    # POIZON_DUTOKEN/COOKIE(/SHUMEIID) + 추가 계정 POIZON_*_2, _3 …
+    credentials = load_credentials_from_env()
     
-    if not dutoken or not cookie:
+    if not credentials:
         print("[Error] Poizon credentials not found. Please check .env or config.py")
         return
 
-    poizon_seller = PoizonSeller(dutoken=dutoken, cookie=cookie)
+    poizon_seller = PoizonSeller(
+        credentials=credentials,
+        governor=governor,
+        spu_cache=poizon_cache,
+        sales_ledger=sales_ledger,
+        catalog=poizon_catalog,
+    )
     comparator = ProductComparator(musinsa_seller, poizon_seller)
 
     # 실행 모드 확인 (환경 변수)
@@ -303,5 +385,13 @@ def main():
         output_dir.mkdir(parents=True, exist_ok=True)
         run_ranking_collection(musinsa_seller, comparator, output_dir, kst_now)
 
+    print_run_stats(governor, musinsa_seller, poizon_seller, comparator.memo)
+    poizon_seller.close()
+    musinsa_seller.close()
+    poizon_cache.close()
+    sales_ledger.close()
+    poizon_catalog.close()
+    musinsa_cache.close()
+
 if __name__ == "__main__":
     main()
@@ -7,6 +7,11 @@ class SalesMetrics(BaseModel):
     rank: str
     recent_sales_count: int
     last_sold_time: str | None = None
+    # 판매 원장 기준 기간별 판매 수 / 추세 (원장이 없으면 None)
+    sales_24h: int | None = None
+    sales_7d: int | None = None
+    sales_30d: int | None = None
+    trend: float | None = None
 
 
 class ProductOption(BaseModel):
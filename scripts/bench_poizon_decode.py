@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Poizon 응답 디코딩 벤치마크: json.loads(dict 전체 보관) vs 응답 모델 model_validate_json.
+기본은 네트워크 없이 합성한 큰 응답으로 비교합니다 (저장소에는 실제 응답 녹화본이 없음).
+실제 수치는 저장해 둔 응답 본문(JSON 파일)을 인자로 주어 확인하세요.
+  uv run python scripts/bench_poizon_decode.py [sale_now.json] [bidding.json]
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from sellers.poizon import PoizonSeller  # noqa: E402
+from sellers.poizon_responses import BiddingResponse, SaleNowResponse  # noqa: E402
+
+ROUNDS = 20
+
+
+def _noise(i: int) -> dict:
+    # 실제 응답에 섞여 오는, 쓰지 않는 부가 필드 흉내
+    return {
+        f"extra{k}": {"desc": f"field {k} of {i}", "tags": [f"t{j}" for j in range(8)], "flag": k % 2 == 0}
+        for k in range(12)
+    }
+
+
+def synth_sale_now(n_skus: int) -> bytes:
+    sku_infos = []
+    for i in range(n_skus):
+        sku_infos.append({
+            "productName": "Synthetic Shoe",
+            "productType": "SKU",
+            "skuId": 1000 + i,
+            "propertyDesc": f"블랙*#*{220 + i % 20 * 5}",
+            "salesVolumeGroups": [
+                {
+                    "buttonCode": b,
+                    "salesVolumeInfos": [
+                        {"areaId": "SALE_LOCAL_POIZON_LEAK", "price": {"money": {"amount": 100000 + i}}, **_noise(i)},
+                        {"areaId": "CN_LEAK", "price": {"money": {"amount": 90000 + i}}},
+                    ],
+                }
+                for b in range(3)
+            ],
+            **_noise(i),
+        })
+    return json.dumps({"code": 200, "data": {"articleNumber": "SYN001", "logoUrl": "logo", "skuInfos": sku_infos}}).encode()
+
+
+def synth_bidding(n_skus: int) -> bytes:
+    skus = []
+    for i in range(n_skus):
+        skus.append({
+            "skuId": 1000 + i,
+            "spuId": 9,
+            "globalSkuId": 2000 + i,
+            "dwSkuId": 3000 + i,
+            "spuPropNew": f"블랙 {220 + i % 20 * 5}",
+            "skuPropAllSpecification": [
+                {"sizeKey": "KR", "skuProp": str(220 + i % 20 * 5)},
+                {"sizeKey": "EU", "skuProp": "40"},
+            ],
+            "regionSalePvInfoList": [{"name": "색상", "value": "블랙"}],
+            **_noise(i),
+        })
+    return json.dumps({"code": 200, "data": [{"globalSpuId": 111, "skuInventoryInfoList": skus}]}).encode()
+
+
+def measure(label: str, fn) -> None:
+    fn()  # warm-up
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        fn()
+    cpu_ms = (time.process_time() - start) / ROUNDS * 1000
+
+    tracemalloc.start()
+    kept = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    print(f"  {label:<34} cpu {cpu_ms:8.2f} ms   peak {peak / 1024:9.0f} KiB")
+
+
+def bench(name: str, body: bytes, decoder, extract) -> None:
+    print(f"{name}: {len(body) / 1024:.0f} KiB")
+    # 기존 경로: 응답 전체를 dict 트리로 만들어 보관
+    measure("json.loads (dict 보관)", lambda: json.loads(body))
+    measure("json.loads + extract(dict)", lambda: extract(json.loads(body)))
+    # 새 경로: 필요한 필드만 모델로 검증
+    measure("model_validate_json (모델 보관)", lambda: decoder.model_validate_json(body))
+    measure("model_validate_json + extract", lambda: extract(decoder.model_validate_json(body)))
+
+
+def main() -> int:
+    seller = PoizonSeller(dutoken="bench", cookie="sk=bench")
+    sale_now = Path(sys.argv[1]).read_bytes() if len(sys.argv) > 1 else synth_sale_now(400)
+    bidding = Path(sys.argv[2]).read_bytes() if len(sys.argv) > 2 else synth_bidding(400)
+    bench("querySaleNowInfo", sale_now, SaleNowResponse, seller.extract_price_info)
+    bench("batchQueryNewBidding", bidding, BiddingResponse, seller.extract_sku_size_info)
+    seller.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
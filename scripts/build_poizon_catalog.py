@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+브랜드 키워드로 Poizon merchant/search를 끝까지 훑어 로컬 카탈로그(data/cache/poizon_catalog.sqlite3)를 만듭니다.
+인자가 없으면 utils.constants.TARGET_BRANDS 전체를 크롤링합니다.
+  uv run python scripts/build_poizon_catalog.py [브랜드 ...]
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import config  # noqa: E402
+from sellers.poizon import PoizonSeller  # noqa: E402
+from sellers.poizon_catalog import PoizonCatalog  # noqa: E402
+from sellers.poizon_credentials import load_credentials_from_env  # noqa: E402
+from utils.circuit_breaker import CircuitOpenError  # noqa: E402
+from utils.constants import TARGET_BRANDS  # noqa: E402
+
+
+def main() -> int:
+    brands = sys.argv[1:] or TARGET_BRANDS
+    credentials = load_credentials_from_env()
+    if not credentials:
+        print("[Error] Poizon credentials not found. Please check .env or config.py")
+        return 1
+
+    seller = PoizonSeller(credentials=credentials)
+    catalog = PoizonCatalog(config.CACHE_DIR / "poizon_catalog.sqlite3")
+    try:
+        for brand in brands:
+            catalog.crawl(seller.search_product, brand, page_size=config.POIZON_CATALOG_PAGE_SIZE)
+    except CircuitOpenError as e:
+        print(f"[Error] Poizon 요청 중단: {e}")
+        return 1
+    finally:
+        print(f"[Catalog] 총 {len(catalog)}개 상품")
+        catalog.close()
+        seller.close()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
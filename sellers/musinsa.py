@@ -1,16 +1,25 @@
 import json
 import re
+import threading
 import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
 from typing import Any
 
 import requests
 from pydantic import BaseModel
 
+import config
 from models.product import ProductInfo, ProductOption, SalesMetrics
 from sellers.base import BaseSeller
-from utils.matching import find_best_match, normalize_text
+from utils.cache import SqliteCache
+from utils.http import create_session
+from utils.matching import BrandMatcher, find_best_match, normalize_text
+from utils.model_numbers import brand_for_name, extract_model_number
+from utils.next_data import find_json_subtree, read_next_data
 from utils.constants import BrandEnum
+from utils.rate_limiter import RateGovernor, get_governor, parse_retry_after
 
 
 class MusinsaRankingType(Enum):
@@ -26,60 +35,216 @@ class MusinsaRankingItem(BaseModel):
     price: int
     product_url: str
     image_url: str | None = None
+    # 상품명에서 추출한 모델 번호와 신뢰도 (utils.model_numbers)
+    model_no: str | None = None
+    model_no_confidence: float = 0.0
+
+
+def _is_goods_meta(value: Any) -> bool:
+    # pageProps.meta: {"data": {"goodsNo": ..., "goodsNm": ...}}
+    return isinstance(value, dict) and isinstance(value.get("data"), dict) and (
+        "goodsNm" in value["data"] or "goodsNo" in value["data"]
+    )
 
 
 class MusinsaSeller(BaseSeller):
-    def __init__(self) -> None:
+    NOT_FOUND_CACHE_NAMESPACE: str = "musinsa_not_found"
+    OPTION_CACHE_NAMESPACE: str = "musinsa_options"
+
+    def __init__(
+        self,
+        governor: RateGovernor | None = None,
+        cache: SqliteCache | None = None,
+        detail_workers: int | None = None,
+        base_info_source: str | None = None,
+    ) -> None:
         super().__init__("Musinsa")
-        self.last_api_error: str | None = None
+        self._error_lock = threading.Lock()
+        # cache_stats / page_stats는 상세 조회 스레드에서도 갱신
+        self._stats_lock = threading.Lock()
+        self.api_error_count = 0
+        self.last_api_error = None
+        # 키워드 검색 "매칭 없음" 결과 캐시 (실행 간 재사용)
+        self.cache = cache
+        self.not_found_cache_ttl: float = config.NOT_FOUND_CACHE_TTL_HOURS * 3600
+        # 옵션 구조(옵션 그룹·조합)는 거의 바뀌지 않으므로 길게 캐시하고 재고만 매번 조회
+        self.option_cache_ttl: float = config.MUSINSA_OPTION_CACHE_TTL_HOURS * 3600
+        self.option_unlisted_ttl: float = config.MUSINSA_OPTION_UNLISTED_TTL_HOURS * 3600
+        self.cache_stats: dict[str, int] = {
+            "not_found_hits": 0, "option_hits": 0, "option_refreshes": 0, "base_info_hits": 0,
+        }
+        # 상품 ID → 기본 정보 (실행 단위 메모, 디스크에 저장하지 않음)
+        self._base_info_memo: dict[str, dict[str, Any]] = {}
+        self._base_info_lock = threading.Lock()
+        # 상품 상세 HTML: 읽은 바이트 수, __NEXT_DATA__ 부분 추출 실패로 전체 파싱한 횟수
+        # JSON API 기본 정보: 성공 수, 받은 바이트 수, HTML로 대체한 횟수
+        self.page_stats: dict[str, int] = {
+            "pages": 0, "bytes_read": 0, "full_parses": 0,
+            "json_infos": 0, "json_bytes": 0, "json_fallbacks": 0,
+        }
+        # 기본 정보 조회 경로: "api"(JSON, HTML 대체) 또는 "html"
+        self.base_info_source: str = (base_info_source or config.MUSINSA_BASE_INFO_SOURCE).lower()
+        # 상품 상세 동시 조회 수 (1이면 순차)
+        self.detail_workers: int = max(1, detail_workers or config.MUSINSA_DETAIL_WORKERS)
+        self._detail_executor: ThreadPoolExecutor | None = None
+        self.session = create_session(max(4, self.detail_workers))
+        # 호스트별 요청 페이싱 (PoizonSeller·main.py와 공유)
+        self.governor: RateGovernor = governor or get_governor()
         # 랭킹 섹션 데이터를 가져오는 API URL 템플릿
-        self.ranking_section_url = "https://api.musinsa.com/api2/hm/web/v5/pans/ranking?storeCode=musinsa&sectionId={section_id}&contentsId=&categoryCode=000&subPan=product&gf=A&ageBand=AGE_BAND_ALL"
+        self.ranking_section_url = "https://api.musinsa.com/api2/hm/web/v5/pans/ranking?storeCode=musinsa&sectionId={section_id}&contentsId=&categoryCode={category_code}&subPan=product&gf=A&ageBand=AGE_BAND_ALL"
+
+    @property
+    def last_api_error(self) -> str | None:
+        return self._last_api_error
+
+    @last_api_error.setter
+    def last_api_error(self, value: str | None) -> None:
+        # 오류가 기록될 때마다 카운트 (같은 메시지가 반복돼도 구분 가능)
+        self._last_api_error = value
+        if value:
+            with self._error_lock:
+                self.api_error_count += 1
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        """RateGovernor로 호스트별 페이싱을 적용해 요청을 보냅니다."""
+        self.governor.acquire(url)
+        started = time.monotonic()
+        try:
+            response = self.session.request(method, url, **kwargs)
+        except requests.exceptions.RequestException:
+            self.governor.record(url, None, time.monotonic() - started)
+            raise
+        self.governor.record(
+            url,
+            response.status_code,
+            time.monotonic() - started,
+            retry_after=parse_retry_after(response.headers.get("Retry-After")),
+        )
+        return response
+
+    def close(self) -> None:
+        if self._detail_executor is not None:
+            self._detail_executor.shutdown(wait=True)
+            self._detail_executor = None
+        self.session.close()
+
+    def _bump(self, stats: dict[str, int], key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            stats[key] += amount
+
+    def _executor(self) -> ThreadPoolExecutor:
+        if self._detail_executor is None:
+            self._detail_executor = ThreadPoolExecutor(
+                max_workers=self.detail_workers, thread_name_prefix="musinsa-detail"
+            )
+        return self._detail_executor
+
+    def _safe_get_product_info(self, product_id: str) -> ProductInfo | None:
+        # 상품 하나의 실패가 나머지 조회를 멈추지 않도록 격리
+        try:
+            return self.get_product_info(product_id)
+        except Exception as e:
+            print(f"Error in get_product_info for {product_id}: {e}")
+            return None
+
+    def iter_product_infos(self, product_ids: list[str]) -> Iterator[tuple[str, ProductInfo | None]]:
+        """
+        상품 상세 정보를 detail_workers개까지 동시에 조회하고, 끝나는 순서대로 (상품 ID, 결과)를 돌려줍니다.
+        호스트별 요청 속도는 공유 RateGovernor가 스레드 간에도 그대로 제한합니다.
+        """
+        if self.detail_workers == 1 or len(product_ids) < 2:
+            for pid in product_ids:
+                yield pid, self._safe_get_product_info(pid)
+            return
+
+        executor = self._executor()
+        futures = {executor.submit(self._safe_get_product_info, pid): pid for pid in product_ids}
+        try:
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 조회는 취소
+            for future in futures:
+                future.cancel()
+
+    def get_product_infos(self, product_ids: list[str]) -> list[ProductInfo]:
+        """여러 상품의 상세 정보를 동시에 조회해 입력 순서대로 반환합니다 (실패한 상품은 제외)."""
+        results = dict(self.iter_product_infos(product_ids))
+        return [results[pid] for pid in product_ids if results.get(pid)]
 
     def search_by_brand(self, brand: BrandEnum, page: int = 1) -> list[ProductInfo]:
         """
         브랜드 키워드로 상품을 검색하고, 검색된 모든 상품의 상세 정보를 리스트로 반환합니다.
         페이지네이션을 지원합니다.
         """
-        keyword = brand.value
         try:
-            # 1. 검색 API 호출
-            search_results = self._call_search_api(keyword, page=page)
-            if not search_results:
-                print(f"No search results found for brand: {keyword} (page {page})")
-                return []
+            product_ids = self._brand_product_ids(brand, page)
+            # 검색된 모든 상품의 상세 정보 조회 (동시 조회, 결과는 검색 순서 유지)
+            return self.get_product_infos(product_ids)
 
-            print(f"Search API returned {len(search_results)} items for brand: {keyword} (page {page})")
-
-            # 2. 검색된 모든 상품 ID 수집
-            product_ids = []
-            for item in search_results:
-                product_id = str(item.get("goodsNo"))
-                if product_id:
-                    product_ids.append(product_id)
+        except Exception as e:
+            print(f"Error in search_by_brand: {e}")
+            return []
 
-            # 3. 모든 상품의 상세 정보 조회
-            product_infos = []
-            for pid in product_ids:
-                p_info = self.get_product_info(pid)
+    def iter_brand_products(self, brand: BrandEnum, pages: list[int]) -> Iterator[ProductInfo]:
+        """
+        여러 페이지의 브랜드 검색 결과를 상세 조회가 끝나는 대로 하나씩 돌려줍니다.
+        페이지 전체를 모으지 않으므로 첫 결과가 빨리 나오고 메모리도 페이지 수와 무관합니다.
+        """
+        for page_idx, page in enumerate(pages, start=1):
+            print(f"  [Page {page_idx}/{len(pages)}] Searching {brand.value} (page={page})...")
+            try:
+                product_ids = self._brand_product_ids(brand, page)
+            except Exception as e:
+                print(f"Error in iter_brand_products: {e}")
+                continue
+            found = 0
+            for _pid, p_info in self.iter_product_infos(product_ids):
                 if p_info:
-                    product_infos.append(p_info)
-
-            return product_infos
+                    found += 1
+                    yield p_info
+            print(f"    -> page result: {found} items")
 
-        except Exception as e:
-            print(f"Error in search_by_brand: {e}")
+    def _brand_product_ids(self, brand: BrandEnum, page: int) -> list[str]:
+        """브랜드 키워드 검색 한 페이지의 상품 ID 목록."""
+        keyword = brand.value
+        # 1. 검색 API 호출
+        search_results = self._call_search_api(keyword, page=page)
+        if not search_results:
+            print(f"No search results found for brand: {keyword} (page {page})")
             return []
 
+        print(f"Search API returned {len(search_results)} items for brand: {keyword} (page {page})")
+
+        # 2. 검색된 모든 상품 ID 수집
+        product_ids = []
+        for item in search_results:
+            product_id = str(item.get("goodsNo"))
+            if product_id:
+                product_ids.append(product_id)
+        return product_ids
+
     def search_product(self, keyword: str) -> list[ProductInfo]:
         """
         키워드(모델 번호 등)로 상품을 검색하고, 매칭되는 모든 상품의 상세 정보를 리스트로 반환합니다.
         상품명에서 모델 번호를 우선 추출하여 매칭을 시도하고, 실패 시 상세 정보를 조회하여 확인합니다.
         """
+        cache_key = normalize_text(keyword)
+        if self.cache is not None and self.cache.get(
+            self.NOT_FOUND_CACHE_NAMESPACE, cache_key, max_age=self.not_found_cache_ttl
+        ):
+            self._bump(self.cache_stats, "not_found_hits")
+            print(f"[Cache] '{keyword}' 최근 무신사 검색 결과 없음 확인됨 → 검색 생략")
+            return []
+
+        # 이번 검색 중 API 오류가 났는지 판단하기 위한 기준값 (오류로 인한 "없음"은 캐시하지 않음)
+        errors_before = self.api_error_count
         try:
             # 1. 검색 API 호출
             search_results = self._call_search_api(keyword)
             if not search_results:
                 print(f"No search results found for keyword: {keyword}")
+                self._remember_not_found(cache_key, errors_before)
                 return []
 
             print(f"Search API returned {len(search_results)} items. Filtering by keyword: {keyword}")
@@ -89,7 +254,10 @@ class MusinsaSeller(BaseSeller):
             normalized_keyword = normalize_text(keyword)
 
             # 상위 20개 아이템 확인 (범위 확장)
-            for item in search_results[:20]:
+            # (상품 ID, 1·2차 매칭 여부)를 검색 순서대로 모아 두고, 3차 확인 결과와 합쳐 순서대로 수집
+            checked = []
+            verify_ids = []
+            for idx, item in enumerate(search_results[:20]):
                 product_id = str(item.get("goodsNo"))
                 goods_name = item.get("goodsName", "")
                 
@@ -102,54 +270,66 @@ class MusinsaSeller(BaseSeller):
                 
                 # 2차 시도: 상품명에서 추출한 모델 번호와 정확히 일치하는지 확인
                 if not is_match:
-                    extracted_model_no = self._extract_model_no_from_name(goods_name)
+                    extracted_model_no = self._extract_model_no_from_name(goods_name, item.get("brandName"))
                     if extracted_model_no and normalize_text(extracted_model_no) == normalized_keyword:
                         is_match = True
                 
-                # 3차 시도: 상세 페이지 조회하여 style_no 확인 (정확도 확보)
-                # 1, 2차에서 매칭되지 않았더라도 상위 3개는 확인해볼 가치가 있음
-                if not is_match and search_results.index(item) < 3:
-                    base_info = self._fetch_product_base_info(product_id)
-                    if base_info:
-                        style_no = base_info.get("style_no", "")
-                        if style_no and normalize_text(style_no) == normalized_keyword:
-                            is_match = True
-
-                if is_match:
+                # 3차 시도 대상: 1, 2차에서 매칭되지 않았더라도 상위 3개는 상세 정보로 확인해볼 가치가 있음
+                if not is_match and idx < 3:
+                    verify_ids.append(product_id)
+
+                checked.append((product_id, is_match))
+
+            # 3차 시도: 상세 정보의 style_no 확인 (정확도 확보, 후보들은 동시에 조회)
+            confirmed_ids = self._verify_style_no(verify_ids, normalized_keyword)
+            for product_id, is_match in checked:
+                if is_match or product_id in confirmed_ids:
                     if product_id not in matched_product_ids:
                         matched_product_ids.append(product_id)
 
             if not matched_product_ids:
                 print(f"No matching product found for keyword: {keyword}")
+                self._remember_not_found(cache_key, errors_before)
                 return []
 
             print(f"Found {len(matched_product_ids)} matching products: {matched_product_ids}. Fetching details...")
 
             # 3. 매칭된 모든 상품의 상세 정보 조회
-            product_infos = []
-            for pid in matched_product_ids:
-                p_info = self.get_product_info(pid)
-                if p_info:
-                    product_infos.append(p_info)
-
-            return product_infos
+            return self.get_product_infos(matched_product_ids)
 
         except Exception as e:
             print(f"Error in search_product: {e}")
             return []
 
-    def _extract_model_no_from_name(self, goods_name: str) -> str | None:
+    def _verify_style_no(self, product_ids: list[str], normalized_keyword: str) -> set[str]:
+        """
+        후보 상품들의 기본 정보를 동시에 조회해 style_no가 키워드와 일치하는 상품 ID 집합을 반환합니다.
+        조회한 기본 정보는 실행 단위 메모에 남으므로 이어지는 상세 조회에서 다시 요청하지 않습니다.
+        """
+        def matches(product_id: str) -> bool:
+            base_info = self._fetch_product_base_info(product_id)
+            style_no = base_info.get("style_no", "") if base_info else ""
+            return bool(style_no) and normalize_text(style_no) == normalized_keyword
+
+        if self.detail_workers == 1 or len(product_ids) < 2:
+            return {pid for pid in product_ids if matches(pid)}
+
+        executor = self._executor()
+        futures = [(pid, executor.submit(matches, pid)) for pid in product_ids]
+        return {pid for pid, future in futures if future.result()}
+
+    def _remember_not_found(self, cache_key: str, errors_before: int) -> None:
+        if self.cache is None or self.api_error_count != errors_before:
+            return
+        self.cache.set(self.NOT_FOUND_CACHE_NAMESPACE, cache_key, True)
+
+    def _extract_model_no_from_name(self, goods_name: str, brand_name: str | None = None) -> str | None:
         """
-        상품명에서 모델 번호를 추출합니다.
+        상품명에서 모델 번호를 추출합니다 (utils.model_numbers 브랜드별 패턴 + "… / MODEL" 패턴).
         무신사 상품명 패턴 예: '클럽 프렌치 테리 크루 M - 블랙:화이트 / FN3889-010'
         """
-        if "/" in goods_name:
-            # 슬래시 뒤의 마지막 부분을 가져옴
-            candidate = goods_name.split("/")[-1].strip()
-            # 모델 번호처럼 생겼는지 간단한 체크 (길이 등)
-            if len(candidate) > 3:
-                return candidate
-        return None
+        match = extract_model_number(goods_name, brand_for_name(brand_name) if brand_name else None)
+        return match.model_no if match else None
 
     def _call_search_api(self, keyword: str, page: int = 1) -> list[dict[str, Any]]:
         """무신사 검색 API를 호출합니다."""
@@ -182,7 +362,7 @@ class MusinsaSeller(BaseSeller):
         }
         
         try:
-            response = requests.get(url, params=params, headers=headers)
+            response = self._request("GET", url, params=params, headers=headers)
             response.raise_for_status()
             data = response.json()
             return data.get("data", {}).get("list", [])
@@ -194,36 +374,44 @@ class MusinsaSeller(BaseSeller):
     def get_product_info(self, product_id: str) -> ProductInfo | None:
         """
         상품 상세 정보를 조회합니다.
-        HTML 파싱을 통해 기본 정보를 얻고, API를 통해 옵션 및 재고 정보를 조회하여 결합합니다.
+        JSON API(또는 HTML 파싱)로 기본 정보를 얻고, API를 통해 옵션 및 재고 정보를 조회하여 결합합니다.
         """
         try:
-            # 1. 기본 정보 (HTML 파싱)
+            # 1. 기본 정보 (JSON API 또는 HTML 파싱)
             base_info = self._fetch_product_base_info(product_id)
             if not base_info:
                 print(f"Failed to fetch base info for {product_id}")
                 return None
 
-            # 2. 옵션 정보
-            options_data = self._fetch_options(product_id)
-            if not options_data:
+            # 2. 옵션 구조 (캐시 → API)
+            option_meta, from_cache = self._load_option_metadata(product_id)
+            if option_meta is None:
                 print(f"Failed to fetch options for {product_id}")
                 return None
 
             # 3. 재고 정보
-            # 모든 옵션 값 ID 수집
-            all_option_value_nos = []
-            basic_options = options_data.get("data", {}).get("basic", [])
-            for basic_option in basic_options:
-                for value in basic_option.get("optionValues", []):
-                    all_option_value_nos.append(value["no"])
-
             inventory_data = None
-            if all_option_value_nos:
-                inventory_data = self._fetch_inventory(product_id, all_option_value_nos)
+            if option_meta["value_nos"]:
+                inventory_data = self._fetch_inventory(product_id, option_meta["value_nos"])
+
+            if from_cache and self._option_cache_stale(product_id, option_meta, inventory_data):
+                # 캐시 이후 옵션 구성이 바뀜(추가·삭제된 variant): 옵션을 다시 받고,
+                # 조회할 옵션 값이 달라졌으면 재고도 다시 조회
+                self._bump(self.cache_stats, "option_refreshes")
+                self.cache.delete(self.OPTION_CACHE_NAMESPACE, product_id)
+                cached_value_nos = option_meta["value_nos"]
+                option_meta, _ = self._load_option_metadata(product_id)
+                if option_meta is None:
+                    print(f"Failed to fetch options for {product_id}")
+                    return None
+                if option_meta["value_nos"] != cached_value_nos:
+                    inventory_data = None
+                    if option_meta["value_nos"]:
+                        inventory_data = self._fetch_inventory(product_id, option_meta["value_nos"])
 
             # 4. 옵션 생성
             product_options = self._build_product_options(
-                product_id, base_info, options_data, inventory_data
+                product_id, base_info, option_meta, inventory_data
             )
 
             # 5. ProductInfo 반환
@@ -246,72 +434,119 @@ class MusinsaSeller(BaseSeller):
             return None
 
     def _fetch_product_base_info(self, product_id: str) -> dict[str, Any] | None:
-        """상품 상세 페이지 HTML에서 __NEXT_DATA__를 추출하여 기본 정보를 파싱합니다."""
-        url = f"https://www.musinsa.com/products/{product_id}"
+        """
+        상품 기본 정보(제목, 스타일 번호, 이미지, 가격)를 조회합니다.
+        base_info_source가 "api"면 goods-detail JSON API를 먼저 쓰고, 실패하거나 필드가 비면 HTML로 대체합니다.
+        성공한 결과는 실행 단위로 메모해 검색 후보 확인과 상세 조회가 같은 요청을 공유합니다.
+        """
+        with self._base_info_lock:
+            cached = self._base_info_memo.get(product_id)
+        if cached is not None:
+            self._bump(self.cache_stats, "base_info_hits")
+            return cached
+
+        info = None
+        if self.base_info_source == "api":
+            info = self._fetch_product_base_info_api(product_id)
+            if info is None:
+                self._bump(self.page_stats, "json_fallbacks")
+        if info is None:
+            info = self._fetch_product_base_info_html(product_id)
+        if info is not None:
+            with self._base_info_lock:
+                self._base_info_memo[product_id] = info
+        return info
+
+    def _fetch_product_base_info_api(self, product_id: str) -> dict[str, Any] | None:
+        """goods-detail JSON API에서 기본 정보를 조회합니다. 실패하면 None (HTML 경로로 대체되므로 오류로 기록하지 않음)."""
+        url = f"https://goods-detail.musinsa.com/api2/goods/{product_id}"
         headers = {
+            "accept": "application/json",
             "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
         }
         try:
-            response = requests.get(url, headers=headers)
-            time.sleep(1)
+            response = self._request("GET", url, headers=headers)
             response.raise_for_status()
+            self._bump(self.page_stats, "json_bytes", len(response.content))
+            meta_data = response.json().get("data") or {}
+        except Exception as e:
+            print(f"[Info] 무신사 상품 API 조회 실패({product_id}), HTML로 대체: {e}")
+            return None
+        # 모델 번호 매칭에 styleNo, 비교에 가격이 필요하므로 비어 있으면 HTML로 대체
+        if not meta_data.get("goodsNm") or not meta_data.get("styleNo") or not meta_data.get("goodsPrice"):
+            return None
+        self._bump(self.page_stats, "json_infos")
+        return self._base_info_from_meta(meta_data)
 
-            # __NEXT_DATA__ 추출
-            start_marker = '<script id="__NEXT_DATA__" type="application/json">'
-            end_marker = "</script>"
-            start_index = response.text.find(start_marker)
-            if start_index == -1:
-                return None
-            start_index += len(start_marker)
-            end_index = response.text.find(end_marker, start_index)
-            if end_index == -1:
+    def _fetch_product_base_info_html(self, product_id: str) -> dict[str, Any] | None:
+        """상품 상세 페이지 HTML에서 __NEXT_DATA__를 추출하여 기본 정보를 파싱합니다."""
+        url = f"https://www.musinsa.com/products/{product_id}"
+        headers = {
+            "user-agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/143.0.0.0 Safari/537.36",
+        }
+        try:
+            # 스트리밍으로 받아 __NEXT_DATA__ 스크립트가 끝나면 나머지 HTML은 읽지 않음
+            response = self._request("GET", url, headers=headers, stream=True)
+            try:
+                response.raise_for_status()
+                json_str, bytes_read = read_next_data(
+                    response.iter_content(chunk_size=16 * 1024), response.encoding
+                )
+            finally:
+                response.close()
+            self._bump(self.page_stats, "pages")
+            self._bump(self.page_stats, "bytes_read", bytes_read)
+            if json_str is None:
                 return None
 
-            json_str = response.text[start_index:end_index]
-            data = json.loads(json_str)
-
-            meta_data = (
-                data.get("props", {})
-                .get("pageProps", {})
-                .get("meta", {})
-                .get("data", {})
-            )
+            # props.pageProps.meta 하위만 디코딩, 못 찾으면 전체 파싱으로 대체
+            meta = find_json_subtree(json_str, ("props", "pageProps", "meta"), accept=_is_goods_meta)
+            if meta is None:
+                self._bump(self.page_stats, "full_parses")
+                data = json.loads(json_str)
+                meta = data.get("props", {}).get("pageProps", {}).get("meta", {})
+            meta_data = meta.get("data", {}) if isinstance(meta, dict) else {}
             if not meta_data:
                 return None
 
-            goods_nm = meta_data.get("goodsNm", "")
-            style_no = meta_data.get("styleNo", "") # 스타일 번호 추출
-            goods_images = meta_data.get("goodsImages", [])
-            image_url = (
-                f"https:{goods_images[0]['imageUrl']}" if goods_images else ""
-            )
-            
-            # goodsPrice가 None일 수 있으므로 안전하게 처리
-            goods_price = meta_data.get("goodsPrice") or {}
-            
-            # 가격 우선순위: couponPrice > salePrice > normalPrice
-            # couponPrice가 null일 수도 있으므로 get으로 가져온 후 체크
-            coupon_price = goods_price.get("couponPrice")
-            sale_price = goods_price.get("salePrice", 0)
-            normal_price = goods_price.get("normalPrice", 0)
-            
-            final_price = normal_price
-            if coupon_price and coupon_price > 0:
-                final_price = coupon_price
-            elif sale_price > 0:
-                final_price = sale_price
-
-            return {
-                "title": goods_nm,
-                "style_no": style_no,
-                "image_url": image_url,
-                "price": final_price,
-            }
+            return self._base_info_from_meta(meta_data)
         except Exception as e:
             self.last_api_error = f"musinsa base info failed({product_id}): {e}"
             print(f"Error fetching base info: {e}")
             return None
 
+    @staticmethod
+    def _base_info_from_meta(meta_data: dict[str, Any]) -> dict[str, Any]:
+        """상품 메타(goodsNm, styleNo, goodsImages, goodsPrice)를 기본 정보 dict로 변환합니다. HTML·API 공통."""
+        goods_nm = meta_data.get("goodsNm", "")
+        style_no = meta_data.get("styleNo", "") # 스타일 번호 추출
+        goods_images = meta_data.get("goodsImages", [])
+        image_url = (
+            f"https:{goods_images[0]['imageUrl']}" if goods_images else ""
+        )
+        
+        # goodsPrice가 None일 수 있으므로 안전하게 처리
+        goods_price = meta_data.get("goodsPrice") or {}
+        
+        # 가격 우선순위: couponPrice > salePrice > normalPrice
+        # couponPrice가 null일 수도 있으므로 get으로 가져온 후 체크
+        coupon_price = goods_price.get("couponPrice")
+        sale_price = goods_price.get("salePrice", 0)
+        normal_price = goods_price.get("normalPrice", 0)
+        
+        final_price = normal_price
+        if coupon_price and coupon_price > 0:
+            final_price = coupon_price
+        elif sale_price > 0:
+            final_price = sale_price
+
+        return {
+            "title": goods_nm,
+            "style_no": style_no,
+            "image_url": image_url,
+            "price": final_price,
+        }
+
     def _fetch_options(self, product_id: str) -> dict[str, Any] | None:
         """상품 옵션 정보를 조회합니다."""
         # optKindCd=CLOTHES는 의류 기준이며, 다른 카테고리일 경우 변경이 필요할 수 있음
@@ -322,7 +557,7 @@ class MusinsaSeller(BaseSeller):
             "referer": f"https://www.musinsa.com/products/{product_id}",
         }
         try:
-            response = requests.get(url, headers=headers)
+            response = self._request("GET", url, headers=headers)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -343,7 +578,7 @@ class MusinsaSeller(BaseSeller):
         }
         payload = {"optionValueNos": option_value_nos}
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            response = self._request("POST", url, headers=headers, json=payload)
             response.raise_for_status()
             return response.json()
         except Exception as e:
@@ -351,14 +586,97 @@ class MusinsaSeller(BaseSeller):
             print(f"Error fetching inventory: {e}")
             return None
 
+    def _load_option_metadata(self, product_id: str) -> tuple[dict[str, Any] | None, bool]:
+        """
+        옵션 구조 메타데이터를 캐시에서 읽고, 없으면 옵션 API를 호출해 만든 뒤 저장합니다.
+
+        Returns:
+            (메타데이터 또는 None, 캐시 적중 여부)
+        """
+        if self.cache is not None:
+            cached = self.cache.get(self.OPTION_CACHE_NAMESPACE, product_id, max_age=self.option_cache_ttl)
+            if cached is not None:
+                self._bump(self.cache_stats, "option_hits")
+                return cached, True
+
+        options_data = self._fetch_options(product_id)
+        if not options_data:
+            return None, False
+        option_meta = self._compile_option_metadata(options_data)
+        if self.cache is not None:
+            self.cache.set(self.OPTION_CACHE_NAMESPACE, product_id, option_meta)
+        return option_meta, False
+
+    @staticmethod
+    def _compile_option_metadata(options_data: dict[str, Any]) -> dict[str, Any]:
+        """
+        옵션 API 응답을 재고 조회·옵션 생성에 필요한 최소 구조로 정리합니다.
+        value_nos: 재고 API에 넘길 옵션 값 ID, values: 옵션 값 ID → (구분, 이름),
+        variants: 옵션 조합별 [variant_id, 사이즈명, 컬러명, 추가금]
+        """
+        data = options_data.get("data", {})
+        value_nos = []
+        values = {}
+        for basic in data.get("basic", []):
+            opt_name = basic.get("name", "")
+            # 사이즈/컬러 구분 로직 (기타 옵션은 사이즈에 붙임)
+            if "사이즈" in opt_name:
+                kind = "size"
+            elif "색상" in opt_name or "컬러" in opt_name:
+                kind = "color"
+            else:
+                kind = "size"
+            for val in basic.get("optionValues", []):
+                value_nos.append(val["no"])
+                values[str(val["no"])] = [kind, val["name"]]
+
+        variants = []
+        for item in data.get("optionItems", []):
+            item_value_nos = set(item.get("optionValueNos", []))
+            size_parts = []
+            color_parts = []
+            # basic 옵션 순서대로 이름을 이어 붙임
+            for no in value_nos:
+                if no in item_value_nos:
+                    kind, name = values[str(no)]
+                    (size_parts if kind == "size" else color_parts).append(name)
+            variants.append(
+                [
+                    item.get("no"),
+                    " / ".join(size_parts) if size_parts else "ONE SIZE",
+                    " / ".join(color_parts) if color_parts else "ONE COLOR",
+                    item.get("price", 0),
+                ]
+            )
+        return {"value_nos": value_nos, "values": values, "variants": variants}
+
+    def _option_cache_stale(
+        self, product_id: str, option_meta: dict[str, Any], inventory_data: dict[str, Any] | None
+    ) -> bool:
+        """
+        캐시된 옵션 구조를 다시 받아야 하면 True.
+        - 재고 응답에 캐시에 없는 variant가 있으면 (새 사이즈·컬러 추가) 바로 갱신
+        - 캐시에만 있는 variant는 재고 API가 원래 빼고 주는 경우도 있으므로,
+          캐시가 option_unlisted_ttl보다 오래됐을 때만 갱신 (판매 종료된 사이즈가 계속 구매 가능으로 남지 않게)
+        """
+        if not inventory_data or "data" not in inventory_data:
+            return False
+        known = {variant[0] for variant in option_meta["variants"]}
+        listed = {inv.get("productVariantId") for inv in inventory_data["data"]}
+        if listed - known:
+            return True
+        if known - listed:
+            return self.cache.get(self.OPTION_CACHE_NAMESPACE, product_id, max_age=self.option_unlisted_ttl) is None
+        return False
+
     def _build_product_options(
         self,
         product_id: str,
         base_info: dict[str, Any],
-        options_data: dict[str, Any],
+        option_meta: dict[str, Any],
         inventory_data: dict[str, Any] | None,
     ) -> list[ProductOption]:
-        """옵션 데이터와 재고 데이터를 결합하여 ProductOption 리스트를 생성합니다."""
+        """옵션 구조 메타데이터와 재고 데이터를 결합하여 ProductOption 리스트를 생성합니다."""
         product_options = []
 
         # 재고 정보 매핑 (productVariantId -> inventory info)
@@ -368,32 +686,7 @@ class MusinsaSeller(BaseSeller):
                 # API 응답의 productVariantId가 optionItems의 no와 매칭됨
                 inventory_map[inv["productVariantId"]] = inv
 
-        option_items = options_data.get("data", {}).get("optionItems", [])
-        basic_options = options_data.get("data", {}).get("basic", [])
-
-        for item in option_items:
-            variant_id = item.get("no")
-            value_nos = item.get("optionValueNos", [])
-
-            # 사이즈/컬러 구분 로직
-            size_parts = []
-            color_parts = []
-
-            for basic in basic_options:
-                opt_name = basic.get("name", "")
-                for val in basic.get("optionValues", []):
-                    if val["no"] in value_nos:
-                        if "사이즈" in opt_name:
-                            size_parts.append(val["name"])
-                        elif "색상" in opt_name or "컬러" in opt_name:
-                            color_parts.append(val["name"])
-                        else:
-                            # 기타 옵션은 사이즈에 붙임
-                            size_parts.append(val["name"])
-
-            size_name = " / ".join(size_parts) if size_parts else "ONE SIZE"
-            color_name = " / ".join(color_parts) if color_parts else "ONE COLOR"
-
+        for variant_id, size_name, color_name, price_delta in option_meta["variants"]:
             # 재고 확인
             inv_info = inventory_map.get(variant_id)
             stock_status = "IN_STOCK"
@@ -409,7 +702,7 @@ class MusinsaSeller(BaseSeller):
                     stock_quantity = int(remain_qty)
 
             # 가격은 기본 가격 + 옵션 추가금
-            option_price = base_info["price"] + item.get("price", 0)
+            option_price = base_info["price"] + price_delta
 
             product_options.append(
                 ProductOption(
@@ -483,10 +776,55 @@ class MusinsaSeller(BaseSeller):
             print(f"Error parsing product {item.get('id')}: {e}")
             return None
 
+    def iter_rankings(
+        self,
+        ranking_types: list[MusinsaRankingType],
+        category_codes: list[str] | None = None,
+        brand_names: list[str] | None = None,
+    ) -> Iterator[MusinsaRankingItem]:
+        """
+        랭킹 섹션 × 카테고리 조합을 동시에 조회하고, 응답이 오는 대로 상품 ID 기준 중복을 제거해 하나씩 돌려줍니다.
+        브랜드 필터는 한 번만 컴파일해 모든 조합에서 공유합니다.
+        """
+        category_codes = category_codes or config.MUSINSA_RANKING_CATEGORIES
+        matcher = BrandMatcher(brand_names) if brand_names else None
+        shards = [(r_type, code) for r_type in ranking_types for code in category_codes]
+        seen: set[str] = set()
+
+        def fetch(shard: tuple[MusinsaRankingType, str]) -> list[MusinsaRankingItem]:
+            r_type, code = shard
+            return self.fetch_ranking(r_type, category_code=code, brand_matcher=matcher)
+
+        futures: dict = {}
+        if self.detail_workers == 1 or len(shards) < 2:
+            results = ((shard, fetch(shard)) for shard in shards)
+        else:
+            executor = self._executor()
+            futures = {executor.submit(fetch, shard): shard for shard in shards}
+            results = ((futures[f], f.result()) for f in as_completed(futures))
+
+        try:
+            for (r_type, code), items in results:
+                new_items = [item for item in items if item.product_id not in seen]
+                print(f"  - {r_type.name} ranking (category={code}): {len(items)} items, {len(new_items)} new")
+                for item in new_items:
+                    seen.add(item.product_id)
+                    yield item
+        finally:
+            # 소비자가 중간에 멈추면 아직 시작하지 않은 조회는 취소
+            for future in futures:
+                future.cancel()
+
     def fetch_ranking(
-        self, ranking_type: MusinsaRankingType, brand_names: list[str] | None = None
+        self,
+        ranking_type: MusinsaRankingType,
+        brand_names: list[str] | None = None,
+        category_code: str = "000",
+        brand_matcher: BrandMatcher | None = None,
     ) -> list[MusinsaRankingItem]:
-        url = self.ranking_section_url.format(section_id=ranking_type.value)
+        url = self.ranking_section_url.format(section_id=ranking_type.value, category_code=category_code)
+        if brand_matcher is None and brand_names:
+            brand_matcher = BrandMatcher(brand_names)
 
         headers = {
             "accept": "application/json, text/plain, */*",
@@ -505,8 +843,7 @@ class MusinsaSeller(BaseSeller):
         }
 
         try:
-            response = requests.get(url, headers=headers)
-            time.sleep(1)
+            response = self._request("GET", url, headers=headers)
             response.raise_for_status()
             data = response.json()
         except Exception as e:
@@ -530,20 +867,15 @@ class MusinsaSeller(BaseSeller):
                 info = item.get("info", {})
                 brand_name = info.get("brandName", "")
 
-                # Brand filtering
-                if brand_names:
-                    normalized_brand = normalize_text(brand_name)
-                    normalized_targets = [normalize_text(b) for b in brand_names]
-                    
-                    # 포함 관계 확인 (예: "나이키" in "나이키(Nike)")
-                    is_matched = any(t in normalized_brand or normalized_brand in t for t in normalized_targets)
-                    if not is_matched:
-                        continue
+                # Brand filtering (포함 관계, BrandMatcher 참고)
+                if brand_matcher is not None and not brand_matcher.matches(brand_name):
+                    continue
 
                 product_id = str(item.get("id", ""))
                 product_name = info.get("productName", "")
                 price = info.get("finalPrice", 0)
                 image_url = item.get("image", {}).get("url", "")
+                model_match = extract_model_number(product_name, brand_for_name(brand_name))
 
                 ranking_item = MusinsaRankingItem(
                     product_id=product_id,
@@ -552,6 +884,8 @@ class MusinsaSeller(BaseSeller):
                     price=int(price),
                     product_url=f"https://www.musinsa.com/app/goods/{product_id}",
                     image_url=image_url,
+                    model_no=model_match.model_no if model_match else None,
+                    model_no_confidence=model_match.confidence if model_match else 0.0,
                 )
                 results.append(ranking_item)
 
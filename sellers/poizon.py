@@ -1,17 +1,34 @@
 import hashlib
 import json
 import re
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 
 import config
 from sellers.base import BaseSeller
+from sellers.poizon_catalog import PoizonCatalog
+from sellers.poizon_credentials import CredentialSlot, PoizonCredential, PoizonCredentialPool
+from sellers.poizon_responses import (
+    AnalyticsResponse,
+    BiddingProduct,
+    BiddingResponse,
+    PoizonResponse,
+    SaleNowResponse,
+)
 from models.product import ProductInfo, ProductOption, SalesMetrics
-from utils.matching import find_best_match
+from utils.cache import SqliteCache
+from utils.circuit_breaker import CircuitBreaker
+from utils.http import connection_stats, create_session
+from utils.matching import find_best_match, normalize_text
 from utils.normalizer import DataNormalizer
+from utils.rate_limiter import RateGovernor, get_governor, parse_retry_after
+from utils.sales_ledger import SalesLedger
 
 class SkuIds(BaseModel):
     skuId: str
@@ -53,9 +70,63 @@ class SalesVelocity(BaseModel):
     velocity_score: float
     rank: str
     details: list[SalesVelocityDetail]
+    sales_24h: int | None = None
+    sales_7d: int | None = None
+    sales_30d: int | None = None
+    trend: float | None = None
+
+class PriceJoinIndex:
+    """
+    SKU ↔ sale-now 가격 행 조인용 인덱스 (상품당 한 번 생성).
+    skuId 계열 ID로 먼저 찾고, 실패하면 가격 행의 "색상 사이즈" 토큰 → 행 위치 인덱스로
+    사이즈 후보가 들어있는 행만 골라 색상 포함 여부를 확인합니다.
+    가격 목록 순서상 가장 앞의 행을 고르는 기존 중첩 루프와 결과가 같습니다.
+    """
+
+    _TOKEN_SPLIT = re.compile(r'[^a-zA-Z0-9.]')
+
+    def __init__(self, price_list: list[SizePriceInfo]) -> None:
+        self.rows = price_list
+        self.by_id: dict[str, SizePriceInfo] = {item.skuId: item for item in price_list if item.skuId}
+        self._full_strs: list[str] = []
+        self._rows_by_token: dict[str, list[int]] = {}
+        for idx, p_item in enumerate(price_list):
+            p_full_str = f"{str(p_item.color).strip()} {str(p_item.size).strip()}"
+            self._full_strs.append(p_full_str)
+            for token in set(self._TOKEN_SPLIT.split(p_full_str)):
+                if token:
+                    self._rows_by_token.setdefault(token, []).append(idx)
+
+    def match(self, sku: SkuSizeInfo) -> SizePriceInfo | None:
+        for check_id in (sku.ids.skuId, sku.ids.globalSkuId, sku.ids.dwSkuId):
+            if check_id and check_id in self.by_id:
+                return self.by_id[check_id]
+
+        s_color = str(sku.color).strip()
+        sku_size_candidates = [
+            str(sku.size_kr).strip(),
+            str(sku.size_eu).strip(),
+            str(sku.size_us).strip(),
+            str(sku.raw_prop).split(' ')[-1].strip()
+        ]
+        positions: set[int] = set()
+        for s_cand in sku_size_candidates:
+            if s_cand and s_cand != "N/A":
+                positions.update(self._rows_by_token.get(s_cand, ()))
+
+        for idx in sorted(positions):
+            if s_color and s_color not in self._full_strs[idx]:
+                continue
+            return self.rows[idx]
+        return None
+
 
 class PoizonSeller(BaseSeller):
     SALT: str = "048a9c4943398714b356a696503d2d36"
+    SPU_CACHE_NAMESPACE: str = "poizon_spu"
+    NOT_FOUND_CACHE_NAMESPACE: str = "poizon_not_found"
+    RESPONSE_CACHE_NAMESPACE: str = "poizon_response"
+    SEARCH_URL: str = "https://seller.poizon.com/api/v1/h5/gw/intl-merchant-platform/oversea/aurora-spu/merchant/search"
 
     def __init__(
         self,
@@ -63,9 +134,70 @@ class PoizonSeller(BaseSeller):
         cookie: str | None = None,
         shumeiid: str | None = None,
         referer: str | None = None,
+        pool_size: int | None = None,
+        connect_timeout: float | None = None,
+        read_timeout: float | None = None,
+        governor: RateGovernor | None = None,
+        concurrent_stages: bool | None = None,
+        early_exit: bool | None = None,
+        spu_cache: SqliteCache | None = None,
+        credentials: list[PoizonCredential] | None = None,
+        sales_ledger: SalesLedger | None = None,
+        catalog: PoizonCatalog | None = None,
     ) -> None:
         super().__init__(name="POIZON")
         self.last_api_error: str | None = None
+        # 호스트별 요청 페이싱 (MusinsaSeller·main.py와 공유)
+        self.governor: RateGovernor = governor or get_governor()
+        # 매칭 후 analytics / sale-now / bidding 3개 호출을 동시에 보낼지 여부
+        self.concurrent_stages: bool = (
+            config.POIZON_CONCURRENT_STAGES if concurrent_stages is None else concurrent_stages
+        )
+        self._stage_executor: ThreadPoolExecutor | None = None
+        # sale-now 먼저 조회 후 차익 가능성이 없으면 나머지 조회 생략 (생략 건수는 plan_stats)
+        self.early_exit: bool = config.POIZON_EARLY_EXIT if early_exit is None else early_exit
+        self.plan_stats: dict[str, int] = {"early_exits": 0, "skipped_calls": 0}
+        # 모델 번호 → 매칭된 SPU / SKU 목록 캐시 (없으면 매번 검색 + bidding 호출)
+        self.spu_cache = spu_cache
+        self.spu_cache_ttl: float = config.POIZON_SPU_CACHE_TTL_HOURS * 3600
+        # "검색했지만 매칭 없음" 결과는 더 짧은 별도 TTL로 보관 (같은 캐시 파일, 다른 네임스페이스)
+        self.not_found_cache_ttl: float = config.NOT_FOUND_CACHE_TTL_HOURS * 3600
+        # SPU별 상세 응답 재사용 시간(초). 0이면 항상 새로 조회 (bidding/SKU는 SPU 매핑 캐시가 담당)
+        self.freshness: dict[str, float] = {
+            "querySaleNowInfo": config.POIZON_SALE_NOW_TTL_MINUTES * 60,
+            "getMoreFloatingLayer": config.POIZON_ANALYTICS_TTL_MINUTES * 60,
+        }
+        # cache_stats / plan_stats는 단계 조회·비교 스레드에서도 갱신
+        self._stats_lock = threading.Lock()
+        self.cache_stats: dict[str, int] = {
+            "spu_hits": 0,
+            "not_found_hits": 0,
+            "response_hits": 0,
+            "catalog_hits": 0,
+            "catalog_rejects": 0,
+        }
+        # 브랜드별 검색 크롤링으로 만든 로컬 카탈로그 (있으면 모델 번호 검색 대신 로컬 매칭)
+        self.catalog = catalog
+        # SPU별 누적 거래 원장 (없으면 매 조회 응답만으로 판매 속도 계산)
+        self.sales_ledger = sales_ledger
+        # 세션 만료(401 passport)·연결 장애 시 이후 요청을 즉시 실패시키는 서킷 브레이커
+        self.breaker = CircuitBreaker(
+            "POIZON",
+            failure_threshold=config.POIZON_BREAKER_FAILURE_THRESHOLD,
+            cooldown=config.POIZON_BREAKER_COOLDOWN,
+            probe=self._probe_session,
+        )
+        # keep-alive 풀링 세션 (요청마다 TCP+TLS 핸드셰이크를 새로 하지 않도록)
+        self.session = create_session(pool_size or config.POIZON_POOL_SIZE)
+        self.timeout: tuple[float, float] = (
+            connect_timeout or config.POIZON_CONNECT_TIMEOUT,
+            read_timeout or config.POIZON_READ_TIMEOUT,
+        )
+        # 여러 계정이 주어지면 첫 번째가 기본 계정
+        if credentials:
+            dutoken, cookie, shumeiid = (
+                credentials[0].dutoken, credentials[0].cookie, credentials[0].shumeiid
+            )
         # 인자로 전달받지 않으면 config에서 가져옴
         raw_dutoken = dutoken or config.POIZON_DUTOKEN
         raw_cookie = cookie or config.POIZON_COOKIE
@@ -96,6 +228,19 @@ class PoizonSeller(BaseSeller):
                 "[Warning] Cookie has no 'sk=…'. Poizon may need sk as header; use full Cookie from browser."
             )
 
+        # 계정 풀: 계정별 속도 예산 / 세션 상태를 따로 관리하고 가장 덜 바쁜 계정으로 요청
+        self.credentials = PoizonCredentialPool(
+            credentials
+            or [
+                PoizonCredential(
+                    name="primary", dutoken=self.dutoken, cookie=self.cookie, shumeiid=self._shumeiid
+                )
+            ],
+            self.governor,
+        )
+        if len(self.credentials.slots) > 1:
+            print(f"[Info] Poizon credential pool: {len(self.credentials.slots)} accounts")
+
         self.base_headers: dict[str, str] = {
             'accept': 'application/json',
             'accept-language': 'ko-KR,ko;q=0.9,zh-CN;q=0.8,zh;q=0.7,en-US;q=0.6,en;q=0.5',
@@ -123,14 +268,20 @@ class PoizonSeller(BaseSeller):
             ),
         }
 
-    def _get_headers(self) -> dict[str, str]:
+    def _get_headers(self, credential: PoizonCredential | None = None) -> dict[str, str]:
         headers = self.base_headers.copy()
-        headers['dutoken'] = self.dutoken
-        headers['Cookie'] = self.cookie
-        if self._sk_from_cookie:
-            headers['sk'] = self._sk_from_cookie
-        if self._shumeiid:
-            headers['shumeiid'] = self._shumeiid
+        if credential is None:
+            dutoken, cookie, sk, shumeiid = self.dutoken, self.cookie, self._sk_from_cookie, self._shumeiid
+        else:
+            dutoken, cookie, sk, shumeiid = (
+                credential.dutoken, credential.cookie, credential.sk, credential.shumeiid
+            )
+        headers['dutoken'] = dutoken
+        headers['Cookie'] = cookie
+        if sk:
+            headers['sk'] = sk
+        if shumeiid:
+            headers['shumeiid'] = shumeiid
         return headers
 
     def _generate_sign(self, payload_dict: dict[str, Any]) -> str:
@@ -159,22 +310,134 @@ class PoizonSeller(BaseSeller):
         sign_str += self.SALT
         return hashlib.md5(sign_str.encode('utf-8')).hexdigest()
 
-    def _send_request(self, url: str, payload_dict: dict[str, Any]) -> dict[str, Any]:
+    @staticmethod
+    def _code_and_msg(data: Any) -> tuple[Any, str | None]:
+        if isinstance(data, PoizonResponse):
+            return data.code, data.msg
+        if isinstance(data, dict):
+            return data.get("code"), data.get("msg")
+        return None, None
+
+    @classmethod
+    def _is_auth_failure(cls, status_code: int, data: Any) -> bool:
+        """dutoken/cookie 만료 시그니처: HTTP 401 또는 body code 401 / passport 메시지."""
+        if status_code == 401:
+            return True
+        code, msg = cls._code_and_msg(data)
+        return code == 401 or "passport" in str(msg or "").lower()
+
+    def _probe_session(self) -> None:
+        """서킷 half-open 시 세션이 살아있는지 확인하는 가벼운 검색 요청 (결과는 breaker에 기록됨)."""
+        self._send_request_unguarded(self.SEARCH_URL, self._search_payload("test", 1, 1))
+
+    def _send_request(
+        self, url: str, payload_dict: dict[str, Any], decoder: type[PoizonResponse] | None = None
+    ) -> Any:
+        """
+        서명 후 POST합니다. decoder(엔드포인트별 응답 모델)를 주면 응답 바이트를 바로 검증해
+        해당 모델로 반환하고(필요 필드만 보관), 없으면 dict를 반환합니다.
+        실패 시에는 빈 dict 또는 빈 decoder 모델을 반환합니다.
+        """
+        # 회로가 열려 있으면 네트워크 없이 CircuitOpenError
+        self.breaker.before_call()
+        return self._send_request_unguarded(url, payload_dict, decoder)
+
+    def _send_request_unguarded(
+        self, url: str, payload_dict: dict[str, Any], decoder: type[PoizonResponse] | None = None
+    ) -> Any:
+        # 만료된 계정으로 실패하면 그 계정만 빼고 남은 정상 계정으로 같은 요청을 다시 보냄
+        for _ in range(len(self.credentials.slots)):
+            slot = self.credentials.acquire()
+            try:
+                data, auth_failed = self._send_with_credential(slot, url, payload_dict, decoder)
+            finally:
+                self.credentials.release(slot)
+            if not auth_failed:
+                return data
+            if self.credentials.healthy_count == 0:
+                break
+        _, msg = self._code_and_msg(data)
+        self.last_api_error = f"poizon auth failure for {url}: {msg or 'session expired'}"
+        print(f"Error sending request: auth failure for {url} ({msg or 'session expired'})")
+        return data
+
+    @staticmethod
+    def _raw_json(response: requests.Response) -> Any:
+        try:
+            return json.loads(response.content)
+        except ValueError:
+            return None
+
+    def _decode_response(
+        self, url: str, response: requests.Response, decoder: type[PoizonResponse] | None
+    ) -> Any:
+        if decoder is None:
+            try:
+                return response.json()
+            except ValueError:
+                return {}
+        try:
+            decoded = decoder.model_validate_json(response.content)
+        except ValidationError as e:
+            if response.ok:
+                self.last_api_error = f"poizon response decode failed for {url}: {e.error_count()} errors"
+                print(f"Error decoding response for {url}: {e}")
+            # data 모양이 다른 오류 응답(세션 만료 등)도 code/msg는 남겨 서킷 브레이커·계정 풀이 판단할 수 있게 함
+            code, msg = self._code_and_msg(self._raw_json(response))
+            return decoder(
+                code=code if isinstance(code, int) else None,
+                msg=None if msg is None else str(msg),
+            )
+        decoded.observed_at = time.time()
+        return decoded
+
+    def _send_with_credential(
+        self,
+        slot: CredentialSlot,
+        url: str,
+        payload_dict: dict[str, Any],
+        decoder: type[PoizonResponse] | None = None,
+    ) -> tuple[Any, bool]:
+        """한 계정으로 요청을 보내고 (응답, 계정 인증 실패 여부)를 반환합니다."""
         sign = self._generate_sign(payload_dict)
         final_url = f"{url}?sign={sign}"
         payload_json = json.dumps(payload_dict, separators=(',', ':'))
 
+        # 계정별 속도 예산 (계정이 하나면 호스트 예산과 동일)
+        slot.limiter.acquire()
+        started = time.monotonic()
         try:
-            response = requests.post(
-                final_url, headers=self._get_headers(), data=payload_json, timeout=60
+            response = self.session.post(
+                final_url,
+                headers=self._get_headers(slot.credential),
+                data=payload_json,
+                timeout=self.timeout,
             )
-            try:
-                data = response.json()
-            except ValueError:
-                data = {}
+            slot.limiter.record(
+                response.status_code,
+                time.monotonic() - started,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+            data = self._decode_response(url, response, decoder)
+
+            if self._is_auth_failure(response.status_code, data):
+                _, msg = self._code_and_msg(data)
+                reason = f"auth failure {response.status_code} {msg or ''}".strip()
+                # 만료된 계정만 풀에서 빼고, 남은 정상 계정이 없을 때만 전체 회로를 엶
+                slot.breaker.trip(reason)
+                if self.credentials.healthy_count == 0:
+                    self.breaker.trip(reason)
+                # 오류 기록은 다른 계정으로 재시도한 뒤 호출부에서 결정
+                return data if decoder is not None or isinstance(data, dict) else {}, True
+            else:
+                slot.breaker.record_success()
+                if response.status_code >= 500:
+                    self.breaker.record_failure(f"{response.status_code} {response.reason}")
+                else:
+                    self.breaker.record_success()
 
             if not response.ok:
-                msg = data.get("msg") if isinstance(data, dict) else None
+                _, msg = self._code_and_msg(data)
                 err_detail = f" {msg}" if msg else f" (body: {response.text[:300]!r})"
                 self.last_api_error = (
                     f"poizon request failed: {response.status_code} {response.reason} "
@@ -184,18 +447,38 @@ class PoizonSeller(BaseSeller):
                     f"Error sending request: {response.status_code} {response.reason} for {url}{err_detail}"
                 )
                 # 비-2xx여도 code/msg가 있으면 하위에서 처리 (401 passport 만료 등)
-                return data if isinstance(data, dict) else {}
+                if decoder is not None:
+                    return data, False
+                return data if isinstance(data, dict) else {}, False
 
-            time.sleep(2)
-            return data
+            return data, False
         except requests.exceptions.RequestException as e:
+            slot.limiter.record(None, time.monotonic() - started)
+            # 연결 장애는 계정 문제가 아니므로 전체 회로에 기록 (half-open 재시도 중이던 계정은 다시 대기)
+            if slot.breaker.state == CircuitBreaker.HALF_OPEN:
+                slot.breaker.record_failure(f"{type(e).__name__}: {e}")
+            self.breaker.record_failure(f"{type(e).__name__}: {e}")
             self.last_api_error = f"poizon request exception for {url}: {e}"
             print(f"Error sending request: {e}")
-            return {}
+            return decoder() if decoder is not None else {}, False
 
-    def search_product(self, keyword: str, page: int = 1, page_size: int = 20) -> dict[str, Any]:
-        url = "https://seller.poizon.com/api/v1/h5/gw/intl-merchant-platform/oversea/aurora-spu/merchant/search"
-        payload = {
+    def _bump(self, stats: dict[str, int], key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            stats[key] += amount
+
+    def connection_stats(self) -> dict[str, int]:
+        """Poizon 세션의 요청 수 / 신규 커넥션 수 / 재사용 횟수를 반환합니다."""
+        return connection_stats(self.session)
+
+    def close(self) -> None:
+        if self._stage_executor is not None:
+            self._stage_executor.shutdown(wait=True)
+            self._stage_executor = None
+        self.session.close()
+
+    @staticmethod
+    def _search_payload(keyword: str, page: int, page_size: int) -> dict[str, Any]:
+        return {
             "pageNum": page,
             "identifyStatusEnable": True,
             "pageSize": page_size,
@@ -203,7 +486,9 @@ class PoizonSeller(BaseSeller):
             "current": page,
             "page": page
         }
-        return self._send_request(url, payload)
+
+    def search_product(self, keyword: str, page: int = 1, page_size: int = 20) -> dict[str, Any]:
+        return self._send_request(self.SEARCH_URL, self._search_payload(keyword, page, page_size))
 
     def find_matching_product(self, product_list: list[dict[str, Any]], search_keyword: str) -> dict[str, Any] | None:
         """
@@ -211,28 +496,55 @@ class PoizonSeller(BaseSeller):
         """
         return find_best_match(product_list, search_keyword, key_field="articleNumber")
 
-    def query_sale_now_info(self, spu_id: int) -> dict[str, Any]:
+    def _send_with_freshness(
+        self, url: str, payload: dict[str, Any], spu_id: int, decoder: type[PoizonResponse]
+    ) -> Any:
+        """
+        엔드포인트별 freshness 정책에 따라 로컬 응답 저장소(spu_cache)의 응답을 재사용합니다.
+        유효 시간이 0이거나 캐시가 없으면 그대로 요청하고, 정상 응답(code 200)만 저장합니다.
+        """
+        endpoint = url.rsplit("/", 1)[-1]
+        ttl = self.freshness.get(endpoint, 0)
+        if self.spu_cache is None or ttl <= 0:
+            return self._send_request(url, payload, decoder=decoder)
+
+        cache_key = f"{endpoint}:{spu_id}"
+        cached = self.spu_cache.get(self.RESPONSE_CACHE_NAMESPACE, cache_key, max_age=ttl)
+        if cached is not None:
+            self._bump(self.cache_stats, "response_hits")
+            return decoder.model_validate(cached)
+
+        response = self._send_request(url, payload, decoder=decoder)
+        if response.code == 200 and response.data:
+            self.spu_cache.set(
+                self.RESPONSE_CACHE_NAMESPACE, cache_key, response.model_dump(exclude_none=True)
+            )
+        return response
+
+    def query_sale_now_info(self, spu_id: int) -> SaleNowResponse:
         url = "https://seller.poizon.com/api/v1/h5/gw/adapter/pc/bidding/query/querySaleNowInfo"
         payload = {"source": "PC", "spuId": spu_id}
-        return self._send_request(url, payload)
+        return self._send_with_freshness(url, payload, spu_id, SaleNowResponse)
 
-    def extract_price_info(self, api_response: dict[str, Any]) -> PriceSummary:
-        data = api_response.get('data', {})
+    def extract_price_info(self, api_response: SaleNowResponse | dict[str, Any]) -> PriceSummary:
+        if isinstance(api_response, dict):
+            api_response = SaleNowResponse.model_validate(api_response)
+        data = api_response.data
         if not data:
             return PriceSummary(productTitle="", articleNumber="", imageUrl="", sizeList=[])
 
-        product_title = data.get("skuInfos", [{}])[0].get("productName", "")
-        article_number = data.get("articleNumber", "")
-        image_url = data.get("logoUrl", "")
+        sku_infos = data.skuInfos or []
+        product_title = (sku_infos[0].productName if sku_infos else None) or ""
+        article_number = data.articleNumber or ""
+        image_url = data.logoUrl or ""
         size_list: list[SizePriceInfo] = []
 
-        sku_infos = data.get("skuInfos", [])
         for sku in sku_infos:
-            if sku.get("productType") == "SPU":
+            if sku.productType == "SPU":
                 continue
 
-            sku_id = str(sku.get("skuId", ""))
-            raw_desc = sku.get("propertyDesc", "")
+            sku_id = str(sku.skuId) if sku.skuId is not None else ""
+            raw_desc = sku.propertyDesc or ""
             if "*#*" in raw_desc:
                 parts = raw_desc.split("*#*")
                 color_name = parts[0]
@@ -244,17 +556,15 @@ class PoizonSeller(BaseSeller):
             kr_price = 0
             cn_price = 0
 
-            groups = sku.get("salesVolumeGroups", [])
-            for group in groups:
-                if group.get("buttonCode") != 0:
+            for group in sku.salesVolumeGroups or []:
+                if group.buttonCode != 0:
                     continue
-                infos = group.get("salesVolumeInfos", [])
-                for info in infos:
-                    area_id = info.get("areaId")
-                    price_obj = info.get("price", {})
-                    if not price_obj:
+                for info in group.salesVolumeInfos or []:
+                    area_id = info.areaId
+                    price_obj = info.price
+                    if not price_obj or not price_obj.money:
                         continue
-                    amount = int(price_obj.get("money", {}).get("amount", 0))
+                    amount = int(price_obj.money.amount or 0)
                     if amount == 0:
                         continue
                     if area_id == "SALE_LOCAL_POIZON_LEAK":
@@ -285,7 +595,7 @@ class PoizonSeller(BaseSeller):
             sizeList=size_list
         )
 
-    def query_product_detail_analytics(self, spu_id: int) -> dict[str, Any]:
+    def query_product_detail_analytics(self, spu_id: int) -> AnalyticsResponse:
         url = "https://seller.poizon.com/api/v1/h5/gw/intl-price-center/merchant/price/floatLayer/getMoreFloatingLayer"
         payload = {
             "spuId": spu_id,
@@ -293,7 +603,7 @@ class PoizonSeller(BaseSeller):
             "timeRangeTypeCode": 0,
             "platformFlag": "PC"
         }
-        return self._send_request(url, payload)
+        return self._send_with_freshness(url, payload, spu_id, AnalyticsResponse)
 
     def _parse_minutes_ago(self, time_str: str) -> int:
         s = time_str.replace(" ", "").strip()
@@ -328,16 +638,71 @@ class PoizonSeller(BaseSeller):
             return days * 24 * 60
         return 999999
 
-    def calculate_sales_velocity(self, analytics_response: dict[str, Any]) -> SalesVelocity:
-        data = analytics_response.get('data', {})
-        trade_records = data.get('historyTradeRecord', {}).get('tradeRecordDTO', {}).get('tradeRecords', [])
+    @staticmethod
+    def _time_resolution_mins(time_str: str) -> int:
+        """상대 시각 표기의 단위(분). "3시간전"은 최대 1시간 오차."""
+        s = time_str.replace(" ", "")
+        units = (("시간전", 60), ("일전", 1440), ("주전", 7 * 1440), ("달전", 30 * 1440), ("년전", 365 * 1440))
+        for unit, mins in units:
+            if unit in s:
+                return mins
+        return 1
+
+    def _record_trades(
+        self, spu_id: int, analytics_response: AnalyticsResponse, details: list[SalesVelocityDetail]
+    ) -> float:
+        """
+        조회한 거래들을 응답 시각 기준 절대 시각으로 바꿔 판매 원장에 추가하고,
+        이번 응답이 덮는 기간의 시작 시각(가장 오래된 거래, 시각 오차 포함)을 반환합니다.
+        """
+        observed_at = analytics_response.observed_at or time.time()
+        trades = [
+            (observed_at - d.elapsed_mins * 60, self._time_resolution_mins(d.time_str) * 60)
+            for d in details
+            if d.elapsed_mins != 999999
+        ]
+        added = self.sales_ledger.record(str(spu_id), trades)
+        if added:
+            print(f"[Ledger] GID {spu_id}: 신규 거래 {added}건 기록")
+        return min((ts - precision for ts, precision in trades), default=observed_at)
+
+    @staticmethod
+    def _velocity_rank(score: float) -> str:
+        if score >= 5000:
+            return "SSS (미친 속도 🔥)"
+        if score >= 2000:
+            return "S (폭발적)"
+        if score >= 500:
+            return "A (매우 빠름)"
+        if score >= 100:
+            return "B (양호)"
+        if score >= 20:
+            return "C (보통)"
+        return "F (정체)"
+
+    def calculate_sales_velocity(
+        self, analytics_response: AnalyticsResponse | dict[str, Any], spu_id: int | None = None
+    ) -> SalesVelocity:
+        """
+        거래 내역으로 판매 속도를 계산합니다.
+        판매 원장과 spu_id가 있으면 새 거래만 원장에 추가한 뒤 원장 전체(집계 기간)로
+        기간별 판매 수·추세를 계산하고, 없으면 이번 응답의 거래만으로 점수를 계산합니다.
+        점수는 어느 쪽이든 API 응답이 덮는 기간(최근 거래 N건)만 반영합니다.
+        _velocity_rank 기준이 그 기간에 맞춰져 있어, 원장이 쌓여도 같은 판매 속도면 같은 등급이 나오도록.
+        """
+        if isinstance(analytics_response, dict):
+            analytics_response = AnalyticsResponse.model_validate(analytics_response)
+        data = analytics_response.data
+        history = data.historyTradeRecord if data else None
+        record_dto = history.tradeRecordDTO if history else None
+        trade_records = (record_dto.tradeRecords if record_dto else None) or []
 
         total_velocity_score = 0.0
         details: list[SalesVelocityDetail] = []
         BASE_POINT = 10000
 
         for trade in trade_records:
-            time_str = trade.get('time', '')
+            time_str = trade.time or ""
             elapsed_mins = self._parse_minutes_ago(time_str)
             score = BASE_POINT / (elapsed_mins + 5)
             total_velocity_score += score
@@ -347,54 +712,100 @@ class PoizonSeller(BaseSeller):
                 score=round(score, 2)
             ))
 
-        velocity_rank = "F (정체)"
-        if total_velocity_score >= 5000:
-            velocity_rank = "SSS (미친 속도 🔥)"
-        elif total_velocity_score >= 2000:
-            velocity_rank = "S (폭발적)"
-        elif total_velocity_score >= 500:
-            velocity_rank = "A (매우 빠름)"
-        elif total_velocity_score >= 100:
-            velocity_rank = "B (양호)"
-        elif total_velocity_score >= 20:
-            velocity_rank = "C (보통)"
+        if self.sales_ledger is not None and spu_id is not None:
+            score_since = self._record_trades(spu_id, analytics_response, details)
+            summary = self.sales_ledger.summary(str(spu_id), score_since=score_since)
+            return SalesVelocity(
+                rank=self._velocity_rank(summary["velocity_score"]), details=details, **summary
+            )
 
         return SalesVelocity(
             velocity_score=round(total_velocity_score, 2),
-            rank=velocity_rank,
+            rank=self._velocity_rank(total_velocity_score),
             details=details
         )
 
-    def query_bidding_info(self, global_spu_id: int) -> dict[str, Any]:
+    def query_bidding_info(self, global_spu_id: int) -> BiddingResponse:
+        return self._query_bidding([global_spu_id])
+
+    def _query_bidding(self, global_spu_ids: list[int]) -> BiddingResponse:
         url = "https://seller.poizon.com/api/v1/h5/gw/adapter/pc/bidding/query/batchQueryNewBidding"
         payload = {
             "biddingType": -1,
-            "globalSpuIds": [global_spu_id],
+            "globalSpuIds": global_spu_ids,
             "autoFillFulfillmentBiddingType": 1,
             "needShowSizeKey": True
         }
-        return self._send_request(url, payload)
+        return self._send_request(url, payload, decoder=BiddingResponse)
 
-    def extract_sku_size_info(self, bidding_response: dict[str, Any]) -> list[SkuSizeInfo]:
-        data = bidding_response.get('data', [])
+    def query_bidding_info_batch(
+        self, global_spu_ids: list[int], chunk_size: int | None = None
+    ) -> dict[int, list[SkuSizeInfo]]:
+        """
+        여러 globalSpuId의 bidding/SKU 정보를 chunk 단위 batchQueryNewBidding 호출로 조회해
+        SPU별 SkuSizeInfo 리스트로 나눠 반환합니다. 응답에 없는 SPU는 결과에서 빠집니다.
+        """
+        chunk_size = chunk_size or config.POIZON_BIDDING_BATCH_SIZE
+        unique_ids = list(dict.fromkeys(gid for gid in global_spu_ids if gid is not None))
+        result: dict[int, list[SkuSizeInfo]] = {}
+        for start in range(0, len(unique_ids), chunk_size):
+            chunk = unique_ids[start:start + chunk_size]
+            bidding_res = self._query_bidding(chunk)
+            result.update(self.extract_sku_size_info_by_spu(bidding_res, chunk))
+        return result
+
+    def extract_sku_size_info_by_spu(
+        self, bidding_response: BiddingResponse | dict[str, Any], requested_ids: list[int]
+    ) -> dict[int, list[SkuSizeInfo]]:
+        """
+        batchQueryNewBidding 응답을 globalSpuId별로 분리합니다.
+        항목에 globalSpuId가 없으면 요청 순서와 같은 것으로 간주합니다.
+        """
+        if isinstance(bidding_response, dict):
+            bidding_response = BiddingResponse.model_validate(bidding_response)
+        data = bidding_response.data
+        if not data:
+            return {}
+
+        by_spu: dict[int, list[SkuSizeInfo]] = {}
+        for idx, product_data in enumerate(data):
+            gid = product_data.globalSpuId
+            if gid is None:
+                if len(data) != len(requested_ids):
+                    continue
+                gid = requested_ids[idx]
+            by_spu[int(gid)] = self._extract_product_skus(product_data)
+        return by_spu
+
+    def extract_sku_size_info(self, bidding_response: BiddingResponse | dict[str, Any]) -> list[SkuSizeInfo]:
+        if isinstance(bidding_response, dict):
+            bidding_response = BiddingResponse.model_validate(bidding_response)
+        data = bidding_response.data
         if not data:
             return []
 
-        product_data = data[0]
-        sku_list = product_data.get('skuInventoryInfoList', [])
+        return self._extract_product_skus(data[0])
+
+    @staticmethod
+    def _id_str(value: Any) -> str:
+        return str(value) if value is not None else ""
+
+    def _extract_product_skus(self, product_data: BiddingProduct | dict[str, Any]) -> list[SkuSizeInfo]:
+        if isinstance(product_data, dict):
+            product_data = BiddingProduct.model_validate(product_data)
         extracted_skus: list[SkuSizeInfo] = []
 
-        for sku in sku_list:
-            sku_id = str(sku.get('skuId', ''))
-            spu_id = sku.get('spuId')
-            image_url = sku.get('skuPic') or sku.get('logoUrl') or ''
-            raw_prop = sku.get('spuPropNew') or sku.get('spuProp') or ''
+        for sku in product_data.skuInventoryInfoList or []:
+            sku_id = self._id_str(sku.skuId)
+            spu_id = sku.spuId
+            image_url = sku.skuPic or sku.logoUrl or ''
+            raw_prop = sku.spuPropNew or sku.spuProp or ''
             fallback_size = raw_prop.split(' ')[-1] if ' ' in raw_prop else raw_prop
 
             sku_ids = SkuIds(
                 skuId=sku_id,
-                globalSkuId=str(sku.get('globalSkuId', '')),
-                dwSkuId=str(sku.get('dwSkuId', ''))
+                globalSkuId=self._id_str(sku.globalSkuId),
+                dwSkuId=self._id_str(sku.dwSkuId)
             )
 
             sku_info_data = {
@@ -409,11 +820,11 @@ class PoizonSeller(BaseSeller):
                 "color": ""
             }
 
-            specs = sku.get('skuPropAllSpecification', [])
+            specs = sku.skuPropAllSpecification
             if specs:
                 for spec in specs:
-                    key = spec.get('sizeKey')
-                    val_str = spec.get('skuProp', '')
+                    key = spec.sizeKey
+                    val_str = spec.skuProp or ''
                     # 숫자만 추출 (예: "화이트 CHN 220" -> "220")
                     size_val = val_str.split(' ')[-1] if ' ' in val_str else val_str
                     
@@ -434,10 +845,9 @@ class PoizonSeller(BaseSeller):
                         if sku_info_data['size_eu'] == "N/A":
                             sku_info_data['size_eu'] = size_val
 
-            region_info = sku.get('regionSalePvInfoList', [])
-            for info in region_info:
-                name = info.get('name', '')
-                value = info.get('value', '')
+            for info in sku.regionSalePvInfoList or []:
+                name = info.name or ''
+                value = info.value or ''
                 if '색상' in name or 'Color' in name:
                     sku_info_data['color'] = value
                 if sku_info_data['size_kr'] == "N/A":
@@ -454,7 +864,70 @@ class PoizonSeller(BaseSeller):
 
         return extracted_skus
 
-    def get_product_info(self, model_number: str) -> ProductInfo | None:
+    def _run_stages(self, global_spu_id: int, stages: list[Callable[[int], Any]]) -> list[Any]:
+        """
+        서로 독립인 SPU 조회들을 실행합니다. concurrent_stages 모드에서는 동시에 보내고 결과를 모읍니다.
+        (호스트 속도 제한은 RateGovernor가 스레드 간에도 동일하게 적용)
+        """
+        if not self.concurrent_stages or len(stages) < 2:
+            return [stage(global_spu_id) for stage in stages]
+        if self._stage_executor is None:
+            self._stage_executor = ThreadPoolExecutor(
+                max_workers=3, thread_name_prefix="poizon-stage"
+            )
+        futures = [self._stage_executor.submit(stage, global_spu_id) for stage in stages]
+        return [f.result() for f in futures]
+
+    def _fetch_detail_stages(
+        self, global_spu_id: int, include_bidding: bool = True
+    ) -> tuple[AnalyticsResponse, SaleNowResponse, BiddingResponse | None]:
+        """
+        매칭된 SPU의 analytics / sale-now / bidding 응답을 한 번에 반환합니다.
+        include_bidding=False면 bidding은 호출하지 않고 None을 돌려줍니다.
+        """
+        stages = [self.query_product_detail_analytics, self.query_sale_now_info]
+        if include_bidding:
+            stages.append(self.query_bidding_info)
+        results = self._run_stages(global_spu_id, stages)
+        bidding_res = results[2] if include_bidding else None
+        return results[0], results[1], bidding_res
+
+    @staticmethod
+    def _early_exit_reason(price_data: PriceSummary, price_floor: int | None) -> str | None:
+        """
+        sale-now 결과만으로 수익 가능성이 없다고 판단되면 그 이유를 반환합니다.
+        price_floor(호출자가 아는 무신사 최저 판매가) 이하의 Poizon 가격으로는 어떤 사이즈도 차익이 없음.
+        가격 행이 없는 경우는 판단하지 않음 (평소 경로로 품절 SKU 옵션을 만듦).
+        """
+        if price_floor and price_data.sizeList and all(item.targetPrice <= price_floor for item in price_data.sizeList):
+            return f"모든 Poizon 가격이 무신사 최저가({price_floor:,}원) 이하"
+        return None
+
+    def resolve_product(self, model_number: str) -> dict[str, Any] | None:
+        """
+        모델 번호로 검색해 매칭된 Poizon 상품(merchantSpuDto)을 반환합니다.
+        최근에 "매칭 없음"으로 확인된 모델 번호는 검색 없이 None을 반환합니다.
+        로컬 카탈로그에 품번이 있으면 검색 없이 그 상품을 쓰고, authoritative 카탈로그에 없으면 None.
+        """
+        cache_key = normalize_text(model_number)
+        if self.spu_cache is not None and self.spu_cache.get(
+            self.NOT_FOUND_CACHE_NAMESPACE, cache_key, max_age=self.not_found_cache_ttl
+        ):
+            self._bump(self.cache_stats, "not_found_hits")
+            print(f"[Cache] '{model_number}' 최근 Poizon 미등록 확인됨 → 검색 생략")
+            return None
+
+        if self.catalog is not None:
+            catalog_product = self.catalog.lookup(model_number)
+            if catalog_product:
+                self._bump(self.cache_stats, "catalog_hits")
+                print(f"[Catalog] '{model_number}' 카탈로그 매칭 (GID: {catalog_product.get('globalSpuId')})")
+                return catalog_product
+            if self.catalog.authoritative and len(self.catalog):
+                self._bump(self.cache_stats, "catalog_rejects")
+                print(f"[Catalog] '{model_number}' 카탈로그에 없음 → Poizon 미등록 처리")
+                return None
+
         print(f"[Info] '{model_number}' 검색 시작...")
         search_res = self.search_product(model_number)
         if search_res.get('code') != 200:
@@ -467,66 +940,219 @@ class PoizonSeller(BaseSeller):
 
         if not matched_product:
             print(f"[Info] '{model_number}'에 해당하는 정확한 상품을 찾을 수 없습니다.")
+            # 검색 API 자체는 성공한 경우에만 "없음"을 캐시 (오류는 캐시하지 않음)
+            if self.spu_cache is not None:
+                self.spu_cache.set(self.NOT_FOUND_CACHE_NAMESPACE, cache_key, True)
+            return None
+
+        return matched_product
+
+    def _load_spu_mapping(
+        self, model_number: str
+    ) -> tuple[dict[str, Any], list[SkuSizeInfo], list[str]] | None:
+        """캐시된 (매칭 상품, SKU 목록, 저장 당시 가격 skuId 목록)을 반환합니다."""
+        if self.spu_cache is None:
+            return None
+        entry = self.spu_cache.get(
+            self.SPU_CACHE_NAMESPACE, normalize_text(model_number), max_age=self.spu_cache_ttl
+        )
+        if not entry:
+            return None
+        self._bump(self.cache_stats, "spu_hits")
+        sku_data = [SkuSizeInfo(**sku) for sku in entry.get("skus", [])]
+        return entry["matched"], sku_data, entry.get("price_sku_ids", [])
+
+    def _store_spu_mapping(
+        self,
+        model_number: str,
+        matched_product: dict[str, Any],
+        sku_data: list[SkuSizeInfo],
+        price_data: PriceSummary,
+    ) -> None:
+        if self.spu_cache is None or not sku_data:
+            return
+        self.spu_cache.set(
+            self.SPU_CACHE_NAMESPACE,
+            normalize_text(model_number),
+            {
+                "matched": {
+                    k: matched_product.get(k) for k in ("globalSpuId", "articleNumber", "title", "logoUrl")
+                },
+                "skus": [sku.model_dump() for sku in sku_data],
+                "price_sku_ids": [item.skuId for item in price_data.sizeList if item.skuId],
+            },
+        )
+
+    def _invalidate_spu_mapping(self, model_number: str) -> None:
+        if self.spu_cache is not None:
+            self.spu_cache.delete(self.SPU_CACHE_NAMESPACE, normalize_text(model_number))
+
+    @staticmethod
+    def _has_unknown_skus(
+        sku_data: list[SkuSizeInfo], price_data: PriceSummary, known_price_ids: list[str]
+    ) -> bool:
+        """가격 응답에 캐시된 SKU 목록에서 본 적 없는 skuId가 있으면 True (SKU 구성 변경)."""
+        known = set(known_price_ids)
+        for sku in sku_data:
+            known.update((sku.ids.skuId, sku.ids.globalSkuId, sku.ids.dwSkuId))
+        return any(item.skuId and item.skuId not in known for item in price_data.sizeList)
+
+    def get_product_info(self, model_number: str, price_floor: int | None = None) -> ProductInfo | None:
+        """
+        모델 번호의 Poizon ProductInfo를 반환합니다.
+        price_floor: 비교 대상(무신사) 최저 판매가. 주어지면 모든 Poizon 가격이 이 이하일 때 조기 종료
+        """
+        cached = self._load_spu_mapping(model_number)
+        if cached:
+            matched_product, sku_data, price_sku_ids = cached
+            print(f"[Cache] '{model_number}' SPU 매핑 캐시 사용 (GID: {matched_product.get('globalSpuId')})")
+            return self._build_product_info(
+                matched_product,
+                sku_data=sku_data,
+                cache_key=model_number,
+                cached_price_sku_ids=price_sku_ids,
+                price_floor=price_floor,
+            )
+
+        matched_product = self.resolve_product(model_number)
+        if not matched_product:
             return None
+        return self._build_product_info(matched_product, cache_key=model_number, price_floor=price_floor)
 
+    def get_product_infos(
+        self, model_numbers: list[str], price_floors: dict[str, int | None] | None = None
+    ) -> dict[str, ProductInfo | None]:
+        """
+        여러 모델 번호를 한 번에 처리합니다.
+        먼저 모든 모델의 매칭을 끝낸 뒤 bidding/SKU 정보는 batchQueryNewBidding으로 묶어서 조회하고,
+        상품별로는 analytics / sale-now만 호출합니다. SPU 매핑 캐시에 있는 모델은 검색도 생략합니다.
+        price_floors: 모델 번호별 무신사 최저 판매가 (get_product_info의 price_floor와 같음)
+        """
+        price_floors = price_floors or {}
+        results: dict[str, ProductInfo | None] = {}
+        matches: dict[str, dict[str, Any] | None] = {}
+        for model_number in dict.fromkeys(model_numbers):
+            cached = self._load_spu_mapping(model_number)
+            if cached:
+                matched_product, sku_data, price_sku_ids = cached
+                results[model_number] = self._build_product_info(
+                    matched_product,
+                    sku_data=sku_data,
+                    cache_key=model_number,
+                    cached_price_sku_ids=price_sku_ids,
+                    price_floor=price_floors.get(model_number),
+                )
+            else:
+                matches[model_number] = self.resolve_product(model_number)
+
+        global_spu_ids = [m.get('globalSpuId') for m in matches.values() if m]
+        sku_by_spu = self.query_bidding_info_batch(global_spu_ids) if global_spu_ids else {}
+
+        for model_number, matched_product in matches.items():
+            if not matched_product:
+                results[model_number] = None
+                continue
+            sku_data = sku_by_spu.get(matched_product.get('globalSpuId'))
+            results[model_number] = self._build_product_info(
+                matched_product,
+                sku_data=sku_data,
+                cache_key=model_number,
+                fresh_skus=True,
+                price_floor=price_floors.get(model_number),
+            )
+        return {model_number: results[model_number] for model_number in dict.fromkeys(model_numbers)}
+
+    def _build_product_info(
+        self,
+        matched_product: dict[str, Any],
+        sku_data: list[SkuSizeInfo] | None = None,
+        cache_key: str | None = None,
+        cached_price_sku_ids: list[str] | None = None,
+        fresh_skus: bool = False,
+        price_floor: int | None = None,
+    ) -> ProductInfo:
+        """
+        매칭된 상품의 가격/판매/SKU 정보를 조회해 ProductInfo를 만듭니다.
+        sku_data가 주어지면(batch 조회, SPU 매핑 캐시) bidding 호출은 생략합니다.
+        캐시에서 온 sku_data인데 가격 응답에 모르는 skuId가 있으면 캐시를 버리고 bidding을 다시 조회합니다.
+        새로 조회한 SKU 목록은 cache_key로 SPU 매핑 캐시에 저장합니다.
+
+        early_exit 모드에서는 sale-now를 먼저 조회하고, 모든 가격이 price_floor 이하이면 analytics를 생략합니다.
+        이때 옵션은 평소와 같이 만들고 판매 지표(sales_metrics)만 비어 있습니다.
+        """
         global_spu_id = matched_product.get('globalSpuId')
         article_number = matched_product.get('articleNumber')
         title = matched_product.get('title')
 
         print(f"[Info] 상품 매칭 성공: {title} (GID: {global_spu_id})")
 
-        analytics_res = self.query_product_detail_analytics(global_spu_id)
-        velocity_data = self.calculate_sales_velocity(analytics_res)
-
-        sale_now_res = self.query_sale_now_info(global_spu_id)
-        price_data = self.extract_price_info(sale_now_res)
+        if self.early_exit:
+            price_data = self.extract_price_info(self.query_sale_now_info(global_spu_id))
+            exit_reason = self._early_exit_reason(price_data, price_floor)
+            if exit_reason:
+                # 판매 지표(analytics)만 생략하고 옵션은 평소처럼 SKU 정보(bidding)와 결합
+                self._bump(self.plan_stats, "early_exits")
+                self._bump(self.plan_stats, "skipped_calls")
+                print(f"[Plan] {title}: {exit_reason} → analytics 생략")
+                analytics_res = None
+                bidding_res = self.query_bidding_info(global_spu_id) if sku_data is None else None
+            else:
+                stages = [self.query_product_detail_analytics]
+                if sku_data is None:
+                    stages.append(self.query_bidding_info)
+                results = self._run_stages(global_spu_id, stages)
+                analytics_res = results[0]
+                bidding_res = results[1] if sku_data is None else None
+        else:
+            analytics_res, sale_now_res, bidding_res = self._fetch_detail_stages(
+                global_spu_id, include_bidding=sku_data is None
+            )
+            price_data = self.extract_price_info(sale_now_res)
+        velocity_data = (
+            self.calculate_sales_velocity(analytics_res, global_spu_id) if analytics_res is not None else None
+        )
+        if sku_data is None:
+            sku_data = self.extract_sku_size_info(bidding_res)
+            fresh_skus = True
+        elif cached_price_sku_ids is not None and self._has_unknown_skus(
+            sku_data, price_data, cached_price_sku_ids
+        ):
+            print(f"[Cache] '{cache_key}' 모르는 SKU 발견 → SPU 매핑 캐시 무효화 후 bidding 재조회")
+            if cache_key:
+                self._invalidate_spu_mapping(cache_key)
+            sku_data = self.extract_sku_size_info(self.query_bidding_info(global_spu_id))
+            fresh_skus = True
+
+        if fresh_skus and cache_key:
+            self._store_spu_mapping(cache_key, matched_product, sku_data, price_data)
 
-        bidding_res = self.query_bidding_info(global_spu_id)
-        sku_data = self.extract_sku_size_info(bidding_res)
+        return ProductInfo(
+            platform=self.name,
+            model_no=article_number,
+            title=title,
+            image_url=matched_product.get('logoUrl'),
+            options=self._join_options(sku_data, price_data),
+            sales_metrics=SalesMetrics(
+                velocity_score=velocity_data.velocity_score,
+                rank=velocity_data.rank,
+                recent_sales_count=len(velocity_data.details),
+                last_sold_time=velocity_data.details[0].time_str if velocity_data.details else None,
+                sales_24h=velocity_data.sales_24h,
+                sales_7d=velocity_data.sales_7d,
+                sales_30d=velocity_data.sales_30d,
+                trend=velocity_data.trend,
+            ) if velocity_data is not None else None,
+        )
 
-        price_by_id = {item.skuId: item for item in price_data.sizeList if item.skuId}
-        price_list = price_data.sizeList
+    def _join_options(
+        self, sku_data: list[SkuSizeInfo], price_data: PriceSummary
+    ) -> list[ProductOption]:
+        price_index = PriceJoinIndex(price_data.sizeList)
 
         standard_options: list[ProductOption] = []
 
         for sku in sku_data:
-            matched_price: SizePriceInfo | None = None
-            sku_ids = sku.ids
-
-            for id_key in ['skuId', 'globalSkuId', 'dwSkuId']:
-                check_id = getattr(sku_ids, id_key, None)
-                if check_id and check_id in price_by_id:
-                    matched_price = price_by_id[check_id]
-                    break
-
-            if not matched_price:
-                s_color = str(sku.color).strip()
-                sku_size_candidates = [
-                    str(sku.size_kr).strip(),
-                    str(sku.size_eu).strip(),
-                    str(sku.size_us).strip(),
-                    str(sku.raw_prop).split(' ')[-1].strip()
-                ]
-                sku_size_candidates = [s for s in sku_size_candidates if s and s != "N/A"]
-
-                for p_item in price_list:
-                    p_size_str = str(p_item.size).strip()
-                    p_color_str = str(p_item.color).strip()
-                    p_full_str = f"{p_color_str} {p_size_str}"
-
-                    if s_color and s_color not in p_full_str:
-                        continue
-
-                    is_size_match = False
-                    p_tokens = re.split(r'[^a-zA-Z0-9.]', p_full_str)
-                    for s_cand in sku_size_candidates:
-                        if s_cand in p_tokens:
-                            is_size_match = True
-                            break
-
-                    if is_size_match:
-                        matched_price = p_item
-                        break
+            matched_price = price_index.match(sku)
 
             target_price = 0
             kr_leak_price = 0
@@ -565,16 +1191,4 @@ class PoizonSeller(BaseSeller):
                 }
             ))
 
-        return ProductInfo(
-            platform=self.name,
-            model_no=article_number,
-            title=title,
-            image_url=matched_product.get('logoUrl'),
-            options=standard_options,
-            sales_metrics=SalesMetrics(
-                velocity_score=velocity_data.velocity_score,
-                rank=velocity_data.rank,
-                recent_sales_count=len(velocity_data.details),
-                last_sold_time=velocity_data.details[0].time_str if velocity_data.details else None
-            )
-        )
\ No newline at end of file
+        return standard_options
\ No newline at end of file
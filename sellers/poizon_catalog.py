@@ -0,0 +1,142 @@
+"""
+Poizon 상품 카탈로그 (로컬 SQLite 인덱스).
+브랜드 키워드로 merchant/search를 큰 페이지 단위로 훑어 articleNumber / globalSpuId / 제목 / 로고를 저장하고,
+정규화한 품번 집합을 메모리에 올려 모델 번호별 검색 없이 로컬에서 매칭(또는 미등록 판정)합니다.
+"""
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from utils.matching import normalize_text
+
+CATALOG_FIELDS = ("globalSpuId", "articleNumber", "title", "logoUrl")
+
+
+class PoizonCatalog:
+    def __init__(self, path: Path | str, authoritative: bool = False) -> None:
+        """
+        Args:
+            path: SQLite 파일 경로
+            authoritative: True면 카탈로그에 없는 모델 번호를 Poizon 미등록으로 판정(검색 생략).
+                           크롤링한 브랜드가 대상 브랜드를 모두 덮을 때만 켜야 함
+        """
+        self.path = Path(path)
+        self.authoritative = authoritative
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._keys: set[str] | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS catalog ("
+                " article_key TEXT PRIMARY KEY,"
+                " article_number TEXT NOT NULL,"
+                " global_spu_id INTEGER,"
+                " title TEXT,"
+                " logo_url TEXT,"
+                " keyword TEXT,"
+                " crawled_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _key_set(self) -> set[str]:
+        # 정규화 품번 집합: 대부분의 미등록 모델은 SQLite 조회 없이 여기서 걸러짐
+        # 비교 작업 스레드가 동시에 찾으므로 한 번만, 다 만든 뒤에 공개
+        keys = self._keys
+        if keys is not None:
+            return keys
+        with self._lock:
+            if self._keys is None:
+                if self.path.exists():
+                    rows = self._connect().execute("SELECT article_key FROM catalog").fetchall()
+                    self._keys = {r[0] for r in rows}
+                else:
+                    # 아직 크롤링하지 않은 카탈로그: 파일을 만들지 않고 빈 집합
+                    self._keys = set()
+            return self._keys
+
+    def __len__(self) -> int:
+        return len(self._key_set())
+
+    def __contains__(self, model_number: str) -> bool:
+        return normalize_text(model_number) in self._key_set()
+
+    def lookup(self, model_number: str) -> dict[str, Any] | None:
+        """정규화 품번이 정확히 일치하는 상품을 merchantSpuDto 형태(dict)로 반환합니다."""
+        key = normalize_text(model_number)
+        if not key or key not in self._key_set():
+            return None
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT global_spu_id, article_number, title, logo_url FROM catalog WHERE article_key = ?",
+                (key,),
+            ).fetchone()
+        return dict(zip(CATALOG_FIELDS, row)) if row else None
+
+    def add(self, products: list[dict[str, Any]], keyword: str = "") -> int:
+        """검색 결과 상품들을 저장하고 저장한 건수를 반환합니다 (같은 품번은 최신 값으로 덮어씀)."""
+        now = time.time()
+        rows = []
+        for product in products:
+            article_number = str(product.get("articleNumber") or "")
+            key = normalize_text(article_number)
+            if not key:
+                continue
+            rows.append(
+                (
+                    key,
+                    article_number,
+                    product.get("globalSpuId"),
+                    product.get("title"),
+                    product.get("logoUrl"),
+                    keyword,
+                    now,
+                )
+            )
+        if not rows:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            conn.executemany("INSERT OR REPLACE INTO catalog VALUES (?, ?, ?, ?, ?, ?, ?)", rows)
+            conn.commit()
+            if self._keys is not None:
+                self._keys.update(r[0] for r in rows)
+        return len(rows)
+
+    def crawl(
+        self,
+        search: Callable[[str, int, int], dict[str, Any]],
+        keyword: str,
+        page_size: int = 50,
+        max_pages: int = 100,
+    ) -> int:
+        """
+        search(keyword, page, page_size)로 브랜드 키워드 검색 결과를 끝까지 넘기며 저장합니다.
+        빈 페이지나 page_size보다 작은 페이지가 나오면 종료. 저장한 상품 수를 반환합니다.
+        """
+        total = 0
+        for page in range(1, max_pages + 1):
+            res = search(keyword, page, page_size)
+            if res.get("code") != 200:
+                print(f"[Catalog] '{keyword}' page {page} 검색 실패: {res.get('msg') or res.get('code')}")
+                break
+            products = (res.get("data") or {}).get("merchantSpuDtoList") or []
+            total += self.add(products, keyword=keyword)
+            if len(products) < page_size:
+                break
+        print(f"[Catalog] '{keyword}': {total}개 상품 저장 (전체 {len(self)}개)")
+        return total
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
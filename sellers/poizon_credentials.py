@@ -0,0 +1,139 @@
+"""
+Poizon 판매자 세션(dutoken / cookie / shumeiid) 풀.
+계정별로 요청 속도 예산과 서킷 브레이커(세션 만료 감지)를 따로 두고,
+요청마다 가장 덜 바쁜 정상 계정을 골라 보냅니다.
+"""
+import os
+import re
+import threading
+
+from pydantic import BaseModel
+
+import config
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.rate_limiter import AdaptiveRateLimiter, RateGovernor
+
+POIZON_HOST = "seller.poizon.com"
+
+
+class PoizonCredential(BaseModel):
+    name: str
+    dutoken: str
+    cookie: str
+    shumeiid: str = ""
+
+    @property
+    def sk(self) -> str:
+        # 브라우저는 Cookie 외에 동일 값을 "sk" 헤더에도 보냄(직접 전달). 없으면 쿠키에서 추출
+        m_sk = re.search(r"(?:^|;)\s*sk=([^;]+)", self.cookie)
+        return m_sk.group(1).strip() if m_sk else ""
+
+
+def load_credentials_from_env() -> list[PoizonCredential]:
+    """
+    .env / 환경 변수에서 Poizon 세션 목록을 읽습니다.
+    기본 계정은 POIZON_DUTOKEN / POIZON_COOKIE / POIZON_SHUMEIID,
+    추가 계정은 같은 이름에 _2, _3 … 접미사를 붙여 등록합니다 (비어 있는 번호에서 중단).
+    """
+    credentials: list[PoizonCredential] = []
+    dutoken = (config.POIZON_DUTOKEN or "").strip()
+    cookie = (config.POIZON_COOKIE or "").strip()
+    if dutoken and cookie:
+        credentials.append(
+            PoizonCredential(
+                name="primary",
+                dutoken=dutoken,
+                cookie=cookie,
+                shumeiid=(config.POIZON_SHUMEIID or "").strip(),
+            )
+        )
+
+    idx = 2
+    while True:
+        dutoken = os.getenv(f"POIZON_DUTOKEN_{idx}", "").strip()
+        cookie = os.getenv(f"POIZON_COOKIE_{idx}", "").strip()
+        if not dutoken or not cookie:
+            break
+        credentials.append(
+            PoizonCredential(
+                name=f"account{idx}",
+                dutoken=dutoken,
+                cookie=cookie,
+                shumeiid=os.getenv(f"POIZON_SHUMEIID_{idx}", "").strip(),
+            )
+        )
+        idx += 1
+    return credentials
+
+
+class CredentialSlot:
+    """풀 안의 계정 하나: 자격 증명 + 전용 속도 예산 + 세션 상태."""
+
+    def __init__(
+        self, credential: PoizonCredential, limiter: AdaptiveRateLimiter, breaker: CircuitBreaker
+    ) -> None:
+        self.credential = credential
+        self.limiter = limiter
+        self.breaker = breaker
+        self.in_flight = 0
+        self.requests = 0
+
+
+class PoizonCredentialPool:
+    def __init__(
+        self,
+        credentials: list[PoizonCredential],
+        governor: RateGovernor,
+        cooldown: float | None = None,
+    ) -> None:
+        if not credentials:
+            raise ValueError("PoizonCredentialPool needs at least one credential")
+        self._lock = threading.Lock()
+        self.slots: list[CredentialSlot] = []
+        for credential in credentials:
+            # 계정이 하나면 호스트 예산을 그대로 쓰고, 여러 개면 계정마다 별도 예산(호스트 정책 복제)
+            key = POIZON_HOST if len(credentials) == 1 else f"{POIZON_HOST}#{credential.name}"
+            breaker = CircuitBreaker(
+                f"POIZON[{credential.name}]",
+                failure_threshold=1,
+                cooldown=cooldown if cooldown is not None else config.POIZON_BREAKER_COOLDOWN,
+            )
+            self.slots.append(CredentialSlot(credential, governor.limiter_for(key), breaker))
+
+    @property
+    def healthy_count(self) -> int:
+        return sum(1 for slot in self.slots if not slot.breaker.is_open)
+
+    def acquire(self) -> CredentialSlot:
+        """
+        가장 덜 바쁜(진행 중 요청 수, 다음 토큰까지 대기 시간 순) 사용 가능한 계정을 고릅니다.
+        세션이 만료돼 빠진 계정은 cooldown 이후 한 번 다시 시도됩니다(half-open).
+        모든 계정이 사용 불가면 CircuitOpenError.
+        """
+        with self._lock:
+            candidates = sorted(
+                self.slots, key=lambda slot: (slot.in_flight, slot.limiter.pending_wait())
+            )
+            for slot in candidates:
+                try:
+                    slot.breaker.before_call()
+                except CircuitOpenError:
+                    continue
+                slot.in_flight += 1
+                slot.requests += 1
+                return slot
+        raise CircuitOpenError("POIZON credentials", "no usable Poizon session", 0.0)
+
+    def release(self, slot: CredentialSlot) -> None:
+        with self._lock:
+            slot.in_flight -= 1
+
+    def stats(self) -> dict[str, dict[str, object]]:
+        return {
+            slot.credential.name: {
+                "state": slot.breaker.state,
+                "requests": slot.requests,
+                "rate": round(slot.limiter.rate, 3),
+            }
+            for slot in self.slots
+        }
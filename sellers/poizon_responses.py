@@ -0,0 +1,108 @@
+"""
+Poizon 엔드포인트별 응답 디코더.
+응답 바이트를 ``model_validate_json`` 으로 바로 검증하면서 실제로 쓰는 필드만 남기고
+나머지(skuInfos / skuInventoryInfoList의 대량 부가 필드)는 파싱 단계에서 버립니다.
+null로 오는 필드가 있어도 전체 검증이 실패하지 않도록 리스트/객체 필드는 모두 None을 허용합니다.
+"""
+from pydantic import BaseModel, Field
+
+
+class PoizonResponse(BaseModel):
+    code: int | None = None
+    msg: str | None = None
+    # 응답을 받은 시각(epoch 초). API 필드가 아니라 디코딩 시 채움 — 캐시된 응답의 "N분전" 기준점
+    observed_at: float | None = None
+
+
+# --- querySaleNowInfo ---
+
+class Money(BaseModel):
+    amount: int | float | None = 0
+
+
+class SalePrice(BaseModel):
+    money: Money | None = Field(default_factory=Money)
+
+
+class SalesVolumeInfo(BaseModel):
+    areaId: str | None = None
+    price: SalePrice | None = None
+
+
+class SalesVolumeGroup(BaseModel):
+    buttonCode: int | None = None
+    salesVolumeInfos: list[SalesVolumeInfo] | None = Field(default_factory=list)
+
+
+class SaleNowSku(BaseModel):
+    productName: str | None = None
+    productType: str | None = None
+    skuId: int | str | None = None
+    propertyDesc: str | None = None
+    salesVolumeGroups: list[SalesVolumeGroup] | None = Field(default_factory=list)
+
+
+class SaleNowData(BaseModel):
+    articleNumber: str | None = None
+    logoUrl: str | None = None
+    skuInfos: list[SaleNowSku] | None = Field(default_factory=list)
+
+
+class SaleNowResponse(PoizonResponse):
+    data: SaleNowData | None = None
+
+
+# --- batchQueryNewBidding ---
+
+class SizeSpecification(BaseModel):
+    sizeKey: str | None = None
+    skuProp: str | None = None
+
+
+class RegionSalePv(BaseModel):
+    name: str | None = None
+    value: str | None = None
+
+
+class SkuInventoryInfo(BaseModel):
+    skuId: int | str | None = None
+    spuId: int | None = None
+    globalSkuId: int | str | None = None
+    dwSkuId: int | str | None = None
+    skuPic: str | None = None
+    logoUrl: str | None = None
+    spuPropNew: str | None = None
+    spuProp: str | None = None
+    skuPropAllSpecification: list[SizeSpecification] | None = None
+    regionSalePvInfoList: list[RegionSalePv] | None = None
+
+
+class BiddingProduct(BaseModel):
+    globalSpuId: int | str | None = None
+    skuInventoryInfoList: list[SkuInventoryInfo] | None = Field(default_factory=list)
+
+
+class BiddingResponse(PoizonResponse):
+    data: list[BiddingProduct] | None = None
+
+
+# --- getMoreFloatingLayer ---
+
+class TradeRecord(BaseModel):
+    time: str | None = ""
+
+
+class TradeRecordDTO(BaseModel):
+    tradeRecords: list[TradeRecord] | None = Field(default_factory=list)
+
+
+class HistoryTradeRecord(BaseModel):
+    tradeRecordDTO: TradeRecordDTO | None = Field(default_factory=TradeRecordDTO)
+
+
+class AnalyticsData(BaseModel):
+    historyTradeRecord: HistoryTradeRecord | None = Field(default_factory=HistoryTradeRecord)
+
+
+class AnalyticsResponse(PoizonResponse):
+    data: AnalyticsData | None = None
@@ -0,0 +1,39 @@
+"""SqliteCache 단위: 저장/만료/삭제."""
+
+from pathlib import Path
+
+import pytest
+
+from utils.cache import SqliteCache
+
+
+def test_set_get_delete_roundtrip(tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "c.sqlite3")
+    assert cache.get("ns", "k") is None
+    cache.set("ns", "k", {"a": [1, "블랙"]})
+    assert cache.get("ns", "k") == {"a": [1, "블랙"]}
+    assert cache.get("other", "k") is None
+    cache.delete("ns", "k")
+    assert cache.get("ns", "k") is None
+    cache.close()
+
+
+def test_max_age_expires_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = SqliteCache(tmp_path / "c.sqlite3")
+    now = [1000.0]
+    monkeypatch.setattr("utils.cache.time.time", lambda: now[0])
+    cache.set("ns", "k", 1)
+    now[0] += 50
+    assert cache.get("ns", "k", max_age=60) == 1
+    now[0] += 20
+    assert cache.get("ns", "k", max_age=60) is None
+    assert cache.get("ns", "k") == 1
+
+
+def test_file_is_created_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "sub" / "c.sqlite3"
+    cache = SqliteCache(path)
+    assert not path.exists()
+    cache.set("ns", "k", True)
+    assert path.exists()
+    cache.close()
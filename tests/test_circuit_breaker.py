@@ -0,0 +1,87 @@
+"""CircuitBreaker 단위 + PoizonSeller 연동: 401 passport 시 즉시 차단, cooldown 후 probe 복구."""
+
+import pytest
+
+from sellers.poizon import PoizonSeller
+from utils.circuit_breaker import CircuitBreaker, CircuitOpenError
+from utils.rate_limiter import RateGovernor
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_opens_after_threshold_and_rejects_until_cooldown() -> None:
+    clock = _Clock()
+    breaker = CircuitBreaker("T", failure_threshold=2, cooldown=10, clock=clock)
+    breaker.record_failure("timeout")
+    breaker.before_call()
+    breaker.record_failure("timeout")
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now = 10
+    breaker.before_call()  # half-open: 이 호출이 probe
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    breaker.record_success()
+    assert not breaker.is_open
+
+
+def test_probe_failure_reopens() -> None:
+    clock = _Clock()
+    outcomes: list[bool] = [False, True]
+    breaker: CircuitBreaker
+
+    def probe() -> None:
+        if outcomes.pop(0):
+            breaker.record_success()
+        else:
+            breaker.record_failure("still down")
+
+    breaker = CircuitBreaker("T", cooldown=5, probe=probe, clock=clock)
+    breaker.trip("auth")
+    clock.now = 5
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now = 9
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+    clock.now = 10
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.trips == 1
+
+
+class _Resp:
+    def __init__(self, status_code: int, body: dict) -> None:
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = "Unauthorized" if status_code == 401 else "OK"
+        self.headers: dict = {}
+        self.text = str(body)
+        self._body = body
+
+    def json(self) -> dict:
+        return self._body
+
+
+def test_poizon_passport_401_trips_and_fails_fast(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = PoizonSeller(
+        dutoken="t", cookie="sk=1", shumeiid="s", governor=RateGovernor(sleep=lambda _s: None)
+    )
+    posts: list[str] = []
+
+    def post(url, headers=None, data=None, timeout=None):
+        posts.append(url)
+        return _Resp(401, {"code": 401, "msg": "passport 验证失败"})
+
+    monkeypatch.setattr(p.session, "post", post)
+    assert p.search_product("JI0079")["code"] == 401
+    assert p.breaker.is_open
+    with pytest.raises(CircuitOpenError):
+        p.get_product_info("JI0079")
+    assert len(posts) == 1
@@ -0,0 +1,148 @@
+"""ProductComparator 단위: 네트워크 없이 가짜 셀러로 비교."""
+
+from models.product import ProductInfo, ProductOption
+from utils.comparator import ProductComparator
+
+
+def _info(platform: str, price: int) -> ProductInfo:
+    return ProductInfo(
+        platform=platform,
+        model_no="FN3889-010",
+        title=f"{platform} 상품",
+        image_url="",
+        options=[ProductOption(sku_id="1", size="270", color="ONE COLOR", price=price)],
+    )
+
+
+class _FakeMusinsa:
+    last_api_error = None
+
+    def __init__(self) -> None:
+        self.searches: list[str] = []
+
+    def search_product(self, keyword: str) -> list[ProductInfo]:
+        self.searches.append(keyword)
+        return [_info("Musinsa", 100000)]
+
+
+class _FakePoizon:
+    last_api_error = None
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int | None]] = []
+
+    def get_product_info(self, keyword: str, price_floor: int | None = None) -> ProductInfo:
+        self.calls.append((keyword, price_floor))
+        return _info("Poizon", 130000)
+
+
+def test_prefetched_musinsa_info_skips_search() -> None:
+    musinsa, poizon = _FakeMusinsa(), _FakePoizon()
+    comparator = ProductComparator(musinsa, poizon)
+
+    result = comparator.compare_product("FN3889-010", musinsa_infos=[_info("Musinsa", 90000)])
+
+    assert musinsa.searches == []
+    assert poizon.calls == [("FN3889-010", 90000)]
+    assert result is not None
+    assert result.comparisons[0].price_diff == 40000
+
+
+def test_prefetched_both_platforms_makes_no_requests() -> None:
+    musinsa, poizon = _FakeMusinsa(), _FakePoizon()
+    comparator = ProductComparator(musinsa, poizon)
+
+    result = comparator.compare_product(
+        "FN3889-010", musinsa_infos=[_info("Musinsa", 90000)], poizon_info=_info("Poizon", 80000)
+    )
+
+    assert musinsa.searches == [] and poizon.calls == []
+    assert result is not None and not result.comparisons[0].is_profitable
+
+
+def test_without_prefetch_searches_musinsa() -> None:
+    musinsa, poizon = _FakeMusinsa(), _FakePoizon()
+    ProductComparator(musinsa, poizon).compare_product("FN3889-010")
+    assert musinsa.searches == ["FN3889-010"]
+
+
+def test_refined_keywords_share_platform_lookups() -> None:
+    musinsa, poizon = _FakeMusinsa(), _FakePoizon()
+    comparator = ProductComparator(musinsa, poizon)
+
+    comparator.compare_product("SQ313RPD91_BLK0")
+    comparator.compare_product("SQ313RPD91_NVY0")
+
+    assert musinsa.searches == ["SQ313RPD91"]
+    assert len(poizon.calls) == 1
+    assert comparator.memo.saved_calls("musinsa") == 1
+    assert comparator.memo.saved_calls("poizon") == 1
+
+
+def test_poizon_lookup_shared_across_price_floors_without_early_exit() -> None:
+    musinsa, poizon = _FakeMusinsa(), _FakePoizon()
+    comparator = ProductComparator(musinsa, poizon)
+
+    comparator.compare_product("FN3889-010", musinsa_infos=[_info("Musinsa", 90000)])
+    comparator.compare_product("FN3889-010", musinsa_infos=[_info("Musinsa", 95000)])
+    assert poizon.calls == [("FN3889-010", 90000)]
+
+    poizon.early_exit = True
+    comparator.compare_product("FN3889-010", musinsa_infos=[_info("Musinsa", 95000)])
+    assert poizon.calls[-1] == ("FN3889-010", 95000)
+
+
+def test_musinsa_product_id_keeps_only_that_search_result() -> None:
+    def colourway(product_id: str, price: int) -> ProductInfo:
+        info = _info("Musinsa", price)
+        info.product_url = f"https://www.musinsa.com/products/{product_id}"
+        return info
+
+    class _ColourwayMusinsa(_FakeMusinsa):
+        def __init__(self) -> None:
+            super().__init__()
+            self.details: list[str] = []
+
+        def search_product(self, keyword: str) -> list[ProductInfo]:
+            self.searches.append(keyword)
+            return [colourway("1", 100000), colourway("2", 90000)]
+
+        def get_product_info(self, product_id: str) -> ProductInfo:
+            self.details.append(product_id)
+            return colourway(product_id, 95000)
+
+    musinsa, poizon = _ColourwayMusinsa(), _FakePoizon()
+    comparator = ProductComparator(musinsa, poizon)
+
+    result = comparator.compare_product("FN3889-010", musinsa_product_id="2")
+    assert [c.musinsa_price for c in result.comparisons] == [90000]
+
+    # 검색 결과에 없는 상품은 상세 조회로 비교
+    result = comparator.compare_product("FN3889-010", musinsa_product_id="3")
+    assert musinsa.searches == ["FN3889-010"] and musinsa.details == ["3"]
+    assert [c.musinsa_price for c in result.comparisons] == [95000]
+
+
+def test_flexible_match_uses_converted_and_eu_sizes_in_poizon_order() -> None:
+    musinsa_info = ProductInfo(
+        platform="Musinsa", model_no="X", title="t", image_url="",
+        options=[
+            ProductOption(sku_id="m1", size="95", color="BLK0_BLACK", price=50000),
+            ProductOption(sku_id="m2", size="100", color="NAVY", price=50000),
+        ],
+    )
+    poizon_info = ProductInfo(
+        platform="Poizon", model_no="X", title="t", image_url="",
+        options=[
+            ProductOption(sku_id="p1", size="L", color="WHITE", price=70000),
+            ProductOption(sku_id="p2", size="42", eu_size="L", color="Navy Blue", price=80000),
+            ProductOption(sku_id="p3", size="M", color="Black", price=60000),
+        ],
+    )
+    result = ProductComparator(_FakeMusinsa(), _FakePoizon()).compare_product(
+        "X", musinsa_infos=[musinsa_info], poizon_info=poizon_info
+    )
+    pairs = {(c.size, c.musinsa_price, c.poizon_price) for c in result.comparisons}
+    assert ("95", 50000, 60000) in pairs  # 95 → M
+    assert ("100", 50000, 80000) in pairs  # 100 → L (EU 사이즈), 색상이 다른 p1은 건너뜀
+    assert any(c.poizon_price == 70000 and c.musinsa_price == 0 for c in result.comparisons)  # 남은 Poizon 옵션
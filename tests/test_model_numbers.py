@@ -0,0 +1,48 @@
+"""utils.model_numbers: 브랜드별 모델 번호 추출."""
+
+import pytest
+
+from utils.constants import BrandEnum
+from utils.model_numbers import brand_for_name, extract_model_number, search_keyword
+
+
+@pytest.mark.parametrize(
+    ("name", "brand", "model_no"),
+    [
+        ("클럽 프렌치 테리 크루 M - 블랙:화이트 / FN3889-010", BrandEnum.NIKE, "FN3889-010"),
+        ("나이키 에어포스 1 '07 DD8959-100 화이트", BrandEnum.NIKE, "DD8959-100"),
+        ("삼바 OG 클라우드 화이트 / B75806", BrandEnum.ADIDAS, "B75806"),
+        ("여성 트레이닝 자켓 SQ313RPD91_BLK0", BrandEnum.DESCENTE, "SQ313RPD91_BLK0"),
+        ("눕시 온볼 자켓 NJ3NP55A", BrandEnum.NORTHFACE, "NJ3NP55A"),
+        ("XT-6 L47452900", BrandEnum.SALOMON, "L47452900"),
+        ("스피드캣 OG 398846-01", BrandEnum.PUMA, "398846-01"),
+        ("9060 레인 클라우드 / U9060MUS", BrandEnum.NEWBALANCE, "U9060MUS"),
+    ],
+)
+def test_brand_patterns_are_high_confidence(name: str, brand: BrandEnum, model_no: str) -> None:
+    match = extract_model_number(name, brand)
+    assert match is not None
+    assert match.model_no == model_no
+    assert match.confidence >= 0.85
+
+
+def test_name_tail_without_brand_pattern_is_low_confidence() -> None:
+    match = extract_model_number("반팔 티셔츠 / ABC-12", BrandEnum.NIKE)
+    assert match is not None and match.model_no == "ABC-12"
+    assert match.confidence < 0.85
+    assert extract_model_number("반팔 티셔츠", BrandEnum.NIKE) is None
+
+
+def test_loose_pattern_outside_name_tail_is_low_confidence() -> None:
+    # 협업명 속 GX1234는 아디다스 품번처럼 보여도 끝 토큰이 아니면 인정하지 않음
+    match = extract_model_number("GX1234 콜라보 삼바 / 스페셜 에디션", BrandEnum.ADIDAS)
+    assert match is not None and match.model_no == "스페셜 에디션"
+    assert match.confidence < 0.85
+    assert extract_model_number("삼바 GX1234 컬러", BrandEnum.ADIDAS) is None
+
+
+def test_brand_for_name_and_search_keyword() -> None:
+    assert brand_for_name("노스페이스(The North Face)") is BrandEnum.NORTHFACE
+    assert brand_for_name("구찌") is None
+    assert search_keyword("SQ313RPD91_BLK0") == "SQ313RPD91"
+    assert search_keyword("AB_1") == "AB_1"
@@ -0,0 +1,336 @@
+"""MusinsaSeller 단위: 네트워크 없이 검색 매칭·캐시."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+from sellers.musinsa import MusinsaRankingItem, MusinsaRankingType, MusinsaSeller
+from utils.cache import SqliteCache
+from utils.constants import BrandEnum
+from utils.matching import BrandMatcher
+from utils.rate_limiter import RateGovernor
+
+
+def _make_seller(**kwargs) -> MusinsaSeller:
+    defaults: dict = {"governor": RateGovernor(sleep=lambda _s: None)}
+    defaults.update(kwargs)
+    return MusinsaSeller(**defaults)
+
+
+def test_search_miss_is_cached_as_not_found(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    m = _make_seller(cache=SqliteCache(tmp_path / "musinsa.sqlite3"))
+    calls: list[str] = []
+
+    def search(keyword: str, page: int = 1) -> list[dict]:
+        calls.append(keyword)
+        return [{"goodsNo": 1, "goodsName": "다른 상품 / ZZ9999"}]
+
+    monkeypatch.setattr(m, "_call_search_api", search)
+    monkeypatch.setattr(m, "_fetch_product_base_info", lambda pid: {"style_no": "ZZ9999"})
+    assert m.search_product("FN3889-010") == []
+    assert m.search_product("FN3889-010") == []
+    assert calls == ["FN3889-010"]
+    assert m.cache_stats["not_found_hits"] == 1
+
+
+def test_search_error_is_not_cached(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    m = _make_seller(cache=SqliteCache(tmp_path / "musinsa.sqlite3"))
+    calls: list[str] = []
+
+    def search(keyword: str, page: int = 1) -> list[dict]:
+        calls.append(keyword)
+        m.last_api_error = "musinsa search api failed: 503"
+        return []
+
+    monkeypatch.setattr(m, "_call_search_api", search)
+    assert m.search_product("FN3889-010") == []
+    assert m.search_product("FN3889-010") == []
+    assert calls == ["FN3889-010", "FN3889-010"]
+
+
+def test_base_info_reads_next_data_from_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(base_info_source="html")
+    meta = {
+        "data": {
+            "goodsNm": "테스트 신발",
+            "styleNo": "JI0079",
+            "goodsImages": [{"imageUrl": "//image.msscdn.net/a.jpg"}],
+            "goodsPrice": {"couponPrice": None, "salePrice": 89000, "normalPrice": 99000},
+        }
+    }
+    body = (
+        '<html><script id="__NEXT_DATA__" type="application/json">'
+        + json.dumps({"props": {"pageProps": {"meta": meta}}}, ensure_ascii=False)
+        + "</script>"
+        + "<footer></footer>" * 500
+    ).encode()
+    pulled: list[int] = []
+
+    class _Resp:
+        encoding = "utf-8"
+        closed = False
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int):
+            for i in range(0, len(body), 256):
+                pulled.append(i)
+                yield body[i:i + 256]
+
+        def close(self) -> None:
+            self.closed = True
+
+    resp = _Resp()
+    monkeypatch.setattr(m, "_request", lambda method, url, **kwargs: resp)
+    info = m._fetch_product_base_info("123")
+    assert info == {
+        "title": "테스트 신발",
+        "style_no": "JI0079",
+        "image_url": "https://image.msscdn.net/a.jpg",
+        "price": 89000,
+    }
+    assert resp.closed
+    assert m.page_stats["bytes_read"] < len(body) / 2
+    assert m.page_stats["full_parses"] == 0
+
+
+def test_base_info_api_path_falls_back_to_html(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(base_info_source="api")
+    payloads = {
+        "1": {"data": {"goodsNm": "테스트 신발", "styleNo": "JI0079", "goodsImages": [],
+                       "goodsPrice": {"salePrice": 89000, "normalPrice": 99000}}},
+        "2": {"data": {"goodsNm": "스타일 번호 없음", "styleNo": ""}},
+    }
+    urls: list[str] = []
+
+    class _Resp:
+        def __init__(self, payload: dict) -> None:
+            self.payload = payload
+            self.content = json.dumps(payload).encode()
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def json(self) -> dict:
+            return self.payload
+
+    def request(method: str, url: str, **kwargs) -> _Resp:
+        urls.append(url)
+        return _Resp(payloads[url.rsplit("/", 1)[-1]])
+
+    monkeypatch.setattr(m, "_request", request)
+    monkeypatch.setattr(m, "_fetch_product_base_info_html", lambda pid: {"title": "html", "style_no": "X"})
+
+    assert m._fetch_product_base_info("1") == {
+        "title": "테스트 신발", "style_no": "JI0079", "image_url": "", "price": 89000,
+    }
+    assert m._fetch_product_base_info("2") == {"title": "html", "style_no": "X"}
+    assert all(url.startswith("https://goods-detail.musinsa.com/") for url in urls)
+    assert m.page_stats["json_infos"] == 1
+    assert m.page_stats["json_fallbacks"] == 1
+    assert m.last_api_error is None
+
+
+def test_search_verifies_candidates_once_and_reuses_base_info(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(detail_workers=3)
+    hits = [{"goodsNo": n, "goodsName": f"상품 {n}"} for n in (1, 2, 3, 4)]
+    style_nos = {"1": "AA0000", "2": "FN3889-010", "3": "FN3889-010"}
+    base_calls: list[str] = []
+    detail_calls: list[str] = []
+    first_done = threading.Event()
+
+    def base_info_html(pid: str) -> dict:
+        base_calls.append(pid)
+        if pid == "2":
+            first_done.wait(5)  # 3번 후보가 먼저 끝나도 결과는 검색 순서
+        if pid == "3":
+            first_done.set()
+        return {"title": f"상품 {pid}", "style_no": style_nos[pid]}
+
+    def get_info(pid: str) -> str:
+        detail_calls.append(pid)
+        return m._fetch_product_base_info(pid)["style_no"] + f"#{pid}"
+
+    monkeypatch.setattr(m, "base_info_source", "html")
+    monkeypatch.setattr(m, "_call_search_api", lambda keyword, page=1: hits)
+    monkeypatch.setattr(m, "_fetch_product_base_info_html", base_info_html)
+    monkeypatch.setattr(m, "get_product_info", get_info)
+
+    assert m.search_product("FN3889-010") == ["FN3889-010#2", "FN3889-010#3"]
+    assert "4" not in base_calls  # 상위 3개만 확인
+    assert base_calls.count("2") == 1 and base_calls.count("3") == 1  # 확인과 상세 조회가 한 번의 요청을 공유
+    assert sorted(detail_calls) == ["2", "3"]
+    assert m.cache_stats["base_info_hits"] == 2
+    m.close()
+
+
+def test_detail_fetch_is_concurrent_ordered_and_isolates_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(detail_workers=4)
+    barrier = threading.Barrier(4, timeout=5)
+
+    def get_info(pid: str):
+        barrier.wait()  # 4개가 동시에 진행 중이어야 통과
+        if pid == "2":
+            raise RuntimeError("boom")
+        return None if pid == "3" else pid
+
+    monkeypatch.setattr(m, "get_product_info", get_info)
+    assert m.get_product_infos(["4", "1", "2", "3"]) == ["4", "1"]
+    m.close()
+
+
+def test_iter_brand_products_streams_across_pages(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(detail_workers=1)
+    pages = {1: [{"goodsNo": 1}, {"goodsNo": 2}], 2: [], 3: [{"goodsNo": 3}]}
+    monkeypatch.setattr(m, "_call_search_api", lambda keyword, page=1: pages[page])
+    monkeypatch.setattr(m, "get_product_info", lambda pid: None if pid == "2" else f"info{pid}")
+
+    stream = m.iter_brand_products(BrandEnum.NIKE, [1, 2, 3])
+    assert next(stream) == "info1"
+    assert list(stream) == ["info3"]
+
+
+_OPTIONS = {
+    "data": {
+        "basic": [
+            {"name": "컬러", "optionValues": [{"no": 11, "name": "BLACK"}]},
+            {"name": "사이즈", "optionValues": [{"no": 21, "name": "260"}, {"no": 22, "name": "270"}]},
+        ],
+        "optionItems": [
+            {"no": 101, "optionValueNos": [11, 21], "price": 0},
+            {"no": 102, "optionValueNos": [11, 22], "price": 2000},
+        ],
+    }
+}
+
+
+def test_option_structure_is_cached_and_only_inventory_refreshed(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    m = _make_seller(cache=SqliteCache(tmp_path / "musinsa.sqlite3"))
+    option_calls: list[str] = []
+    inventory = {"data": [{"productVariantId": 101, "outOfStock": False, "remainQuantity": 3},
+                          {"productVariantId": 102, "outOfStock": True}]}
+
+    def fetch_options(pid: str) -> dict:
+        option_calls.append(pid)
+        return _OPTIONS
+
+    monkeypatch.setattr(m, "_fetch_product_base_info", lambda pid: {
+        "style_no": "JI0079", "title": "테스트 신발", "image_url": "https://a.jpg", "price": 89000,
+    })
+    monkeypatch.setattr(m, "_fetch_options", fetch_options)
+    monkeypatch.setattr(m, "_fetch_inventory", lambda pid, value_nos: inventory)
+
+    first = m.get_product_info("1")
+    inventory["data"][1]["outOfStock"] = False
+    second = m.get_product_info("1")
+
+    assert option_calls == ["1"]
+    assert m.cache_stats["option_hits"] == 1
+    assert [(o.sku_id, o.size, o.color, o.price) for o in second.options] == [
+        ("101", "260", "BLACK", 89000),
+        ("102", "270", "BLACK", 91000),
+    ]
+    assert [o.stock_status for o in first.options] == ["IN_STOCK", "OUT_OF_STOCK"]
+    assert [o.stock_status for o in second.options] == ["IN_STOCK", "IN_STOCK"]
+    assert second.options[0].stock_quantity == 3
+
+    # 재고에 모르는 variant가 나오면 옵션 구조를 다시 받음
+    inventory["data"].append({"productVariantId": 103, "outOfStock": False})
+    m.get_product_info("1")
+    assert option_calls == ["1", "1"]
+
+
+def test_cached_variant_missing_from_inventory_refreshes_options(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    m = _make_seller(cache=SqliteCache(tmp_path / "musinsa.sqlite3"))
+    options = {"data": {**_OPTIONS["data"], "optionItems": list(_OPTIONS["data"]["optionItems"])}}
+    inventory = {"data": [{"productVariantId": 101, "outOfStock": False},
+                          {"productVariantId": 102, "outOfStock": False}]}
+    option_calls: list[str] = []
+
+    def fetch_options(pid: str) -> dict:
+        option_calls.append(pid)
+        return options
+
+    monkeypatch.setattr(m, "_fetch_product_base_info", lambda pid: {
+        "style_no": "JI0079", "title": "테스트 신발", "image_url": "https://a.jpg", "price": 89000,
+    })
+    monkeypatch.setattr(m, "_fetch_options", fetch_options)
+    monkeypatch.setattr(m, "_fetch_inventory", lambda pid, value_nos: inventory)
+    m.get_product_info("1")
+
+    # 270(102) 사이즈 판매 종료: 옵션과 재고 응답 모두에서 빠짐 (재확인 주기 경과)
+    options["data"]["optionItems"] = options["data"]["optionItems"][:1]
+    inventory["data"] = inventory["data"][:1]
+    m.option_unlisted_ttl = -1
+    info = m.get_product_info("1")
+
+    assert option_calls == ["1", "1"]
+    assert [o.sku_id for o in info.options] == ["101"]
+    assert m.cache_stats["option_refreshes"] == 1
+
+
+def test_inventory_omitting_variant_keeps_cached_options_within_ttl(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    m = _make_seller(cache=SqliteCache(tmp_path / "musinsa.sqlite3"))
+    option_calls: list[str] = []
+
+    def fetch_options(pid: str) -> dict:
+        option_calls.append(pid)
+        return _OPTIONS
+
+    monkeypatch.setattr(m, "_fetch_product_base_info", lambda pid: {
+        "style_no": "JI0079", "title": "테스트 신발", "image_url": "https://a.jpg", "price": 89000,
+    })
+    monkeypatch.setattr(m, "_fetch_options", fetch_options)
+    # 재고 API가 102 행을 주지 않는 상품: 캐시된 옵션을 그대로 쓰고 재고 행이 없는 옵션은 기존처럼 구매 가능
+    monkeypatch.setattr(
+        m, "_fetch_inventory", lambda pid, value_nos: {"data": [{"productVariantId": 101, "outOfStock": True}]}
+    )
+    m.get_product_info("1")
+    info = m.get_product_info("1")
+    m.get_product_info("1")
+
+    assert option_calls == ["1"]
+    assert m.cache_stats["option_hits"] == 2 and m.cache_stats["option_refreshes"] == 0
+    assert [(o.sku_id, o.stock_status) for o in info.options] == [("101", "OUT_OF_STOCK"), ("102", "IN_STOCK")]
+
+
+def test_brand_matcher_matches_containment_both_ways() -> None:
+    matcher = BrandMatcher(["나이키", "New Balance", "Adidas"])
+    assert matcher.matches("나이키(Nike)")
+    assert matcher.matches("뉴발란스 NEW BALANCE")
+    assert matcher.matches("adi")  # 브랜드명이 대상에 포함
+    assert not matcher.matches("푸마")
+    assert not matcher.matches("")
+    assert not matcher.matches("(주)")
+
+
+def test_iter_rankings_fetches_shards_concurrently_and_dedupes(monkeypatch: pytest.MonkeyPatch) -> None:
+    m = _make_seller(detail_workers=4)
+    barrier = threading.Barrier(4, timeout=5)
+    calls: list[tuple[str, str]] = []
+
+    def fetch(r_type: MusinsaRankingType, brand_names=None, category_code="000", brand_matcher=None):
+        calls.append((r_type.name, category_code))
+        barrier.wait()  # 4개 조합이 동시에 진행 중이어야 통과
+        ids = {"000": ["1", "2"], "103": ["2", "3"]}[category_code]
+        return [
+            MusinsaRankingItem(product_id=pid, brand_name="나이키", product_name=pid, price=0, product_url="")
+            for pid in ids
+        ]
+
+    monkeypatch.setattr(m, "fetch_ranking", fetch)
+    items = list(m.iter_rankings(
+        [MusinsaRankingType.NEW, MusinsaRankingType.ALL], category_codes=["000", "103"], brand_names=["나이키"]
+    ))
+    assert sorted(item.product_id for item in items) == ["1", "2", "3"]
+    assert len(calls) == 4
+    m.close()
@@ -0,0 +1,50 @@
+"""__NEXT_DATA__ 스트리밍 추출 단위."""
+
+import json
+
+from utils.next_data import NEXT_DATA_START, find_json_subtree, read_next_data
+
+_PAYLOAD = {
+    "props": {
+        "pageProps": {
+            "state": {"meta": {"data": {"other": 1}}},
+            "meta": {"data": {"goodsNo": 1, "goodsNm": "상품 </b> \"이름\"", "styleNo": "JI0079"}},
+        }
+    },
+    "page": "/products/[id]",
+}
+_HTML = (
+    "<html><head><title>무신사</title></head><body>"
+    + "<div>본문</div>" * 50
+    + NEXT_DATA_START
+    + json.dumps(_PAYLOAD, ensure_ascii=False).replace("</", "<\\/")
+    + "</script><script>trailing()</script>"
+    + "<footer>끝</footer>" * 1000
+    + "</body></html>"
+).encode()
+
+
+def _chunks(data: bytes, size: int, consumed: list[int]):
+    for i in range(0, len(data), size):
+        consumed.append(i)
+        yield data[i:i + size]
+
+
+def test_read_next_data_stops_after_script_and_handles_split_chunks() -> None:
+    for size in (1, 7, 64, 4096):
+        consumed: list[int] = []
+        text, bytes_read = read_next_data(_chunks(_HTML, size, consumed), "utf-8")
+        assert json.loads(text) == _PAYLOAD
+        assert bytes_read < len(_HTML) - 10000
+        assert consumed[-1] < len(_HTML) - 10000
+
+
+def test_read_next_data_without_marker() -> None:
+    assert read_next_data([b"<html>", b"no data</html>"]) == (None, 20)
+
+
+def test_find_json_subtree_skips_decoy_keys() -> None:
+    text = json.dumps(_PAYLOAD, ensure_ascii=False)
+    meta = find_json_subtree(text, ("props", "pageProps", "meta"), accept=lambda v: "goodsNm" in v["data"])
+    assert meta == _PAYLOAD["props"]["pageProps"]["meta"]
+    assert find_json_subtree(text, ("props", "missing", "meta")) is None
@@ -0,0 +1,87 @@
+"""PoizonCatalog 단위: 브랜드 크롤링 페이징과 로컬 품번 매칭."""
+
+import threading
+from pathlib import Path
+
+from sellers.poizon import PoizonSeller
+from sellers.poizon_catalog import PoizonCatalog
+
+
+def _page(items: list[tuple[str, int]]) -> dict:
+    return {
+        "code": 200,
+        "data": {
+            "merchantSpuDtoList": [
+                {"articleNumber": a, "globalSpuId": g, "title": f"T{g}", "logoUrl": "logo"} for a, g in items
+            ]
+        },
+    }
+
+
+def test_key_set_is_built_once_under_concurrent_lookups(tmp_path: Path) -> None:
+    products = _page([("FN3889-010", 1), ("JI0079", 2)])["data"]["merchantSpuDtoList"]
+    PoizonCatalog(tmp_path / "catalog.sqlite3").add(products)
+    catalog = PoizonCatalog(tmp_path / "catalog.sqlite3")
+    statements: list[str] = []
+    catalog._connect().set_trace_callback(statements.append)
+    barrier = threading.Barrier(8, timeout=5)
+    results: list[dict | None] = []
+
+    def lookup() -> None:
+        barrier.wait()
+        results.append(catalog.lookup("FN3889-010"))
+
+    threads = [threading.Thread(target=lookup) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(results) == 8 and all(r and r["globalSpuId"] == 1 for r in results)
+    assert sum(1 for stmt in statements if stmt.startswith("SELECT article_key")) == 1
+
+
+def test_crawl_pages_until_short_page(tmp_path: Path) -> None:
+    catalog = PoizonCatalog(tmp_path / "catalog.sqlite3")
+    pages = {1: _page([("FN3889-010", 1), ("JI0079", 2)]), 2: _page([("DD1391-100", 3)])}
+    seen: list[tuple[str, int, int]] = []
+
+    def search(keyword: str, page: int, page_size: int) -> dict:
+        seen.append((keyword, page, page_size))
+        return pages[page]
+
+    assert catalog.crawl(search, "나이키", page_size=2) == 3
+    assert seen == [("나이키", 1, 2), ("나이키", 2, 2)]
+    assert len(catalog) == 3
+    assert "fn3889 010" in catalog
+    assert catalog.lookup("FN3889-010") == {
+        "globalSpuId": 1, "articleNumber": "FN3889-010", "title": "T1", "logoUrl": "logo"
+    }
+    assert catalog.lookup("XX0000") is None
+
+    # 다시 열어도 유지
+    catalog.close()
+    assert len(PoizonCatalog(tmp_path / "catalog.sqlite3")) == 3
+
+
+def test_missing_catalog_file_is_not_created(tmp_path: Path) -> None:
+    catalog = PoizonCatalog(tmp_path / "catalog.sqlite3")
+    assert catalog.lookup("JI0079") is None
+    assert not catalog.path.exists()
+
+
+def test_resolve_product_uses_catalog_before_search(tmp_path: Path) -> None:
+    catalog = PoizonCatalog(tmp_path / "catalog.sqlite3", authoritative=True)
+    catalog.add(_page([("JI0079", 111)])["data"]["merchantSpuDtoList"])
+    p = PoizonSeller(dutoken="t", cookie="sk=1", shumeiid="s", catalog=catalog)
+    searched: list[str] = []
+    p.search_product = lambda keyword, *a, **k: searched.append(keyword) or {"code": 200, "data": {}}
+
+    assert p.resolve_product("ji-0079")["globalSpuId"] == 111
+    assert p.resolve_product("XX0000") is None
+    assert searched == []
+    assert (p.cache_stats["catalog_hits"], p.cache_stats["catalog_rejects"]) == (1, 1)
+
+    catalog.authoritative = False
+    assert p.resolve_product("XX0000") is None
+    assert searched == ["XX0000"]
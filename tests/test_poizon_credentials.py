@@ -0,0 +1,94 @@
+"""PoizonCredentialPool 단위 + PoizonSeller 연동: 계정 분산, 만료 계정 제외."""
+
+import pytest
+
+import config
+from sellers.poizon import PoizonSeller
+from sellers.poizon_credentials import (
+    PoizonCredential,
+    PoizonCredentialPool,
+    load_credentials_from_env,
+)
+from utils.circuit_breaker import CircuitOpenError
+from utils.rate_limiter import RateGovernor
+
+
+def _creds(n: int) -> list[PoizonCredential]:
+    return [
+        PoizonCredential(name=f"acc{i}", dutoken=f"tok{i}", cookie=f"sk=sk{i}; a=b", shumeiid=f"s{i}")
+        for i in range(n)
+    ]
+
+
+def test_load_credentials_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(config, "POIZON_DUTOKEN", "t1")
+    monkeypatch.setattr(config, "POIZON_COOKIE", "sk=1")
+    monkeypatch.setattr(config, "POIZON_SHUMEIID", "s1")
+    monkeypatch.setenv("POIZON_DUTOKEN_2", "t2")
+    monkeypatch.setenv("POIZON_COOKIE_2", "sk=2")
+    monkeypatch.delenv("POIZON_DUTOKEN_3", raising=False)
+    creds = load_credentials_from_env()
+    assert [(c.name, c.dutoken, c.sk) for c in creds] == [("primary", "t1", "1"), ("account2", "t2", "2")]
+
+
+def test_pool_picks_least_loaded_and_skips_expired() -> None:
+    pool = PoizonCredentialPool(_creds(2), RateGovernor(sleep=lambda _s: None))
+    a = pool.acquire()
+    b = pool.acquire()
+    assert {a.credential.name, b.credential.name} == {"acc0", "acc1"}
+    pool.release(a)
+    pool.release(b)
+
+    a.breaker.trip("auth")
+    assert pool.healthy_count == 1
+    for _ in range(3):
+        slot = pool.acquire()
+        assert slot is b
+        pool.release(slot)
+
+    b.breaker.trip("auth")
+    with pytest.raises(CircuitOpenError):
+        pool.acquire()
+
+
+class _Resp:
+    def __init__(self, status_code: int, body: dict) -> None:
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.reason = ""
+        self.headers: dict = {}
+        self.text = str(body)
+        self._body = body
+
+    def json(self) -> dict:
+        return self._body
+
+
+def test_seller_routes_around_expired_account(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = PoizonSeller(credentials=_creds(2), governor=RateGovernor(sleep=lambda _s: None))
+    used: list[str] = []
+
+    def post(url, headers=None, data=None, timeout=None):
+        used.append(headers["dutoken"])
+        if headers["dutoken"] == "tok0":
+            return _Resp(401, {"code": 401, "msg": "passport 验证失败"})
+        return _Resp(200, {"code": 200, "data": {}})
+
+    monkeypatch.setattr(p.session, "post", post)
+    results = [p.search_product("JI0079")["code"] for _ in range(4)]
+    # 첫 요청은 만료된 acc0에서 실패한 뒤 acc1로 다시 보내짐
+    assert used[0] == "tok0" and used[1:] == ["tok1"] * 4
+    assert results == [200, 200, 200, 200]
+    assert p.last_api_error is None
+    assert not p.breaker.is_open
+    assert p.credentials.stats()["acc0"]["state"] == "OPEN"
+
+
+def test_body_level_auth_failure_on_last_account_sets_api_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = PoizonSeller(credentials=_creds(1), governor=RateGovernor(sleep=lambda _s: None))
+    monkeypatch.setattr(
+        p.session, "post", lambda *a, **k: _Resp(200, {"code": 401, "msg": "passport 验证失败"})
+    )
+    assert p.search_product("JI0079")["code"] == 401
+    assert p.last_api_error is not None and "auth failure" in p.last_api_error
+    assert p.breaker.is_open
@@ -1,11 +1,17 @@
 """PoizonSeller 단위: 네트워크 없이 서명·헤더."""
 
+import json
+import random
 import re
+from pathlib import Path
 
 import pytest
 
 import config
-from sellers.poizon import PoizonSeller
+from sellers.poizon import PoizonSeller, PriceJoinIndex, SizePriceInfo, SkuIds, SkuSizeInfo
+from sellers.poizon_responses import SaleNowResponse
+from utils.cache import SqliteCache
+from utils.rate_limiter import RateGovernor
 
 
 def _make_seller(**kwargs) -> PoizonSeller:
@@ -87,3 +93,385 @@ def test_referer_override() -> None:
         referer="https://custom.example.com/path",
     )
     assert p.base_headers["referer"] == "https://custom.example.com/path"
+
+
+def test_send_request_uses_pooled_session_with_split_timeout(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = _make_seller(
+        connect_timeout=3, read_timeout=30, governor=RateGovernor(sleep=lambda _s: None)
+    )
+    captured: dict = {}
+
+    class _Resp:
+        ok = True
+        status_code = 200
+        headers: dict = {}
+
+        def json(self) -> dict:
+            return {"code": 200}
+
+    def fake_post(url, headers=None, data=None, timeout=None):
+        captured["url"] = url
+        captured["timeout"] = timeout
+        return _Resp()
+
+    monkeypatch.setattr(p.session, "post", fake_post)
+    assert p.search_product("JI0079") == {"code": 200}
+    assert captured["timeout"] == (3, 30)
+    assert "?sign=" in captured["url"]
+    assert p.session.headers["accept-encoding"] == "gzip, deflate"
+    assert p.governor.stats()["seller.poizon.com"]["requests"] == 1
+
+
+def test_typed_decoder_reads_response_bytes_and_tolerates_nulls(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = _make_seller(governor=RateGovernor(sleep=lambda _s: None))
+    body = json.dumps(
+        {
+            "code": 200,
+            "data": {
+                "articleNumber": "JI0079",
+                "logoUrl": None,
+                "unusedBlob": ["x"] * 100,
+                "skuInfos": [
+                    dict(_SALE_NOW_RES["data"]["skuInfos"][0], extra={"a": 1}),
+                    {"skuId": 2, "propertyDesc": None, "salesVolumeGroups": None},
+                ],
+            },
+        }
+    ).encode()
+
+    class _Resp:
+        ok = True
+        status_code = 200
+        headers: dict = {}
+        content = body
+
+    monkeypatch.setattr(p.session, "post", lambda *a, **k: _Resp())
+    res = p.query_sale_now_info(111)
+    assert isinstance(res, SaleNowResponse)
+    assert "unusedBlob" not in res.data.model_dump()
+    summary = p.extract_price_info(res)
+    assert summary == p.extract_price_info(json.loads(body))
+    assert [(s.skuId, s.size, s.targetPrice) for s in summary.sizeList] == [("1", "250", 90000)]
+
+    _Resp.content = b"<html>gateway error</html>"
+    assert p.query_sale_now_info(111) == SaleNowResponse()
+    assert "decode failed" in p.last_api_error
+
+    # data 모양이 다른 세션 만료 응답도 code/msg는 유지 (서킷 브레이커·계정 풀 판단용)
+    _Resp.content = json.dumps({"code": 401, "msg": "passport expired", "data": "login"}).encode()
+    res = p._decode_response("url", _Resp(), SaleNowResponse)
+    assert (res.code, res.msg) == (401, "passport expired")
+    assert p._is_auth_failure(200, res)
+
+
+def test_connection_stats_start_empty() -> None:
+    p = _make_seller()
+    assert p.connection_stats() == {"requests": 0, "new_connections": 0, "reused_connections": 0}
+
+
+_SEARCH_RES = {
+    "code": 200,
+    "data": {
+        "merchantSpuDtoList": [
+            {"articleNumber": "JI0079", "globalSpuId": 111, "title": "Test Shoe", "logoUrl": "logo"}
+        ]
+    },
+}
+_ANALYTICS_RES = {
+    "code": 200,
+    "data": {"historyTradeRecord": {"tradeRecordDTO": {"tradeRecords": [{"time": "5분전"}]}}}
+}
+_SALE_NOW_RES = {
+    "data": {
+        "articleNumber": "JI0079",
+        "logoUrl": "logo",
+        "skuInfos": [
+            {
+                "productName": "Test Shoe",
+                "skuId": 1,
+                "propertyDesc": "블랙*#*250",
+                "salesVolumeGroups": [
+                    {
+                        "buttonCode": 0,
+                        "salesVolumeInfos": [
+                            {"areaId": "SALE_LOCAL_POIZON_LEAK", "price": {"money": {"amount": "100000"}}},
+                            {"areaId": "CN_LEAK", "price": {"money": {"amount": "90000"}}},
+                        ],
+                    }
+                ],
+            }
+        ],
+    }
+}
+_BIDDING_RES = {
+    "data": [
+        {
+            "globalSpuId": 111,
+            "skuInventoryInfoList": [
+                {
+                    "skuId": 1,
+                    "spuId": 9,
+                    "globalSkuId": 2,
+                    "dwSkuId": 3,
+                    "spuPropNew": "블랙 250",
+                    "skuPropAllSpecification": [{"sizeKey": "KR", "skuProp": "250"}],
+                    "regionSalePvInfoList": [{"name": "색상", "value": "블랙"}],
+                }
+            ],
+        }
+    ]
+}
+
+
+def _decoded(data: dict, decoder=None):
+    # 실제 _send_request처럼 decoder가 있으면 해당 응답 모델로 돌려줌
+    return decoder.model_validate(data) if decoder else data
+
+
+def _fake_send_request(calls: list[str]):
+    def send(url: str, payload: dict, decoder=None):
+        calls.append(url.rsplit("/", 1)[-1])
+        if url.endswith("merchant/search"):
+            return _SEARCH_RES
+        if url.endswith("getMoreFloatingLayer"):
+            return _decoded(_ANALYTICS_RES, decoder)
+        if url.endswith("querySaleNowInfo"):
+            return _decoded(_SALE_NOW_RES, decoder)
+        if url.endswith("batchQueryNewBidding"):
+            return _decoded(_BIDDING_RES, decoder)
+        raise AssertionError(url)
+
+    return send
+
+
+@pytest.mark.parametrize("early_exit", [False, True])
+@pytest.mark.parametrize("concurrent", [False, True])
+def test_get_product_info_stage_modes_give_same_result(
+    monkeypatch: pytest.MonkeyPatch, concurrent: bool, early_exit: bool
+) -> None:
+    p = _make_seller(concurrent_stages=concurrent, early_exit=early_exit)
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+    info = p.get_product_info("JI0079")
+    p.close()
+
+    assert info is not None
+    assert info.model_no == "JI0079"
+    assert len(info.options) == 1
+    opt = info.options[0]
+    assert (opt.size, opt.color, opt.price, opt.is_cheaper_in) == ("250", "블랙", 90000, "CN")
+    assert info.sales_metrics.recent_sales_count == 1
+    assert calls[0] == "search"
+    assert sorted(calls[1:]) == ["batchQueryNewBidding", "getMoreFloatingLayer", "querySaleNowInfo"]
+
+
+def test_query_bidding_info_batch_chunks_and_splits_by_spu(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = _make_seller()
+    sent: list[list[int]] = []
+
+    def send(url: str, payload: dict, decoder=None):
+        ids = payload["globalSpuIds"]
+        sent.append(ids)
+        data = []
+        for gid in ids:
+            item = dict(_BIDDING_RES["data"][0], globalSpuId=gid)
+            data.append(item)
+        return _decoded({"data": data}, decoder)
+
+    monkeypatch.setattr(p, "_send_request", send)
+    result = p.query_bidding_info_batch([111, 222, 111, 333], chunk_size=2)
+    assert sent == [[111, 222], [333]]
+    assert sorted(result) == [111, 222, 333]
+    assert [s.size_kr for s in result[222]] == ["250"]
+
+
+def test_get_product_infos_uses_one_batched_bidding_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    p = _make_seller(concurrent_stages=False)
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+    infos = p.get_product_infos(["JI0079", "JI0079", "XX0000"])
+    assert set(infos) == {"JI0079", "XX0000"}
+    assert infos["JI0079"] is not None and infos["XX0000"] is None
+    assert calls.count("batchQueryNewBidding") == 1
+
+
+def test_spu_cache_hit_skips_search_and_bidding(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache = SqliteCache(tmp_path / "poizon.sqlite3")
+    p = _make_seller(concurrent_stages=False, spu_cache=cache)
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+
+    first = p.get_product_info("JI0079")
+    assert calls == ["search", "getMoreFloatingLayer", "querySaleNowInfo", "batchQueryNewBidding"]
+
+    calls.clear()
+    second = p.get_product_info("JI0079")
+    # analytics는 freshness 정책으로 재사용, 가격(sale-now)만 새로 조회
+    assert calls == ["querySaleNowInfo"]
+    assert second == first
+    assert p.cache_stats["response_hits"] == 1
+
+
+def test_freshness_zero_always_refetches_analytics(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache = SqliteCache(tmp_path / "poizon.sqlite3")
+    p = _make_seller(concurrent_stages=False, spu_cache=cache)
+    p.freshness["getMoreFloatingLayer"] = 0
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+    p.get_product_info("JI0079")
+    calls.clear()
+    p.get_product_info("JI0079")
+    assert calls == ["getMoreFloatingLayer", "querySaleNowInfo"]
+    assert p.cache_stats["response_hits"] == 0
+
+
+@pytest.mark.parametrize(
+    ("price_floor", "sale_now", "expect_exit"),
+    [
+        (None, {"code": 200, "data": {"articleNumber": "JI0079", "skuInfos": []}}, False),
+        (90000, _SALE_NOW_RES, True),
+        (89999, _SALE_NOW_RES, False),
+        (None, _SALE_NOW_RES, False),
+    ],
+)
+def test_early_exit_skips_only_analytics(
+    monkeypatch: pytest.MonkeyPatch, price_floor, sale_now: dict, expect_exit: bool
+) -> None:
+    p = _make_seller(concurrent_stages=False, early_exit=True)
+    calls: list[str] = []
+    fake = _fake_send_request(calls)
+
+    def send(url: str, payload: dict, decoder=None):
+        if url.endswith("querySaleNowInfo"):
+            calls.append("querySaleNowInfo")
+            return _decoded(sale_now, decoder)
+        return fake(url, payload, decoder)
+
+    monkeypatch.setattr(p, "_send_request", send)
+    info = p.get_product_info("JI0079", price_floor=price_floor)
+    baseline = _make_seller(concurrent_stages=False, early_exit=False)
+    monkeypatch.setattr(baseline, "_send_request", send)
+    expected = baseline.get_product_info("JI0079", price_floor=price_floor)
+
+    assert info is not None
+    # 옵션(SKU 사이즈, EU 사이즈, 품절 포함)은 조기 종료 여부와 관계없이 같음
+    assert info.options == expected.options
+    if expect_exit:
+        assert calls[:3] == ["search", "querySaleNowInfo", "batchQueryNewBidding"]
+        assert info.sales_metrics is None
+        assert p.plan_stats == {"early_exits": 1, "skipped_calls": 1}
+    else:
+        assert calls[:4] == ["search", "querySaleNowInfo", "getMoreFloatingLayer", "batchQueryNewBidding"]
+        assert info == expected
+        assert p.plan_stats["early_exits"] == 0
+
+
+def test_spu_cache_invalidated_on_unknown_sku(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    cache = SqliteCache(tmp_path / "poizon.sqlite3")
+    p = _make_seller(concurrent_stages=False, spu_cache=cache)
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+    p.get_product_info("JI0079")
+
+    new_sku = dict(_SALE_NOW_RES["data"]["skuInfos"][0], skuId=99, propertyDesc="블랙*#*260")
+    sale_now = {"data": dict(_SALE_NOW_RES["data"], skuInfos=[*_SALE_NOW_RES["data"]["skuInfos"], new_sku])}
+    fake = _fake_send_request(calls)
+    monkeypatch.setattr(
+        p,
+        "_send_request",
+        lambda url, payload, decoder=None: _decoded(sale_now, decoder)
+        if url.endswith("querySaleNowInfo")
+        else fake(url, payload, decoder),
+    )
+    calls.clear()
+    p.get_product_info("JI0079")
+    assert calls == ["batchQueryNewBidding"]
+    entry = cache.get(PoizonSeller.SPU_CACHE_NAMESPACE, "ji0079")
+    assert "99" in entry["price_sku_ids"]
+
+
+def test_not_found_cache_skips_repeat_search(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "poizon.sqlite3")
+    p = _make_seller(spu_cache=cache)
+    calls: list[str] = []
+    monkeypatch.setattr(p, "_send_request", _fake_send_request(calls))
+
+    assert p.get_product_info("XX0000") is None
+    assert p.get_product_info("XX0000") is None
+    assert calls == ["search"]
+    assert p.cache_stats["not_found_hits"] == 1
+
+
+def test_not_found_cache_ignores_search_errors(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    cache = SqliteCache(tmp_path / "poizon.sqlite3")
+    p = _make_seller(spu_cache=cache)
+    calls: list[str] = []
+
+    def send(url: str, payload: dict, decoder=None) -> dict:
+        calls.append("search")
+        return {"code": 401, "msg": "passport"}
+
+    monkeypatch.setattr(p, "_send_request", send)
+    assert p.get_product_info("XX0000") is None
+    assert p.get_product_info("XX0000") is None
+    assert calls == ["search", "search"]
+
+
+def _legacy_price_match(sku: SkuSizeInfo, price_list: list[SizePriceInfo]) -> SizePriceInfo | None:
+    """인덱스 도입 전 get_product_info의 중첩 루프 (동작 비교 기준)."""
+    price_by_id = {item.skuId: item for item in price_list if item.skuId}
+    for id_key in ["skuId", "globalSkuId", "dwSkuId"]:
+        check_id = getattr(sku.ids, id_key, None)
+        if check_id and check_id in price_by_id:
+            return price_by_id[check_id]
+    s_color = str(sku.color).strip()
+    cands = [str(sku.size_kr).strip(), str(sku.size_eu).strip(), str(sku.size_us).strip(),
+             str(sku.raw_prop).split(" ")[-1].strip()]
+    cands = [c for c in cands if c and c != "N/A"]
+    for p_item in price_list:
+        p_full_str = f"{str(p_item.color).strip()} {str(p_item.size).strip()}"
+        if s_color and s_color not in p_full_str:
+            continue
+        if any(c in re.split(r"[^a-zA-Z0-9.]", p_full_str) for c in cands):
+            return p_item
+    return None
+
+
+def test_price_join_index_matches_legacy_loop() -> None:
+    rnd = random.Random(7)
+    colors = ["", "블랙", "Black", "블랙/화이트", "White", "Navy Blue"]
+    sizes = ["250", "255", "260", "M", "L", "XL", "42", "42.5", "US 9", "FREE", "N/A"]
+    for _ in range(200):
+        price_list = [
+            SizePriceInfo(
+                skuId=str(rnd.randint(1, 60)) if rnd.random() < 0.5 else "",
+                size=rnd.choice(sizes),
+                color=rnd.choice(colors),
+                krPrice=i,
+                cnPrice=0,
+                targetPrice=i,
+                isCheaperIn="KR",
+            )
+            for i in range(rnd.randint(0, 25))
+        ]
+        index = PriceJoinIndex(price_list)
+        for _ in range(20):
+            sku_id = str(rnd.randint(1, 80))
+            sku = SkuSizeInfo(
+                ids=SkuIds(skuId=sku_id, globalSkuId=str(rnd.randint(100, 200)), dwSkuId=""),
+                skuId=sku_id,
+                spuId=1,
+                image_url="",
+                raw_prop=f"{rnd.choice(colors)} {rnd.choice(sizes)}",
+                size_kr=rnd.choice(sizes),
+                size_eu=rnd.choice(sizes),
+                size_us=rnd.choice(sizes),
+                color=rnd.choice(colors),
+            )
+            assert index.match(sku) is _legacy_price_match(sku, price_list)
@@ -0,0 +1,83 @@
+"""RateGovernor / AdaptiveRateLimiter 단위: 가짜 시계로 페이싱·백오프 확인."""
+
+from utils.rate_limiter import AdaptiveRateLimiter, RateGovernor, RatePolicy, parse_retry_after
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+def _limiter(clock: _FakeClock, **kwargs) -> AdaptiveRateLimiter:
+    policy = RatePolicy(**{"rate": 0.5, "min_rate": 0.1, "max_rate": 2.0, **kwargs})
+    return AdaptiveRateLimiter(policy, clock=clock, sleep=clock.sleep)
+
+
+def test_first_request_passes_then_paced_by_rate() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock)
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 2.0
+    assert clock.now == 2.0
+
+
+def test_healthy_responses_speed_up_until_ceiling() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, increase_step=1.0)
+    for _ in range(5):
+        limiter.record(200, 0.1)
+    assert limiter.rate == 2.0
+
+
+def test_throttle_backs_off_and_honors_retry_after() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, rate=1.0)
+    limiter.acquire()
+    limiter.record(429, 0.1, retry_after=5)
+    assert limiter.rate == 0.5
+    assert limiter.acquire() == 5.0
+    limiter.record(None, 0.1)
+    limiter.record(503, 0.1)
+    assert limiter.rate == 0.125
+    limiter.record(500, 0.1)
+    assert limiter.rate == 0.1
+
+
+def test_latency_spike_slows_down() -> None:
+    clock = _FakeClock()
+    limiter = _limiter(clock, rate=1.0, increase_step=0.0)
+    for _ in range(3):
+        limiter.record(200, 0.2)
+    limiter.record(200, 1.0)
+    assert limiter.slowdowns == 1
+    assert limiter.rate == 0.8
+
+
+def test_governor_shares_limiter_per_host() -> None:
+    clock = _FakeClock()
+    governor = RateGovernor(
+        policies={"api.musinsa.com": RatePolicy(rate=1.0, min_rate=0.2, max_rate=4.0)},
+        clock=clock,
+        sleep=clock.sleep,
+    )
+    a = governor.limiter_for("https://api.musinsa.com/api2/dp/v1/plp/goods")
+    b = governor.limiter_for("https://api.musinsa.com/api2/hm/web/v5/pans/ranking")
+    assert a is b
+    assert a.policy.rate == 1.0
+    assert governor.limiter_for("https://www.example.com/") is not a
+    governor.acquire("https://api.musinsa.com/x")
+    assert governor.stats()["api.musinsa.com"]["requests"] == 1
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") is None
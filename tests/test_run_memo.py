@@ -0,0 +1,63 @@
+"""utils.run_memo: 실행 단위 메모와 진행 중 조회 합치기."""
+
+import threading
+
+import pytest
+
+from utils.run_memo import RunMemo
+
+
+def test_memo_reuses_cacheable_results_only() -> None:
+    memo = RunMemo()
+    calls: list[str] = []
+
+    def compute(value: str, cacheable: bool = True):
+        calls.append(value)
+        return value, cacheable
+
+    assert memo.get("musinsa", "SQ313RPD91", lambda: compute("a")) == "a"
+    assert memo.get("musinsa", "SQ313RPD91", lambda: compute("b")) == "a"
+    assert memo.get("poizon", "X", lambda: compute("err", cacheable=False)) == "err"
+    assert memo.get("poizon", "X", lambda: compute("ok")) == "ok"
+    assert calls == ["a", "err", "ok"]
+    assert memo.stats["musinsa"] == {"misses": 1, "hits": 1, "coalesced": 0}
+    assert memo.saved_calls("poizon") == 0
+
+
+def test_concurrent_lookups_coalesce_on_in_flight_future() -> None:
+    memo = RunMemo()
+    started, release = threading.Event(), threading.Event()
+    calls: list[int] = []
+    results: list[str] = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "info", True
+
+    owner = threading.Thread(target=lambda: results.append(memo.get("poizon", "K", slow)))
+    owner.start()
+    started.wait(5)
+    waiter = threading.Thread(target=lambda: results.append(memo.get("poizon", "K", slow)))
+    waiter.start()
+    while memo.stats["poizon"]["coalesced"] == 0:
+        pass
+    release.set()
+    owner.join(5)
+    waiter.join(5)
+
+    assert results == ["info", "info"]
+    assert calls == [1]
+    assert memo.saved_calls("poizon") == 1
+
+
+def test_failed_lookup_is_not_memoised() -> None:
+    memo = RunMemo()
+
+    def boom():
+        raise RuntimeError("circuit open")
+
+    with pytest.raises(RuntimeError):
+        memo.get("poizon", "K", boom)
+    assert memo.get("poizon", "K", lambda: ("ok", True)) == "ok"
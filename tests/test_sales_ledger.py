@@ -0,0 +1,76 @@
+"""SalesLedger 단위: 상대 시각 거래의 중복 제거와 원장 기준 집계."""
+
+import time
+from pathlib import Path
+
+from sellers.poizon import PoizonSeller
+from sellers.poizon_responses import AnalyticsResponse
+from utils.sales_ledger import DAY, SalesLedger
+
+
+def _analytics(times: list[str], observed_at: float) -> AnalyticsResponse:
+    return AnalyticsResponse.model_validate(
+        {
+            "code": 200,
+            "observed_at": observed_at,
+            "data": {"historyTradeRecord": {"tradeRecordDTO": {"tradeRecords": [{"time": t} for t in times]}}},
+        }
+    )
+
+
+def test_record_appends_only_trades_newer_than_ledger(tmp_path: Path) -> None:
+    ledger = SalesLedger(tmp_path / "ledger.sqlite3")
+    now = time.time()
+    assert ledger.record("1", [(now - 300, 60), (now - 7200, 3600)]) == 2
+    # 같은 거래를 더 거친 단위로 다시 받아도 중복 기록하지 않음
+    assert ledger.record("1", [(now - 240, 60), (now - 3600, 3600)]) == 0
+    assert ledger.record("1", [(now - 30, 60), (now - 300, 60)]) == 1
+    assert len(ledger.timestamps("1")) == 3
+    assert len(ledger.timestamps("2")) == 0
+
+
+def test_summary_windows_and_trend(tmp_path: Path) -> None:
+    ledger = SalesLedger(tmp_path / "ledger.sqlite3")
+    now = time.time()
+    trades = [(now - 3600, 60), (now - 2 * DAY, 60), (now - 9 * DAY, 60), (now - 20 * DAY, 60)]
+    ledger.record("1", trades)
+    summary = ledger.summary("1", now=now)
+    assert (summary["sales_24h"], summary["sales_7d"], summary["sales_30d"]) == (1, 2, 4)
+    assert summary["trend"] == 2.0
+    assert summary["velocity_score"] > 0
+
+
+def test_velocity_from_ledger_survives_cached_analytics(tmp_path: Path) -> None:
+    ledger = SalesLedger(tmp_path / "ledger.sqlite3")
+    p = PoizonSeller(dutoken="t", cookie="sk=1", shumeiid="s", sales_ledger=ledger)
+    fetched_at = time.time() - 3600
+    first = p.calculate_sales_velocity(_analytics(["5분전", "2시간전"], fetched_at), spu_id=111)
+    assert first.sales_24h == 2
+
+    # 캐시에서 다시 읽은 같은 응답(observed_at 유지)은 새 거래로 세지 않음
+    again = p.calculate_sales_velocity(_analytics(["5분전", "2시간전"], fetched_at), spu_id=111)
+    assert again.sales_24h == 2
+
+    fresh = p.calculate_sales_velocity(_analytics(["방금", "1시간전", "3시간전"], time.time()), spu_id=111)
+    assert fresh.sales_24h == 3
+    assert fresh.velocity_score >= first.velocity_score
+    assert [d.time_str for d in fresh.details] == ["방금", "1시간전", "3시간전"]
+
+
+def test_steady_trade_rate_keeps_rank_as_ledger_grows(tmp_path: Path, monkeypatch) -> None:
+    ledger = SalesLedger(tmp_path / "ledger.sqlite3")
+    p = PoizonSeller(dutoken="t", cookie="sk=1", shumeiid="s", sales_ledger=ledger)
+    start = time.time()
+    clock = [start]
+    monkeypatch.setattr(time, "time", lambda: clock[0])
+
+    # 2시간마다 한 건씩 꾸준히 팔리는 상품을 매일 조회 (API는 최근 5건만 돌려줌)
+    times = ["30분전", "2시간전", "4시간전", "6시간전", "8시간전"]
+    results = []
+    for day in range(6):
+        clock[0] = start + day * DAY
+        velocity = p.calculate_sales_velocity(_analytics(times, clock[0]), spu_id=111)
+        results.append((velocity.rank, velocity.velocity_score))
+
+    assert len(set(results)) == 1
+    assert velocity.sales_30d == 30
@@ -0,0 +1,51 @@
+"""prefetch 단위: 순서 유지, 버퍼 크기 제한, 예외 전달, 조기 종료."""
+
+import threading
+import time
+
+import pytest
+
+from utils.streaming import prefetch
+
+
+def test_prefetch_preserves_order_and_bounds_buffer() -> None:
+    produced: list[int] = []
+
+    def source():
+        for i in range(10):
+            produced.append(i)
+            yield i
+
+    stream = prefetch(source(), buffer_size=2)
+    assert next(stream) == 0
+    time.sleep(0.2)
+    # 소비한 1개 + 큐 2개 + put 대기 중 1개를 넘어서 앞서가지 않음
+    assert len(produced) <= 4
+    assert list(stream) == list(range(1, 10))
+
+
+def test_prefetch_reraises_producer_error() -> None:
+    def source():
+        yield 1
+        raise ValueError("page failed")
+
+    stream = prefetch(source())
+    assert next(stream) == 1
+    with pytest.raises(ValueError, match="page failed"):
+        next(stream)
+
+
+def test_prefetch_stops_producer_when_consumer_stops() -> None:
+    closed = threading.Event()
+
+    def source():
+        try:
+            for i in range(1000):
+                yield i
+        finally:
+            closed.set()
+
+    stream = prefetch(source(), buffer_size=1)
+    assert next(stream) == 0
+    stream.close()
+    assert closed.wait(2)
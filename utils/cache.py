@@ -0,0 +1,73 @@
+"""
+로컬 SQLite 기반 캐시.
+네임스페이스별 key → JSON 값을 저장 시각과 함께 보관하고, 조회 시 max_age로 만료를 판단합니다.
+여러 스레드에서 하나의 인스턴스를 공유해도 안전합니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+
+class SqliteCache:
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # 실제로 쓰기 전까지는 파일을 만들지 않음
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " namespace TEXT NOT NULL,"
+                " key TEXT NOT NULL,"
+                " value TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " PRIMARY KEY (namespace, key))"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def get(self, namespace: str, key: str, max_age: float | None = None) -> Any | None:
+        """
+        저장된 값을 반환합니다. 없거나 max_age(초)보다 오래됐으면 None.
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT value, stored_at FROM cache WHERE namespace = ? AND key = ?",
+                (namespace, key),
+            ).fetchone()
+        if row is None:
+            return None
+        value, stored_at = row
+        if max_age is not None and time.time() - stored_at > max_age:
+            return None
+        return json.loads(value)
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        payload = json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (namespace, key, value, stored_at) VALUES (?, ?, ?, ?)",
+                (namespace, key, payload, time.time()),
+            )
+            conn.commit()
+
+    def delete(self, namespace: str, key: str) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM cache WHERE namespace = ? AND key = ?", (namespace, key))
+            conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,116 @@
+"""
+서킷 브레이커.
+인증 실패(세션 만료)나 연결 장애가 감지되면 회로를 열어 이후 호출을 네트워크 없이 즉시 실패시키고,
+cooldown이 지나면 가벼운 probe 한 번으로 복구 여부를 확인합니다(half-open).
+"""
+import threading
+import time
+from collections.abc import Callable
+
+
+class CircuitOpenError(RuntimeError):
+    """회로가 열려 있어 요청을 보내지 않고 실패한 경우."""
+
+    def __init__(self, name: str, reason: str | None, retry_in: float) -> None:
+        self.name = name
+        self.reason = reason
+        self.retry_in = retry_in
+        super().__init__(f"{name} circuit open ({reason}); retry in {retry_in:.0f}s")
+
+
+class CircuitBreaker:
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        cooldown: float = 300.0,
+        probe: Callable[[], object] | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            name: 로그/오류 메시지용 이름
+            failure_threshold: 연속 실패 몇 번에 회로를 열지 (trip()은 즉시 열림)
+            cooldown: 열린 뒤 half-open probe까지 대기 시간(초)
+            probe: half-open 시 호출할 가벼운 확인 요청. 결과는 record_*로 반영되어야 함.
+                   None이면 cooldown 이후 첫 실제 호출이 probe 역할을 함
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.probe = probe
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.state = self.CLOSED
+        self.reason: str | None = None
+        self._failures = 0
+        self._opened_at = 0.0
+
+        self.trips = 0
+        self.rejected = 0
+
+    @property
+    def is_open(self) -> bool:
+        return self.state != self.CLOSED
+
+    def before_call(self) -> None:
+        """호출 전에 확인합니다. 회로가 열려 있으면 CircuitOpenError를 던집니다."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            elapsed = self._clock() - self._opened_at
+            if self.state == self.HALF_OPEN or elapsed < self.cooldown:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.reason, max(self.cooldown - elapsed, 0.0))
+            # cooldown 경과: 이 호출만 통과시켜 복구 여부 확인
+            self.state = self.HALF_OPEN
+
+        if self.probe is None:
+            return
+
+        print(f"[Circuit] {self.name}: cooldown 경과, probe 요청으로 복구 확인...")
+        try:
+            self.probe()
+        except Exception as e:
+            self.record_failure(f"probe failed: {e}")
+
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                # probe가 결과를 기록하지 않았으면 실패로 간주
+                self._open("probe gave no result")
+            if self.state != self.CLOSED:
+                self.rejected += 1
+                raise CircuitOpenError(self.name, self.reason, self.cooldown)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state != self.CLOSED:
+                print(f"[Circuit] {self.name}: 복구 확인, 회로 닫힘")
+            self.state = self.CLOSED
+            self.reason = None
+            self._failures = 0
+
+    def record_failure(self, reason: str) -> None:
+        """연결 오류 등 일시적일 수 있는 실패. 연속 failure_threshold회(half-open이면 1회)면 회로를 엽니다."""
+        with self._lock:
+            self._failures += 1
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._open(reason)
+
+    def trip(self, reason: str) -> None:
+        """인증 만료처럼 재시도해도 소용없는 실패. 즉시 회로를 엽니다."""
+        with self._lock:
+            self._open(reason)
+
+    def _open(self, reason: str) -> None:
+        if self.state == self.CLOSED:
+            self.trips += 1
+        if self.state != self.OPEN:
+            print(f"[Circuit] {self.name}: 회로 열림 ({reason}), {self.cooldown:.0f}s 후 재확인")
+        self.state = self.OPEN
+        self.reason = reason
+        self._opened_at = self._clock()
@@ -1,16 +1,20 @@
 import re
 from models.comparison import ProductComparisonResult, SizeComparison
-from models.product import ProductInfo
+from models.product import ProductInfo, ProductOption
 from sellers.musinsa import MusinsaSeller
 from sellers.poizon import PoizonSeller
+from utils.model_numbers import search_keyword as base_model_number
 from utils.normalizer import DataNormalizer
+from utils.run_memo import RunMemo
 from utils.constants import KR_TO_CLOTHING_SIZE_MAP
 
 
 class ProductComparator:
-    def __init__(self, musinsa_seller: MusinsaSeller, poizon_seller: PoizonSeller):
+    def __init__(self, musinsa_seller: MusinsaSeller, poizon_seller: PoizonSeller, memo: RunMemo | None = None):
         self.musinsa = musinsa_seller
         self.poizon = poizon_seller
+        # 정제된 모델 번호별 플랫폼 조회 결과 (실행 단위, 색상 코드만 다른 모델·겹치는 랭킹/페이지 재사용)
+        self.memo = memo or RunMemo()
 
     def _normalize_color(self, color: str) -> str:
         """
@@ -40,32 +44,91 @@ class ProductComparator:
         
         return clean_color
 
-    def compare_product(self, keyword: str, fail_on_api_error: bool = False) -> ProductComparisonResult | None:
+    @staticmethod
+    def _musinsa_price_floor(musinsa_infos: list[ProductInfo] | None) -> int | None:
+        """구매 가능한 무신사 옵션 중 최저가. 이보다 싼 Poizon 가격은 어떤 사이즈에서도 차익이 없음."""
+        prices = [
+            opt.price
+            for info in musinsa_infos or []
+            for opt in info.options
+            if opt.stock_status == "IN_STOCK" and opt.price > 0
+        ]
+        return min(prices) if prices else None
+
+    @staticmethod
+    def _poizon_size_buckets(poizon_map: dict[tuple[str, str], ProductOption]) -> dict[str, dict[str, list[int]]]:
+        """Poizon 옵션 키의 위치(poizon_map 순서)를 정규화 사이즈·EU 사이즈별로 묶습니다."""
+        buckets: dict[str, dict[str, list[int]]] = {"size": {}, "eu_size": {}}
+        for pos, ((p_size, _p_color), p_opt) in enumerate(poizon_map.items()):
+            buckets["size"].setdefault(p_size, []).append(pos)
+            if p_opt.eu_size:
+                buckets["eu_size"].setdefault(p_opt.eu_size, []).append(pos)
+        return buckets
+
+    @staticmethod
+    def _musinsa_product_id(info: ProductInfo) -> str | None:
+        # 상세 조회 상품 URL: https://www.musinsa.com/products/{상품 ID}
+        return info.product_url.rstrip("/").rsplit("/", 1)[-1] if info.product_url else None
+
+    @staticmethod
+    def _fetched(seller: object, result: object) -> tuple[object, bool]:
+        # API 오류가 난 조회 결과("없음" 포함)는 메모하지 않음
+        return result, not getattr(seller, "last_api_error", None)
+
+    def compare_product(
+        self,
+        keyword: str,
+        fail_on_api_error: bool = False,
+        musinsa_infos: list[ProductInfo] | None = None,
+        poizon_info: ProductInfo | None = None,
+        musinsa_product_id: str | None = None,
+    ) -> ProductComparisonResult | None:
         """
         키워드(모델 번호)로 무신사와 Poizon 상품을 검색하고 가격을 비교합니다.
         입력된 키워드가 복합 모델 번호(예: SQ313RPD91_BLK0)인 경우, 
         기본 모델 번호(SQ313RPD91)로 변환하여 검색을 시도합니다.
+        이미 조회한 무신사 상품(musinsa_infos)이나 Poizon 상품(poizon_info)을 넘기면 해당 플랫폼 조회는 생략합니다.
+        musinsa_product_id(랭킹 항목 등 특정 상품에서 출발한 경우)를 주면 무신사 검색 결과 중 그 상품만 비교하고,
+        검색 결과에 없으면 그 상품을 상세 조회합니다 (상세 조회 후 비교한 것과 같은 결과).
         """
-        search_keyword = keyword
-        
-        # 모델 번호 정제 (예: SQ313RPD91_BLK0 -> SQ313RPD91)
-        # 데상트 등 일부 브랜드는 모델 번호 뒤에 색상 코드가 붙음
-        if "_" in keyword:
-            parts = keyword.split("_")
-            # 앞부분이 모델 번호일 가능성이 높음 (단, 너무 짧으면 제외)
-            if len(parts[0]) > 3:
-                search_keyword = parts[0]
-                print(f"[Comparator] Refined keyword: {keyword} -> {search_keyword}")
+        # 모델 번호 정제 (예: SQ313RPD91_BLK0 -> SQ313RPD91, utils.model_numbers)
+        search_keyword = base_model_number(keyword)
+        if search_keyword != keyword:
+            print(f"[Comparator] Refined keyword: {keyword} -> {search_keyword}")
 
         print(f"[Comparator] Comparing for keyword: {search_keyword}")
 
         # 1. Fetch Data
+        # Poizon 회로가 열려 있으면(세션 만료 등) 무신사 조회도 하지 않고 즉시 CircuitOpenError
+        poizon_breaker = getattr(self.poizon, "breaker", None)
+        if poizon_breaker is not None:
+            poizon_breaker.before_call()
         if hasattr(self.musinsa, "last_api_error"):
             self.musinsa.last_api_error = None
         if hasattr(self.poizon, "last_api_error"):
             self.poizon.last_api_error = None
-        musinsa_infos = self.musinsa.search_product(search_keyword)
-        poizon_info = self.poizon.get_product_info(search_keyword)
+        if musinsa_infos is None:
+            musinsa_infos = self.memo.get(
+                "musinsa", search_keyword, lambda: self._fetched(self.musinsa, self.musinsa.search_product(search_keyword))
+            )
+            if musinsa_product_id:
+                musinsa_infos = [
+                    info for info in musinsa_infos or [] if self._musinsa_product_id(info) == musinsa_product_id
+                ]
+                if not musinsa_infos:
+                    product_info = self.musinsa.get_product_info(musinsa_product_id)
+                    musinsa_infos = [product_info] if product_info else []
+        if poizon_info is None:
+            # 조기 종료 모드에서만 결과가 무신사 최저가에 따라 달라지므로 그때만 최저가를 키에 포함
+            price_floor = self._musinsa_price_floor(musinsa_infos)
+            early_exit = getattr(self.poizon, "early_exit", False)
+            poizon_info = self.memo.get(
+                "poizon",
+                (search_keyword, price_floor) if early_exit else search_keyword,
+                lambda: self._fetched(
+                    self.poizon, self.poizon.get_product_info(search_keyword, price_floor=price_floor)
+                ),
+            )
 
         musinsa_api_error = getattr(self.musinsa, "last_api_error", None)
         poizon_api_error = getattr(self.poizon, "last_api_error", None)
@@ -138,6 +201,11 @@ class ProductComparator:
                 merged_keys.remove(key)
 
         # 2차: 유연한 매칭
+        # Poizon 키를 사이즈 토큰(원래 사이즈, EU 사이즈)별 버킷으로 색인하고, 버킷 안에서만 색상을 확인.
+        # 후보는 poizon_map 순서(위치)대로 확인하므로 첫 매칭 결과는 전체를 훑을 때와 같음
+        p_keys = list(poizon_map)
+        size_buckets = self._poizon_size_buckets(poizon_map)
+
         for m_key in list(musinsa_map.keys()):
             if m_key in final_comparisons: continue
             
@@ -145,33 +213,22 @@ class ProductComparator:
             m_opt = musinsa_map[m_key]
             
             best_p_match = None
-            candidates = [k for k in poizon_map.keys() if k not in processed_poizon_keys]
-            
-            for p_key in candidates:
-                p_size, p_color = p_key
-                p_opt_candidate = poizon_map[p_key]
-                
-                # 사이즈 매칭 로직
-                is_size_match = False
-                if m_size == p_size:
-                    is_size_match = True
-                elif m_size in KR_TO_CLOTHING_SIZE_MAP:
-                    converted_size = KR_TO_CLOTHING_SIZE_MAP[m_size]
-                    if converted_size == p_size:
-                        is_size_match = True
-                    elif p_opt_candidate.eu_size and converted_size == p_opt_candidate.eu_size:
-                        is_size_match = True
-                
-                if not is_size_match:
+            # 사이즈 매칭 로직: 같은 사이즈, 또는 KR → 의류 사이즈 변환값이 Poizon 사이즈/EU 사이즈와 같음
+            positions = set(size_buckets["size"].get(m_size, ()))
+            converted_size = KR_TO_CLOTHING_SIZE_MAP.get(m_size)
+            if converted_size is not None:
+                positions.update(size_buckets["size"].get(converted_size, ()))
+                positions.update(size_buckets["eu_size"].get(converted_size, ()))
+
+            for pos in sorted(positions):
+                p_key = p_keys[pos]
+                if p_key in processed_poizon_keys:
                     continue
+                p_color = p_key[1]
 
                 # 색상 매칭 로직
-                is_color_match = False
                 if m_color == p_color or m_color == "onecolor" or p_color == "onecolor" or \
                    m_color in p_color or p_color in m_color:
-                    is_color_match = True
-                
-                if is_color_match:
                     best_p_match = p_key
                     break
             
@@ -191,7 +248,9 @@ class ProductComparator:
 
         # 4. Generate Result List
         comparisons = []
-        sorted_keys = sorted(final_comparisons.keys(), key=lambda k: (k[1], DataNormalizer.size_to_float(k[0])))
+        # 사이즈별 정렬 값은 한 번만 계산
+        size_order = {size: DataNormalizer.size_to_float(size) for size, _color in final_comparisons}
+        sorted_keys = sorted(final_comparisons.keys(), key=lambda k: (k[1], size_order[k[0]]))
 
         for key in sorted_keys:
             size, color_key = key
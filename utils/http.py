@@ -0,0 +1,54 @@
+"""
+HTTP 세션 공용 유틸.
+호스트별 keep-alive 커넥션 풀을 재사용하는 ``requests.Session`` 을 만들고,
+urllib3 풀 카운터로 커넥션 재사용/신규 생성 횟수를 집계합니다.
+"""
+import requests
+from requests.adapters import HTTPAdapter
+
+# requests(urllib3)가 기본으로 풀 수 있는 압축만 명시 (br은 brotli 패키지가 있어야 함)
+DEFAULT_ACCEPT_ENCODING = "gzip, deflate"
+
+
+def create_session(pool_size: int = 4) -> requests.Session:
+    """
+    keep-alive 풀링 세션을 생성합니다.
+
+    Args:
+        pool_size: 호스트당 유지할 최대 커넥션 수
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers["accept-encoding"] = DEFAULT_ACCEPT_ENCODING
+    session.headers["connection"] = "keep-alive"
+    return session
+
+
+def connection_stats(session: requests.Session) -> dict[str, int]:
+    """
+    세션에 마운트된 커넥션 풀의 요청 수 / 신규 커넥션 수 / 재사용 횟수를 반환합니다.
+    """
+    total_requests = 0
+    new_connections = 0
+    seen_adapters: set[int] = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen_adapters:
+            continue
+        seen_adapters.add(id(adapter))
+        pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+        if pools is None:
+            continue
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            total_requests += getattr(pool, "num_requests", 0)
+            new_connections += getattr(pool, "num_connections", 0)
+
+    return {
+        "requests": total_requests,
+        "new_connections": new_connections,
+        "reused_connections": max(total_requests - new_connections, 0),
+    }
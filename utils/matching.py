@@ -14,6 +14,35 @@ def normalize_text(text: str) -> str:
     return re.sub(r"[^a-z0-9가-힣]", "", str(text).lower())
 
 
+class BrandMatcher:
+    """
+    대상 브랜드 목록을 한 번만 정규화해 두고 브랜드명 포함 관계를 판정합니다.
+    - 대상 브랜드가 브랜드명에 포함: 정규화한 대상들을 하나의 정규식 alternation으로 컴파일해 한 번에 탐색
+    - 브랜드명이 대상 브랜드에 포함: 대상 브랜드의 모든 부분 문자열 집합에서 정확 일치 조회
+    같은 브랜드명이 반복되므로 판정 결과도 메모합니다.
+    """
+
+    def __init__(self, brand_names: list[str]) -> None:
+        targets = sorted({t for t in (normalize_text(b) for b in brand_names) if t}, key=len, reverse=True)
+        self._pattern = re.compile("|".join(map(re.escape, targets))) if targets else None
+        self._substrings: set[str] = {
+            t[i:j] for t in targets for i in range(len(t)) for j in range(i + 1, len(t) + 1)
+        }
+        self._memo: dict[str, bool] = {}
+
+    def matches(self, brand_name: str) -> bool:
+        """포함 관계 확인 (예: "나이키" in "나이키(Nike)"). 정규화 후 빈 브랜드명은 매칭하지 않음."""
+        hit = self._memo.get(brand_name)
+        if hit is None:
+            normalized = normalize_text(brand_name)
+            hit = bool(normalized) and (
+                normalized in self._substrings
+                or (self._pattern is not None and self._pattern.search(normalized) is not None)
+            )
+            self._memo[brand_name] = hit
+        return hit
+
+
 def find_best_match(
     candidates: list[dict[str, Any]],
     target_keyword: str,
@@ -0,0 +1,127 @@
+"""
+브랜드별 모델 번호(품번) 패턴 라이브러리.
+상품명·목록 payload에서 모델 번호를 신뢰도와 함께 추출해, 신뢰도가 높으면 상세 페이지 조회 없이 바로 비교합니다.
+패턴은 모듈 로드 시 한 번만 컴파일합니다.
+"""
+import re
+from typing import NamedTuple
+
+from utils.constants import BrandEnum
+from utils.matching import normalize_text
+
+
+class ModelNumberMatch(NamedTuple):
+    model_no: str
+    confidence: float  # 0.0 ~ 1.0
+    source: str  # "brand_pattern" | "name_tail"
+
+
+def _compile(pattern: str) -> re.Pattern:
+    # 앞뒤가 영숫자로 이어지지 않는 독립 토큰만 매칭
+    return re.compile(rf"(?<![A-Za-z0-9])(?:{pattern})(?![A-Za-z0-9])")
+
+
+# 브랜드별 (패턴, 신뢰도, 끝 토큰 전용 여부). 위에 있을수록 우선
+# 끝 토큰 전용: 색상명·협업명 속 토큰(예: GX1234)과 구분되지 않는 느슨한 패턴은 "… / MODEL"의 마지막 토큰일 때만 인정
+BRAND_PATTERNS: dict[BrandEnum, list[tuple[re.Pattern, float, bool]]] = {
+    BrandEnum.NIKE: [
+        (_compile(r"[A-Z]{2}\d{4}-\d{3}"), 0.95, False),  # FN3889-010
+        (_compile(r"\d{6}-\d{3}"), 0.9, False),  # 315122-111
+    ],
+    BrandEnum.ADIDAS: [
+        (_compile(r"(?=[A-Z0-9]{6}(?![A-Za-z0-9]))[A-Z]{1,2}\d{4,5}"), 0.85, True),  # IF8760, H03115
+    ],
+    BrandEnum.DESCENTE: [
+        (_compile(r"[A-Z]{2}\d{3}[A-Z]{3}\d{2}(?:_[A-Z0-9]{3,4})?"), 0.9, False),  # SQ313RPD91_BLK0
+    ],
+    BrandEnum.NORTHFACE: [
+        (_compile(r"N[A-Z]\d[A-Z]{1,2}\d{2}[A-Z]?"), 0.85, False),  # NJ1DP55A, NA5AQ01
+    ],
+    BrandEnum.KOLONSPORT: [
+        (_compile(r"[A-Z]{4,5}\d{5}[A-Z]{0,3}"), 0.8, True),  # JWJJX24611BLK
+    ],
+    BrandEnum.SALOMON: [
+        (_compile(r"L\d{8}"), 0.9, False),  # L47452900
+    ],
+    BrandEnum.PUMA: [
+        (_compile(r"\d{6}-\d{2}"), 0.9, False),  # 393147-01
+    ],
+    BrandEnum.NEWBALANCE: [
+        (_compile(r"[MUWG][A-Z]?\d{3,4}[A-Z]{2,4}\d?"), 0.8, True),  # U9060MUS, M2002RXD
+        (_compile(r"NB[A-Z]{4}\d{3}[A-Z]?"), 0.8, False),  # NBPDES101G
+    ],
+    BrandEnum.FILA: [
+        (_compile(r"\d[A-Z]{2}\d{5}"), 0.8, True),  # 1JM01234
+        (_compile(r"FS\d[A-Z]{3}\d{4}[A-Z]?"), 0.8, False),  # FS1RIA1156X
+    ],
+    BrandEnum.ARCTERYX: [
+        (_compile(r"X\d{9}"), 0.9, False),  # X000006348
+    ],
+}
+
+# "… / MODEL" 형태 상품명의 마지막 토큰 (브랜드 패턴과 맞지 않을 때의 기본 신뢰도)
+NAME_TAIL_CONFIDENCE = 0.5
+
+
+def brand_for_name(brand_name: str) -> BrandEnum | None:
+    """무신사 브랜드명(예: "나이키", "노스페이스(The North Face)")을 BrandEnum으로 변환합니다."""
+    normalized = normalize_text(brand_name)
+    if not normalized:
+        return None
+    for brand in BrandEnum:
+        target = normalize_text(brand.value)
+        if target in normalized or normalized in target:
+            return brand
+    return None
+
+
+def _name_tail(text: str) -> str | None:
+    # 무신사 상품명 패턴 예: '클럽 프렌치 테리 크루 M - 블랙:화이트 / FN3889-010'
+    if "/" in text:
+        candidate = text.split("/")[-1].strip()
+        if len(candidate) > 3:
+            return candidate
+    return None
+
+
+def extract_model_number(text: str, brand: BrandEnum | None = None) -> ModelNumberMatch | None:
+    """
+    상품명(또는 목록 payload 문자열)에서 모델 번호를 추출합니다.
+    - 마지막 "/" 뒤 토큰이 브랜드 패턴과 정확히 맞으면 가장 높은 신뢰도
+    - 상품명 안에서 브랜드 패턴이 발견되면 해당 패턴의 신뢰도 (끝 토큰 전용 패턴 제외)
+    - 그 외 "/" 뒤 토큰은 NAME_TAIL_CONFIDENCE
+    brand가 없으면 "/" 뒤 토큰만 사용합니다.
+    """
+    if not text:
+        return None
+    tail = _name_tail(text)
+    patterns = BRAND_PATTERNS.get(brand, []) if brand is not None else []
+
+    if tail:
+        for pattern, confidence, _tail_only in patterns:
+            if pattern.fullmatch(tail.upper()):
+                return ModelNumberMatch(tail, min(1.0, confidence + 0.05), "brand_pattern")
+
+    for pattern, confidence, tail_only in patterns:
+        if tail_only:
+            continue
+        m = pattern.search(text.upper())
+        if m:
+            return ModelNumberMatch(m.group(0), confidence, "brand_pattern")
+
+    if tail:
+        return ModelNumberMatch(tail, NAME_TAIL_CONFIDENCE, "name_tail")
+    return None
+
+
+def search_keyword(model_no: str) -> str:
+    """
+    비교 검색용 기본 모델 번호.
+    데상트 등 일부 브랜드는 모델 번호 뒤에 색상 코드가 붙음 (예: SQ313RPD91_BLK0 -> SQ313RPD91)
+    """
+    if "_" in model_no:
+        head = model_no.split("_")[0]
+        # 앞부분이 모델 번호일 가능성이 높음 (단, 너무 짧으면 제외)
+        if len(head) > 3:
+            return head
+    return model_no
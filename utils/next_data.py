@@ -0,0 +1,74 @@
+"""
+Next.js 페이지의 __NEXT_DATA__ 스트리밍 추출.
+HTML을 청크 단위로 한 번만 디코딩하면서 __NEXT_DATA__ 스크립트가 닫히는 순간 읽기를 멈추고,
+필요한 하위 객체만 json.JSONDecoder.raw_decode로 디코딩합니다 (전체 페이로드 객체 그래프를 만들지 않음).
+"""
+import codecs
+import json
+import re
+from collections.abc import Callable, Iterable
+from typing import Any
+
+NEXT_DATA_START = '<script id="__NEXT_DATA__" type="application/json">'
+SCRIPT_END = "</script>"
+
+_decoder = json.JSONDecoder()
+
+
+def read_next_data(chunks: Iterable[bytes], encoding: str | None = None) -> tuple[str | None, int]:
+    """
+    HTML 바이트 청크에서 __NEXT_DATA__ JSON 문자열을 꺼냅니다.
+    닫는 </script>를 만나면 남은 청크는 읽지 않습니다.
+
+    Returns:
+        (JSON 문자열 또는 None, 실제로 읽은 바이트 수)
+    """
+    decoder = codecs.getincrementaldecoder(encoding or "utf-8")(errors="replace")
+    bytes_read = 0
+    buf = ""
+    found = False
+    scan_from = 0
+    for chunk in chunks:
+        bytes_read += len(chunk)
+        buf += decoder.decode(chunk)
+        if not found:
+            idx = buf.find(NEXT_DATA_START)
+            if idx == -1:
+                # 시작 마커가 청크 경계에 걸칠 수 있으므로 끝부분만 남김
+                buf = buf[-(len(NEXT_DATA_START) - 1):]
+                continue
+            buf = buf[idx + len(NEXT_DATA_START):]
+            found = True
+        end = buf.find(SCRIPT_END, scan_from)
+        if end != -1:
+            return buf[:end], bytes_read
+        scan_from = max(len(buf) - len(SCRIPT_END) + 1, 0)
+    return None, bytes_read
+
+
+def find_json_subtree(
+    json_text: str,
+    path: tuple[str, ...],
+    accept: Callable[[Any], bool] = lambda value: True,
+) -> Any | None:
+    """
+    path의 키들을 순서대로 텍스트에서 찾아 마지막 키의 값만 디코딩합니다.
+    같은 이름의 키가 다른 위치에 있을 수 있으므로 accept를 통과한 값만 반환하고,
+    찾지 못하면 None (호출 측에서 전체 json.loads로 대체).
+    """
+    pos = 0
+    for key in path[:-1]:
+        m = re.compile(rf'"{re.escape(key)}"\s*:').search(json_text, pos)
+        if not m:
+            return None
+        pos = m.end()
+
+    last = re.compile(rf'"{re.escape(path[-1])}"\s*:\s*')
+    for m in last.finditer(json_text, pos):
+        try:
+            value, _ = _decoder.raw_decode(json_text, m.end())
+        except json.JSONDecodeError:
+            continue
+        if accept(value):
+            return value
+    return None
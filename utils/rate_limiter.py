@@ -0,0 +1,217 @@
+"""
+호스트별 요청 페이싱.
+고정 sleep 대신 토큰 버킷으로 요청 간격을 맞추고, 응답 상태(429/5xx)와
+지연 시간 추이에 따라 허용 속도를 AIMD 방식으로 조절합니다.
+"""
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+import config
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    rate: float  # 시작 속도 (req/s)
+    min_rate: float  # 백오프 하한
+    max_rate: float  # 가속 상한
+    burst: float = 1.0  # 버킷 용량 (연속 허용 요청 수)
+    increase_step: float = 0.05  # 정상 응답마다 증가량 (req/s)
+    backoff_factor: float = 0.5  # 429/5xx/연결 오류 시 곱셈 감소
+    slow_factor: float = 0.8  # 지연 급증 시 곱셈 감소
+    latency_threshold: float = 2.0  # EWMA 대비 몇 배 이상이면 "느려짐"으로 판단
+
+
+class AdaptiveRateLimiter:
+    """단일 호스트용 토큰 버킷. 여러 스레드에서 공유해도 안전합니다."""
+
+    LATENCY_ALPHA = 0.2
+    MIN_LATENCY_SAMPLES = 3
+
+    def __init__(
+        self,
+        policy: RatePolicy,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policy = policy
+        self.rate: float = policy.rate
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens: float = policy.burst
+        self._updated_at: float = clock()
+        self._blocked_until: float = 0.0
+        self._latency_ewma: float | None = None
+        self._latency_samples = 0
+
+        self.requests = 0
+        self.throttled = 0
+        self.slowdowns = 0
+        self.total_wait: float = 0.0
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(now - self._updated_at, 0.0)
+        self._tokens = min(self.policy.burst, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def pending_wait(self) -> float:
+        """지금 acquire()하면 기다려야 할 시간(초). 토큰을 소비하지 않습니다."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            wait = max(-(self._tokens - 1.0) / self.rate, 0.0)
+            return max(wait, self._blocked_until - now)
+
+    def acquire(self) -> float:
+        """토큰 하나를 예약하고 차례가 올 때까지 대기합니다. 대기한 시간(초)을 반환합니다."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1.0
+            wait = 0.0
+            if self._tokens < 0:
+                wait = -self._tokens / self.rate
+            if self._blocked_until > now:
+                wait = max(wait, self._blocked_until - now)
+            self.requests += 1
+            self.total_wait += wait
+
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def record(self, status_code: int | None, latency: float, retry_after: float | None = None) -> None:
+        """
+        응답 결과를 반영해 속도를 조절합니다.
+
+        Args:
+            status_code: HTTP 상태 코드 (연결 오류 등 응답이 없으면 None)
+            latency: 요청 소요 시간(초)
+            retry_after: 서버가 Retry-After로 지정한 대기 시간(초)
+        """
+        p = self.policy
+        with self._lock:
+            if status_code is None or status_code == 429 or status_code >= 500:
+                self.throttled += 1
+                self.rate = max(p.min_rate, self.rate * p.backoff_factor)
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, self._clock() + retry_after)
+                return
+
+            is_slow = (
+                self._latency_ewma is not None
+                and self._latency_samples >= self.MIN_LATENCY_SAMPLES
+                and latency > self._latency_ewma * p.latency_threshold
+            )
+            if self._latency_ewma is None:
+                self._latency_ewma = latency
+            else:
+                self._latency_ewma += self.LATENCY_ALPHA * (latency - self._latency_ewma)
+            self._latency_samples += 1
+
+            if is_slow:
+                self.slowdowns += 1
+                self.rate = max(p.min_rate, self.rate * p.slow_factor)
+            else:
+                self.rate = min(p.max_rate, self.rate + p.increase_step)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "rate": round(self.rate, 3),
+                "requests": self.requests,
+                "throttled": self.throttled,
+                "slowdowns": self.slowdowns,
+                "total_wait": round(self.total_wait, 2),
+            }
+
+
+class RateGovernor:
+    """호스트명 → AdaptiveRateLimiter 레지스트리. 셀러와 실행 스크립트가 하나를 공유합니다."""
+
+    def __init__(
+        self,
+        policies: dict[str, RatePolicy] | None = None,
+        default_policy: RatePolicy | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policies: dict[str, RatePolicy] = policies if policies is not None else default_host_policies()
+        self.default_policy = default_policy or RatePolicy(rate=1.0, min_rate=0.2, max_rate=4.0)
+        self._clock = clock
+        self._sleep = sleep
+        self._limiters: dict[str, AdaptiveRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _host(url_or_host: str) -> str:
+        if "://" not in url_or_host:
+            return url_or_host
+        return urlsplit(url_or_host).hostname or url_or_host
+
+    def limiter_for(self, url_or_host: str) -> AdaptiveRateLimiter:
+        host = self._host(url_or_host)
+        with self._lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                # "host#이름" 키는 같은 호스트 정책을 쓰는 별도 예산 (예: 계정별 한도)
+                policy = self.policies.get(host.split("#", 1)[0], self.default_policy)
+                limiter = AdaptiveRateLimiter(policy, clock=self._clock, sleep=self._sleep)
+                self._limiters[host] = limiter
+            return limiter
+
+    def acquire(self, url: str) -> float:
+        return self.limiter_for(url).acquire()
+
+    def record(self, url: str, status_code: int | None, latency: float, retry_after: float | None = None) -> None:
+        self.limiter_for(url).record(status_code, latency, retry_after)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {host: limiter.stats() for host, limiter in limiters.items()}
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Retry-After 헤더(초 단위)만 해석합니다. HTTP-date 형식은 무시합니다."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        return None
+
+
+def default_host_policies() -> dict[str, RatePolicy]:
+    poizon = RatePolicy(
+        rate=config.RATE_POIZON_RPS,
+        min_rate=config.RATE_POIZON_MIN_RPS,
+        max_rate=config.RATE_POIZON_MAX_RPS,
+    )
+    musinsa = RatePolicy(
+        rate=config.RATE_MUSINSA_RPS,
+        min_rate=config.RATE_MUSINSA_MIN_RPS,
+        max_rate=config.RATE_MUSINSA_MAX_RPS,
+    )
+    return {
+        "seller.poizon.com": poizon,
+        "www.musinsa.com": musinsa,
+        "api.musinsa.com": musinsa,
+        "goods-detail.musinsa.com": musinsa,
+    }
+
+
+_shared_governor: RateGovernor | None = None
+_shared_lock = threading.Lock()
+
+
+def get_governor() -> RateGovernor:
+    """프로세스 전역에서 공유하는 RateGovernor를 반환합니다."""
+    global _shared_governor
+    with _shared_lock:
+        if _shared_governor is None:
+            _shared_governor = RateGovernor()
+        return _shared_governor
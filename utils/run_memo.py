@@ -0,0 +1,61 @@
+"""
+실행 단위 조회 메모.
+같은 실행에서 같은 키(정제된 모델 번호 등)로 다시 조회하면 저장된 결과를 돌려주고,
+다른 스레드가 같은 키를 조회 중이면 새로 요청하지 않고 그 결과(Future)를 기다립니다.
+디스크에 저장하지 않으며 실행이 끝나면 사라집니다.
+"""
+import threading
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from typing import Any
+
+
+class RunMemo:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, Hashable], Future] = {}
+        # 네임스페이스별 {"misses": 실제 조회, "hits": 저장된 결과 사용, "coalesced": 진행 중 조회 대기}
+        self.stats: dict[str, dict[str, int]] = {}
+
+    def _count(self, namespace: str, field: str) -> None:
+        counts = self.stats.setdefault(namespace, {"misses": 0, "hits": 0, "coalesced": 0})
+        counts[field] += 1
+
+    def get(self, namespace: str, key: Hashable, compute: Callable[[], tuple[Any, bool]]) -> Any:
+        """
+        저장된 결과가 있으면 반환하고, 없으면 compute()를 한 번만 실행합니다.
+        compute는 (결과, 저장 여부)를 반환합니다. API 오류 등으로 저장하지 않은 결과나 예외는
+        그때 기다리던 호출에만 전달되고, 이후 호출은 다시 조회합니다.
+        """
+        entry_key = (namespace, key)
+        with self._lock:
+            future = self._entries.get(entry_key)
+            if future is None:
+                future = Future()
+                self._entries[entry_key] = future
+                self._count(namespace, "misses")
+                owner = True
+            else:
+                self._count(namespace, "hits" if future.done() else "coalesced")
+                owner = False
+
+        if not owner:
+            return future.result()
+
+        try:
+            value, cacheable = compute()
+        except BaseException as e:
+            with self._lock:
+                self._entries.pop(entry_key, None)
+            future.set_exception(e)
+            raise
+        if not cacheable:
+            with self._lock:
+                self._entries.pop(entry_key, None)
+        future.set_result(value)
+        return value
+
+    def saved_calls(self, namespace: str) -> int:
+        """저장된 결과 사용 + 진행 중 조회 대기로 생략한 조회 수."""
+        counts = self.stats.get(namespace, {})
+        return counts.get("hits", 0) + counts.get("coalesced", 0)
@@ -0,0 +1,102 @@
+"""
+SPU별 거래 내역 원장 (SQLite).
+API가 주는 "N분전" 같은 상대 시각을 조회 시점 기준 절대 시각으로 바꿔 쌓아 두고,
+판매 속도·기간별 판매 수·추세를 매번 처음부터가 아니라 누적 원장에서 계산합니다.
+"""
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
+# 판매 속도 점수: 거래마다 BASE_POINT / (경과 분 + 5)
+BASE_POINT = 10000
+DAY = 24 * 3600
+
+
+class SalesLedger:
+    def __init__(self, path: Path | str, window_days: float = 30) -> None:
+        """
+        Args:
+            path: SQLite 파일 경로 (실제로 기록할 때 생성)
+            window_days: 점수·집계에 쓰는 최근 기간(일). 이보다 오래된 거래는 기록 시 정리
+        """
+        self.path = Path(path)
+        self.window = window_days * DAY
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS trades ("
+                " spu_id TEXT NOT NULL,"
+                " ts REAL NOT NULL,"
+                " precision REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS trades_spu_ts ON trades (spu_id, ts)")
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def record(self, spu_id: str, trades: list[tuple[float, float]]) -> int:
+        """
+        조회한 거래 목록(절대 시각, 시각 오차 초)을 원장에 더하고 새로 추가된 건수를 반환합니다.
+        이미 기록된 가장 최근 거래보다 오차 범위를 넘어 뒤에 있는 거래만 새 거래로 봅니다
+        (API는 최신 거래부터 일정 개수만 돌려주므로 그보다 앞선 거래는 이미 기록된 것).
+        """
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT MAX(ts) FROM trades WHERE spu_id = ?", (spu_id,)).fetchone()
+            last_ts = row[0] if row and row[0] is not None else float("-inf")
+            new_rows = [
+                (spu_id, ts, precision) for ts, precision in trades if ts - precision > last_ts
+            ]
+            if new_rows:
+                conn.executemany("INSERT INTO trades (spu_id, ts, precision) VALUES (?, ?, ?)", new_rows)
+            conn.execute(
+                "DELETE FROM trades WHERE spu_id = ? AND ts < ?", (spu_id, time.time() - self.window)
+            )
+            conn.commit()
+        return len(new_rows)
+
+    def timestamps(self, spu_id: str, since: float | None = None) -> list[float]:
+        """since(기본: 집계 기간 시작) 이후 거래 시각 목록 (최신순)."""
+        if since is None:
+            since = time.time() - self.window
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT ts FROM trades WHERE spu_id = ? AND ts >= ? ORDER BY ts DESC",
+                (spu_id, since),
+            ).fetchall()
+        return [r[0] for r in rows]
+
+    def summary(
+        self, spu_id: str, now: float | None = None, score_since: float | None = None
+    ) -> dict[str, float | int]:
+        """
+        원장 기준 판매 속도 점수, 기간별(24시간/7일/30일) 판매 수, 추세를 계산합니다.
+        velocity_score는 score_since(기본: 집계 기간 시작) 이후 거래만으로 계산합니다.
+        trend는 최근 7일 판매 수 / 그 이전 7일 판매 수 (이전 7일 판매가 없으면 최근 7일 판매 수).
+        """
+        now = time.time() if now is None else now
+        ages = [now - ts for ts in self.timestamps(spu_id, since=now - self.window)]
+        score_window = self.window if score_since is None else now - score_since
+        last_7d = sum(1 for age in ages if age <= 7 * DAY)
+        prev_7d = sum(1 for age in ages if 7 * DAY < age <= 14 * DAY)
+        return {
+            "velocity_score": round(
+                sum(BASE_POINT / (max(age, 0) / 60 + 5) for age in ages if age <= score_window), 2
+            ),
+            "sales_24h": sum(1 for age in ages if age <= DAY),
+            "sales_7d": last_7d,
+            "sales_30d": sum(1 for age in ages if age <= 30 * DAY),
+            "trend": round(last_7d / prev_7d, 2) if prev_7d else float(last_7d),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
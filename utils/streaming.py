@@ -0,0 +1,65 @@
+"""
+생산/소비 단계 겹치기.
+제너레이터를 백그라운드 스레드에서 미리 돌려 크기가 제한된 큐에 채워 두고,
+소비 측은 큐에서 꺼내 쓰는 동안 생산 측이 다음 항목을 계속 가져오게 합니다.
+"""
+import queue
+import threading
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, error: BaseException) -> None:
+        self.error = error
+
+
+def prefetch(source: Iterable[T], buffer_size: int = 8) -> Iterator[T]:
+    """
+    source를 별도 스레드에서 소비하며 최대 buffer_size개까지 앞서 가져옵니다.
+    생산 측 예외는 소비 측에서 같은 위치에 다시 발생하고,
+    소비 측이 중간에 멈추면(break, 예외, close) 생산 스레드도 다음 항목에서 멈춥니다.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=max(1, buffer_size))
+    stop = threading.Event()
+
+    def put(item: object) -> bool:
+        # 소비 측이 멈췄으면 꽉 찬 큐에서 영원히 기다리지 않도록 주기적으로 확인
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in source:
+                if not put(item):
+                    return
+        except BaseException as e:
+            put(_Failure(e))
+        else:
+            put(_DONE)
+        finally:
+            close = getattr(source, "close", None)
+            if stop.is_set() and close is not None:
+                close()
+
+    worker = threading.Thread(target=produce, name="prefetch", daemon=True)
+    worker.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        stop.set()